@@ -0,0 +1,133 @@
+import math
+import time
+
+
+# ---------------------------
+# Easing
+# ---------------------------
+# Each maps progress 0..1 to an eased 0..1 (ease_out_back overshoots a little)
+def linear(t):
+    return t
+
+
+def ease_out_cubic(t):
+    return 1 - (1 - t) ** 3
+
+
+def ease_in_out_sine(t):
+    return -(math.cos(math.pi * t) - 1) / 2
+
+
+def ease_out_back(t):
+    c = 1.70158
+    return 1 + (c + 1) * (t - 1) ** 3 + c * (t - 1) ** 2
+
+
+def pulse(t):
+    """0 -> 1 -> 0 over one cycle, smooth at both ends (for repeating tweens)."""
+    return math.sin(math.pi * t) ** 2
+
+
+class Tween:
+    """
+    One value moving from `start` to `end` over `duration` seconds from
+    `started_at`, shaped by `easing`. A repeating tween starts over each
+    cycle and never finishes on its own.
+    """
+
+    def __init__(self, start, end, duration, easing, started_at, repeat=False):
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.easing = easing
+        self.started_at = started_at
+        self.repeat = repeat
+        self.rect = None  # where it was last drawn (set by Animator.value)
+        self.read = True  # drawn since the last update
+
+    def progress(self, now):
+        if self.duration <= 0:
+            return 1.0
+        t = (now - self.started_at) / self.duration
+        if self.repeat:
+            return t % 1.0
+        return min(1.0, max(0.0, t))
+
+    def value(self, now):
+        return self.start + (self.end - self.start) * self.easing(self.progress(now))
+
+    def finished(self, now):
+        return not self.repeat and now - self.started_at >= self.duration
+
+
+class Animator:
+    """
+    Time-based tweens for the screens (score count-ups, tile flips, clock
+    pulses), keyed by name. Values follow perf_counter, not frames, so an
+    animation takes as long at 15 FPS as at 60.
+
+    Once per frame, update() moves the clock and drops finished tweens.
+    Drawing code reads value(key, default, rect), and the rect tells
+    dirty_rects() what to repaint, so a frame where only animations moved
+    can use a partial display.update. `active` is False when nothing
+    moves, and the game loop then drops to its idle frame rate. A
+    repeating tween that wasn't drawn during a frame is dropped at the
+    next update(), so a pulse ends when its screen goes away.
+    """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.tweens = {}  # { key: Tween }
+        self.now = clock()
+        self.settled_rects = []  # rects of tweens that finished this frame (drawn at their end value)
+
+    def animate(self, key, start, end, duration, easing=ease_out_cubic, repeat=False):
+        """Start (or restart) the tween `key` from `start` to `end` over `duration` seconds."""
+        self.tweens[key] = Tween(start, end, duration, easing, self.now, repeat)
+
+    def keep(self, key, start, end, duration, easing=ease_out_cubic, repeat=False):
+        """animate() unless `key` is already running (for per-frame calls)."""
+        if key not in self.tweens:
+            self.animate(key, start, end, duration, easing, repeat)
+
+    def stop(self, key):
+        tween = self.tweens.pop(key, None)
+        if tween and tween.rect is not None:
+            self.settled_rects.append(tween.rect)
+
+    def running(self, key):
+        return key in self.tweens
+
+    def value(self, key, default=None, rect=None):
+        """
+        The tween's value at this frame's time, or `default` when `key`
+        isn't animating. `rect` is where the caller draws it.
+        """
+        tween = self.tweens.get(key)
+        if tween is None:
+            return default
+        tween.read = True
+        if rect is not None:
+            tween.rect = rect
+        return tween.value(self.now)
+
+    def update(self, now=None):
+        """Advance to `now` (default: the clock) and drop finished tweens. Call once per frame."""
+        self.now = self.clock() if now is None else now
+        self.settled_rects = []
+        for key, tween in list(self.tweens.items()):
+            if tween.finished(self.now) or (tween.repeat and not tween.read):
+                del self.tweens[key]
+                # Its end state still has to reach the screen once
+                if tween.rect is not None:
+                    self.settled_rects.append(tween.rect)
+            tween.read = False
+        return self.now
+
+    @property
+    def active(self):
+        return bool(self.tweens)
+
+    def dirty_rects(self):
+        """Areas animations touched this frame (for pygame.display.update)."""
+        return [t.rect for t in self.tweens.values() if t.rect is not None] + self.settled_rects
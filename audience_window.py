@@ -0,0 +1,63 @@
+import pygame
+
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture
+except ImportError:  # pygame built without the SDL2 video bindings
+    Window = Renderer = Texture = None
+
+
+class AudienceDisplay:
+    """
+    A second, audience-facing window (e.g. on a projector).
+
+    Screens are drawn with a normal ResponsiveLayout into an offscreen
+    surface and uploaded into a streaming texture, so this class stands in
+    for DisplayManager (screen, current_width, current_height). It only
+    redraws when the content key passed to needs_redraw() changes, so an
+    idle audience view costs nothing per frame.
+    """
+
+    def __init__(self, size=(1280, 720), title="Clynboozle - Audience"):
+        if Window is None:
+            raise RuntimeError("The audience window needs pygame's SDL2 video module")
+        self.window = Window(title, size=size, resizable=True)
+        self.renderer = Renderer(self.window)
+        self.content_key = None
+        self._create_target(size)
+
+    def _create_target(self, size):
+        self.current_width, self.current_height = size
+        self.screen = pygame.Surface(size)
+        self.texture = Texture(self.renderer, size, streaming=True)
+        self.content_key = None
+
+    def owns_event(self, event):
+        return getattr(event, "window", None) is self.window
+
+    def handle_event(self, event):
+        """
+        Handle an event addressed to this window.
+        Returns False when the window was closed.
+        """
+        if event.type == pygame.WINDOWCLOSE:
+            return False
+        if event.type == pygame.WINDOWSIZECHANGED:
+            self._create_target((event.x, event.y))
+        elif event.type == pygame.WINDOWEXPOSED:
+            self.content_key = None
+        return True
+
+    def needs_redraw(self, key):
+        if key == self.content_key:
+            return False
+        self.content_key = key
+        return True
+
+    def present(self):
+        self.texture.update(self.screen)
+        self.renderer.clear()
+        self.texture.draw()
+        self.renderer.present()
+
+    def close(self):
+        self.window.destroy()
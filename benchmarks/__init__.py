@@ -0,0 +1,8 @@
+"""
+Benchmarks and stress harnesses for the game's modules. Run them from
+the repository root through one entry point:
+
+    python -m benchmarks <name> [options]
+
+`python -m benchmarks` on its own lists them.
+"""
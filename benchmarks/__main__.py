@@ -0,0 +1,47 @@
+import importlib
+import os
+import sys
+
+# name -> (module in this package, what it measures)
+BENCHMARKS = {
+    "buzzer": ("buzzer_fairness", "earliest press wins, with and without SDL timestamps"),
+    "remote": ("remote_load", "phone command round trips through the remote server"),
+    "sync": ("sync_broadcast", "bytes and CPU of delta state broadcast vs full state"),
+    "events": ("event_tuning", "win-rate spread with and without random events"),
+    "sampler": ("sampler", "adaptive question draws on a large group"),
+    "modes": ("modes", "a full game in every mode: preload, per-question time, DB calls"),
+    "rooms": ("rooms", "many rooms at once in one process: answer latency, lock errors"),
+    "db": ("db_torture", "many threads writing at once; checks that no write was lost"),
+    "memory": ("question_memory", "memory of preloaded question banks: dicts vs Question objects"),
+    "packs": ("packs", "session start-up time vs question pack size"),
+    "buttons": ("buttons", "frame time of a button grid: rounded rects vs cached skins"),
+    "render": ("render", "frame cost at native resolution vs a scaled fixed base resolution"),
+    "resize": ("resize", "display re-creations and layout rebuilds during a window drag"),
+    "idle": ("idle_frames", "CPU and display traffic of a scoreboard: fixed 60 FPS vs idle frame rate"),
+    "teams": ("team_setup", "setting up teams and rosters per row vs in one transaction"),
+}
+
+
+def usage():
+    lines = ["usage: python -m benchmarks <name> [options]", "", "benchmarks:"]
+    lines += [f"  {name:<14} {about}" for name, (_, about) in BENCHMARKS.items()]
+    lines.append("")
+    lines.append("python -m benchmarks <name> --help lists a benchmark's options.")
+    return "\n".join(lines)
+
+
+def main(argv):
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0
+    name, args = argv[0], argv[1:]
+    if name not in BENCHMARKS:
+        print(f"Unknown benchmark '{name}'\n\n{usage()}", file=sys.stderr)
+        return 2
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # benchmarks draw offscreen
+    module = importlib.import_module(f"benchmarks.{BENCHMARKS[name][0]}")
+    return module.main(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
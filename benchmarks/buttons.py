@@ -0,0 +1,90 @@
+"""
+Button grid frame time: rounded rects drawn for every button every
+frame, against the cached button skins ResponsiveLayout blits.
+"""
+import argparse
+import time
+
+import pygame
+
+from responsive_layout import (BUTTON_RADIUS, BUTTON_TEXT_PADDING, MIN_FIT_SIZE, PRESS_OFFSET, SHADOW_OFFSET,
+                               ResponsiveLayout)
+
+
+class _BenchDisplay:
+    """Stands in for DisplayManager: an offscreen screen of a fixed size."""
+
+    def __init__(self, size):
+        self.current_width, self.current_height = size
+        self.screen = pygame.Surface(size)
+
+
+class _DirectDrawLayout(ResponsiveLayout):
+    """draw_button as it was before ButtonSkins: three rounded rects per button, every frame."""
+
+    def draw_button(self, rect, color, text, text_color, pressed=False, hovered=False):
+        screen = self.display_manager.screen
+        if not pressed:
+            pygame.draw.rect(screen, (0, 0, 0, 100), rect.move(0, SHADOW_OFFSET), border_radius=BUTTON_RADIUS)
+        button_rect = rect.copy()
+        if pressed:
+            button_rect.y += PRESS_OFFSET
+            button_color = self.adjust_color(color, -50)
+        elif hovered:
+            button_color = self.adjust_color(color, 40)
+        else:
+            button_color = color
+        pygame.draw.rect(screen, button_color, button_rect, border_radius=BUTTON_RADIUS)
+        if not pressed:
+            highlight_rect = button_rect.copy()
+            highlight_rect.height = 2
+            pygame.draw.rect(screen, self.adjust_color(button_color, 50), highlight_rect, border_radius=BUTTON_RADIUS)
+        final_text_color = self.adjust_color(text_color, -30) if pressed else text_color
+        text_box = button_rect.inflate(-2 * BUTTON_TEXT_PADDING, -BUTTON_TEXT_PADDING)
+        size, lines = self.text_cache.fit(text, self.base_font_size, text_box.width, text_box.height,
+                                          min_size=min(MIN_FIT_SIZE, self.base_font_size))
+        self.draw_lines(lines, size, final_text_color, text_box)
+        return button_rect
+
+
+def run_button_benchmark(buttons=100, frames=300, size=(1280, 720)):
+    """
+    Draw a grid of `buttons` buttons (10 per row, the mouse moving over
+    them) for `frames` frames, with rounded rects drawn every frame and
+    with cached skins. Text goes through the same TextCache in both, so
+    the difference is the button backgrounds. Returns ms per frame.
+    """
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode(size)
+    results = {}
+    for name, layout_cls in (("direct", _DirectDrawLayout), ("skins", ResponsiveLayout)):
+        layout = layout_cls(_BenchDisplay(size))
+        items = [f"Q{i + 1}" for i in range(buttons)]
+
+        def frame(i):
+            layout.display_manager.screen.fill((255, 255, 255))
+            # Sweep the mouse across the grid so hover and press states show up
+            layout.update_mouse_state((i * 37 % size[0], i * 11 % size[1]), i % 7 == 0)
+            layout.create_grid_buttons(items, 0.02, 0.08, 0.07, (0, 0, 255), spacing_percent=0.01)
+
+        frame(0)  # warm the text (and skin) caches
+        start = time.perf_counter()
+        for i in range(frames):
+            frame(i)
+        results[name] = (time.perf_counter() - start) / frames * 1000
+    pygame.quit()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks buttons",
+                                     description="Frame time of a button grid: rounded rects vs cached button skins.")
+    parser.add_argument("--buttons", type=int, default=100)
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--size", type=int, nargs=2, default=[1280, 720], metavar=("W", "H"))
+    args = parser.parse_args(argv)
+
+    res = run_button_benchmark(args.buttons, args.frames, tuple(args.size))
+    print(f"[BUTTONS] {args.buttons} buttons: direct {res['direct']:.2f} ms/frame, "
+          f"skins {res['skins']:.2f} ms/frame ({res['direct'] / res['skins']:.1f}x faster)")
@@ -0,0 +1,117 @@
+"""
+Buzzer fairness: synthetic KEYDOWN events are fed to a BuzzerArbiter in
+shuffled order, and the earliest press must always win.
+"""
+import argparse
+import random
+import pygame
+
+from buzzer import BuzzerArbiter, POLL_INTERVAL
+
+
+def _press(key, timestamp=None):
+    attrs = {"key": key, "unicode": "", "mod": 0, "scancode": 0}
+    if timestamp is not None:
+        attrs["timestamp"] = timestamp
+    return pygame.event.Event(pygame.KEYDOWN, **attrs)
+
+
+def _play_round(arbiter, presses, timestamps, now, rng):
+    """
+    One buzz round. presses: [(press time ms, key)]. With timestamps the
+    events carry them and are all queued at once, in shuffled order.
+    Without (pygame 2.6 events have none), each press is queued when the
+    fake clock reaches it and capture() runs every POLL_INTERVAL, as in
+    poll_until(), so the arbiter stamps presses at capture time.
+    Returns the winning team_id.
+    """
+    arbiter.arm()
+    if timestamps:
+        events = [_press(key, t) for t, key in presses]
+        rng.shuffle(events)  # queue order must not decide the winner
+        for event in events:
+            pygame.event.post(event)
+        return arbiter.capture()
+
+    pending = sorted(presses)
+    now[0] = pending[0][0] - POLL_INTERVAL * 1000.0 * rng.random()
+    while arbiter.armed and (pending or arbiter.presses):
+        arrived = []
+        while pending and pending[0][0] <= now[0]:
+            arrived.append(_press(pending.pop(0)[1]))
+        rng.shuffle(arrived)  # presses within one poll reach the queue in any order
+        for event in arrived:
+            pygame.event.post(event)
+        arbiter.capture()
+        now[0] += POLL_INTERVAL * 1000.0
+    return arbiter.winner_team_id
+
+
+def run_fairness_harness(trials=1000, team_count=4, spacing_ms=1, seed=0, timestamps=True):
+    """
+    Inject synthetic KEYDOWN events into the pygame queue in a shuffled
+    order and check that the earliest press always wins, and that exact
+    ties resolve the same way every time.
+
+    timestamps=True gives the events SDL timestamps. timestamps=False is
+    the path the game takes on pygame 2.6, whose events carry none: the
+    arbiter runs on a fake clock and stamps presses when capture() sees
+    them, so presses at least one poll interval apart must still be told
+    apart and presses within one poll count as a tie.
+    Returns a dict of results.
+    """
+    rng = random.Random(seed)
+    team_ids = list(range(1, team_count + 1))
+
+    now = [0.0]
+    arbiter = BuzzerArbiter() if timestamps else BuzzerArbiter(clock=lambda: now[0])
+    key_for_team = arbiter.assign_keys(team_ids)
+
+    wrong = 0
+    for _ in range(trials):
+        base = rng.uniform(0, 10_000)
+        offsets = rng.sample(range(team_count), team_count)
+        expected = team_ids[offsets.index(0)]
+        presses = [(base + off * spacing_ms, key_for_team[t_id]) for t_id, off in zip(team_ids, offsets)]
+        if _play_round(arbiter, presses, timestamps, now, rng) != expected:
+            wrong += 1
+
+    # Exact ties: every team presses on the same millisecond
+    arbiter.assign_keys(team_ids)
+    tie_winners = [
+        _play_round(arbiter, [(5000.0, key_for_team[t_id]) for t_id in team_ids], timestamps, now, rng)
+        for _ in range(team_count * 2)
+    ]
+
+    # Presses while disarmed are not buzzes and must reach the main loop
+    arbiter.disarm()
+    swallowed = sum(arbiter.submit(_press(key)) for key in key_for_team.values())
+
+    return {
+        "trials": trials,
+        "spacing_ms": spacing_ms,
+        "timestamps": timestamps,
+        "wrong_winners": wrong,
+        "tie_winners": tie_winners,
+        "swallowed_while_disarmed": swallowed,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks buzzer",
+                                     description="Check that the earliest buzzer press always wins.")
+    parser.add_argument("--trials", type=int, default=1000)
+    parser.add_argument("--teams", type=int, default=4)
+    parser.add_argument("--spacing-ms", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    for timestamps in (True, False):
+        results = run_fairness_harness(args.trials, args.teams, args.spacing_ms, timestamps=timestamps)
+        source = "SDL timestamps" if timestamps else "capture time"
+        print(f"[BUZZER] {source}: {results['trials']} trials at {results['spacing_ms']} ms spacing, "
+              f"wrong winners: {results['wrong_winners']}")
+        print(f"[BUZZER] {source}: tie winners (rotates by fewest wins): {results['tie_winners']}")
+        print(f"[BUZZER] {source}: keys swallowed while disarmed: {results['swallowed_while_disarmed']}")
+    pygame.quit()
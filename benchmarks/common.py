@@ -0,0 +1,33 @@
+"""Helpers shared by the benchmarks (and the tests): a seeded database and a UI-like question opener."""
+import sqlite3
+
+
+def seed_benchmark_db(path, questions, categories):
+    """
+    Create a database at `path` with one group of `questions` open-ended
+    questions spread over "Category 0".."Category <categories - 1>".
+    Returns (db, group_id).
+    """
+    from db_manager import DBManager
+
+    db = DBManager(path)
+    group_id = db.insert_question_group("Benchmark")
+    conn = sqlite3.connect(path)
+    conn.executemany("""
+        INSERT INTO questions (question_group_id, question, points, category, question_type)
+        VALUES (?, ?, ?, ?, 'open_ended');
+    """, [
+        (group_id, f"Question {i}", 10 * (1 + i % 5), f"Category {i % categories}")
+        for i in range(questions)
+    ])
+    conn.commit()
+    conn.close()
+    return db, group_id
+
+
+def next_question(logic):
+    """Open the next question the way the UI would (first open tile on a grid). None when none are left."""
+    if logic.mode.picks_questions:
+        open_tiles = [q_id for _, column in logic.mode.tiles() for q_id, _, still_open in column if still_open]
+        return logic.choose_question(open_tiles[0]) if open_tiles else None
+    return logic.begin_game_loop()
@@ -0,0 +1,132 @@
+"""
+Database torture test: many threads write through one DBManager while a
+second connection keeps taking the write lock; afterwards every write
+must be there.
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+from db_manager import BUSY_TIMEOUT, DBManager
+
+
+def run_torture_test(threads=16, ops_per_thread=300, outside_writer=True, db_name=None, seed=0):
+    """
+    Hammer one DBManager from `threads` threads at once, each playing its
+    own session (answers, score changes, events, reads), while another
+    connection stands in for a second process and keeps taking the write
+    lock. Checks afterwards that every write landed. Returns a summary
+    with the errors seen (should be none).
+    """
+    tmp = None
+    if db_name is None:
+        tmp = tempfile.TemporaryDirectory()
+        db_name = os.path.join(tmp.name, "torture.db")
+    db = DBManager(db_name, pool_size=threads)
+    group_id = db.insert_question_group("Torture")
+    question_ids = [
+        db.insert_question({"question_group_id": group_id, "question": f"Q{i}", "points": 10,
+                            "category": "General", "question_type": "open_ended"})
+        for i in range(ops_per_thread)
+    ]
+
+    errors = []
+    expected = {}
+    stop = threading.Event()
+
+    def player(index):
+        rng = random.Random(seed + index)
+        try:
+            session_id = db.create_new_session(30, group_id)
+            team_id = db.add_team(session_id, f"Team {index}")
+            db.init_session_state(session_id, [team_id])
+            score = 0
+            for seq, q_id in enumerate(question_ids, start=1):
+                was_correct = rng.random() < 0.5
+                db.mark_question_answered(session_id, q_id, was_correct, 1.0)
+                if was_correct:
+                    score = db.adjust_score(session_id, team_id, 10)
+                db.append_session_event(session_id, seq, "answer", {"question_id": q_id})
+                if seq % 10 == 0:
+                    db.get_session_state(session_id)
+                    db.get_question_bank(group_id)
+            expected[session_id] = (team_id, score)
+        except Exception as e:
+            errors.append(repr(e))
+
+    def other_process():
+        # A plain connection, like a second app window or an import job
+        conn = sqlite3.connect(db_name, timeout=BUSY_TIMEOUT, isolation_level=None)
+        while not stop.is_set():
+            try:
+                conn.execute("BEGIN IMMEDIATE;")
+                conn.execute("INSERT INTO groups (group_name) VALUES ('outside');")
+                time.sleep(0.005)
+                conn.execute("COMMIT;")
+            except sqlite3.OperationalError as e:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK;")
+                errors.append("outside: " + repr(e))
+            time.sleep(0.01)
+        conn.close()
+
+    workers = [threading.Thread(target=player, args=(i,)) for i in range(threads)]
+    outside = threading.Thread(target=other_process) if outside_writer else None
+    start = time.perf_counter()
+    if outside:
+        outside.start()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    if outside:
+        outside.join()
+
+    # Every write must have landed
+    for session_id, (team_id, score) in expected.items():
+        state = db.get_session_state(session_id)
+        if state["scores"].get(team_id) != score:
+            errors.append(f"session {session_id}: score {state['scores'].get(team_id)} != {score}")
+        if len(db.get_session_events(session_id)) != len(question_ids):
+            errors.append(f"session {session_id}: events missing")
+    stats = db.get_question_stats_for_group(group_id)
+    if any(s["attempts"] != threads for s in stats.values()) or len(stats) != len(question_ids):
+        errors.append("question_stats attempts do not match the answers written")
+
+    writer = db.writer
+    result = {
+        "threads": threads,
+        "writes": writer.jobs_done,
+        "writes_per_s": writer.jobs_done / elapsed if elapsed else 0.0,
+        "batches": writer.batches,
+        "avg_batch": writer.jobs_done / max(writer.batches, 1),
+        "retries": writer.attempts - writer.batches,
+        "seconds": elapsed,
+        "errors": errors,
+    }
+    db.close()
+    if tmp is not None:
+        tmp.cleanup()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks db",
+                                     description="Hammer a temporary database from many threads.")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=300, help="answers per thread")
+    args = parser.parse_args(argv)
+
+    res = run_torture_test(args.threads, args.ops)
+    print(f"[DB] {res['threads']} threads: {res['writes']} writes in {res['seconds']:.2f}s "
+          f"({res['writes_per_s']:.0f}/s), {res['batches']} transactions "
+          f"(avg {res['avg_batch']:.1f} writes), {res['retries']} retries")
+    print(f"[DB] errors: {len(res['errors'])}")
+    for error in res["errors"][:10]:
+        print(f"[DB]   {error}")
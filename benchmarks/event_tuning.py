@@ -0,0 +1,80 @@
+"""
+Random event tuning: synthetic games played with and without the event
+engine, to see how much events narrow the spread of win rates.
+"""
+import argparse
+import time
+import numpy as np
+
+from random_events import BALANCE, DEFAULT_EVENT_RATE, RandomEventEngine
+
+
+def simulate_win_rates(engine=None, games=100_000, skills=(0.8, 0.7, 0.6, 0.5),
+                       questions=30, points=(5, 10, 15, 20), seed=0):
+    """
+    Play `games` synthetic games at once, turns rotating over teams of the
+    given skill (chance of answering correctly). With an engine, it rolls
+    after every turn. Returns the win rate per team.
+    """
+    rng = np.random.default_rng(seed)
+    teams = len(skills)
+    skills = np.asarray(skills)
+    question_points = rng.choice(points, size=(games, questions))
+    scores = np.zeros((games, teams))
+    remaining = question_points.sum(axis=1).astype(float)
+
+    for turn in range(questions):
+        team = turn % teams
+        pts = question_points[:, turn]
+        correct = rng.random(games) < skills[team]
+        scores[:, team] += np.where(correct, pts, 0)
+        remaining -= pts
+
+        if engine is not None:
+            team_index, delta = engine.roll(scores, remaining, questions - turn - 1)
+            hit = team_index >= 0
+            scores[hit, team_index[hit]] += delta[hit]
+
+    # Random jitter settles ties without favouring roster order
+    winners = np.argmax(scores + rng.random(scores.shape) * 1e-3, axis=1)
+    return np.bincount(winners, minlength=teams) / games
+
+
+def run_tuning(games=100_000, skills=(0.8, 0.7, 0.6, 0.5), questions=30,
+               event_rate=DEFAULT_EVENT_RATE, balance=BALANCE, seed=0):
+    """
+    Compare win rates with and without random events. The spread is the
+    gap between the best and worst team's win rate.
+    """
+    results = {}
+    for label, engine in (
+        ("no events", None),
+        ("events", RandomEventEngine(seed=seed, event_rate=event_rate, balance=balance)),
+    ):
+        start = time.perf_counter()
+        rates = simulate_win_rates(engine, games, skills, questions, seed=seed)
+        results[label] = {
+            "win_rates": rates,
+            "spread": float(rates.max() - rates.min()),
+            "seconds": time.perf_counter() - start,
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks events",
+                                     description="Show how random events change win-rate spread.")
+    parser.add_argument("--games", type=int, default=100_000)
+    parser.add_argument("--skills", type=float, nargs="+", default=[0.8, 0.7, 0.6, 0.5],
+                        help="chance each team answers correctly")
+    parser.add_argument("--questions", type=int, default=30)
+    parser.add_argument("--rate", type=float, default=DEFAULT_EVENT_RATE, help="event chance per turn")
+    parser.add_argument("--balance", type=float, default=BALANCE)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    results = run_tuning(args.games, args.skills, args.questions, args.rate, args.balance, args.seed)
+    for label, res in results.items():
+        rates = " ".join(f"{r:6.1%}" for r in res["win_rates"])
+        print(f"[EVENTS] {label:>9}: win rates {rates} | spread {res['spread']:.1%} "
+              f"({res['seconds']:.2f}s)")
@@ -0,0 +1,82 @@
+"""
+CPU and display traffic of a scoreboard, idle and counting up scores:
+a full redraw at a fixed 60 FPS against the Animator's idle frame rate
+and partial updates.
+"""
+import argparse
+import time
+
+import pygame
+
+from animation import Animator
+from display_manager import DisplayManager
+from responsive_layout import ResponsiveLayout
+
+
+def run_idle_benchmark(seconds=3.0, busy_fps=60, idle_fps=15, size=(1280, 720)):
+    """
+    A scoreboard on screen for `seconds`, once with nothing happening and
+    once with a score counting up every second. Compares the old loop
+    (full redraw and flip at busy_fps) with the Animator-driven one
+    (idle_fps when nothing moves, partial updates while only animations
+    move). Reports CPU ms per second and pixels sent to the display per
+    second.
+    """
+    pygame.display.init()
+    pygame.font.init()
+    results = {}
+    for scenario in ("idle", "scoring"):
+        for loop in ("fixed 60 FPS", "animator"):
+            manager = DisplayManager()
+            manager.update_display_size(*size)
+            layout = ResponsiveLayout(manager)
+            animator = Animator()
+            clock = pygame.time.Clock()
+            score = shown = 0
+            next_score_at = 0.5
+            frames = pixels = 0
+            full_area = size[0] * size[1]
+            began, cpu_began = time.perf_counter(), time.process_time()
+            while time.perf_counter() - began < seconds:
+                now = animator.update()
+                changed = frames == 0
+                if scenario == "scoring" and now - began >= next_score_at:
+                    next_score_at += 1.0
+                    animator.animate("score", shown, score + 10, 0.6)
+                    score += 10
+                manager.screen.fill('white')
+                layout.draw_text_centered(0.1, "Scores:", size_multiplier=0.8)
+                rect = layout.text_box(0.2, 0.06, 0.3, 0.4)
+                shown = animator.value("score", score, rect)
+                layout.draw_text_centered(0.2, f"Red: {round(shown)}", size_multiplier=0.8)
+                frames += 1
+                if loop == "fixed 60 FPS" or changed:
+                    manager.present()
+                    pixels += full_area
+                    clock.tick(busy_fps)
+                else:
+                    dirty = animator.dirty_rects()
+                    manager.present(dirty)
+                    pixels += sum(r.width * r.height for r in dirty)
+                    clock.tick(busy_fps if animator.active else idle_fps)
+            wall = time.perf_counter() - began
+            results[(scenario, loop)] = {
+                "fps": frames / wall,
+                "cpu_ms_per_s": (time.process_time() - cpu_began) * 1000 / wall,
+                "mpixels_per_s": pixels / wall / 1e6,
+            }
+    pygame.quit()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks idle",
+                                     description="CPU and display traffic of an idle/animating scoreboard, "
+                                                 "fixed 60 FPS vs the Animator's idle frame rate.")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--idle-fps", type=int, default=15)
+    args = parser.parse_args(argv)
+
+    for (scenario, loop), res in run_idle_benchmark(args.seconds, idle_fps=args.idle_fps).items():
+        print(f"[ANIM] {scenario:>7} | {loop:>12}: {res['fps']:5.1f} FPS, "
+              f"{res['cpu_ms_per_s']:6.1f} ms CPU/s, {res['mpixels_per_s']:6.2f} Mpixels/s to the display")
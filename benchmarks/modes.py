@@ -0,0 +1,108 @@
+"""
+Game modes: one full game per mode against a temporary database, timing
+preload and each question and counting DB round trips.
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.common import next_question, seed_benchmark_db
+from game_logic import GameLogic
+from game_modes import MODES
+
+
+class CountingDBManager:
+    """Wraps a DBManager and counts its round trips (reads and queued writes)."""
+
+    def __init__(self, db):
+        self._db = db
+        self.calls = 0
+        connect, write = db.create_connection, db._write
+
+        def counted_connect():
+            self.calls += 1
+            return connect()
+
+        def counted_write(work):
+            self.calls += 1
+            return write(work)
+
+        db.create_connection = counted_connect
+        db._write = counted_write
+
+    def __getattr__(self, name):
+        return getattr(self._db, name)
+
+
+def run_mode_benchmark(questions=2000, teams=4, frames_per_question=60, categories=8, seed=0):
+    """
+    Play one full game per mode against a temporary database. Reports
+    preload time, time per question drawn and answered, and how many DB
+    round trips happened while "frames" polled the game state (should be
+    0) versus per answer.
+    """
+    rng = random.Random(seed)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        db, group_id = seed_benchmark_db(os.path.join(tmp, "bench.db"), questions, categories)
+        for name in MODES:
+            counter = CountingDBManager(db)
+            logic = GameLogic(counter)
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                logic.create_new_session(30, group_id, name)
+                preload_s = time.perf_counter() - start
+                logic.setup_teams([f"Team {i + 1}" for i in range(teams)])
+
+                frame_calls = answer_calls = played = 0
+                start = time.perf_counter()
+                while True:
+                    before = counter.calls
+                    for _ in range(frames_per_question):
+                        logic.questions_left()
+                        logic.get_scores()
+                        logic.get_current_team_id()
+                        logic.current_round_name()
+                    frame_calls += counter.calls - before
+                    if not logic.questions_left():
+                        break
+
+                    before = counter.calls
+                    question = next_question(logic)
+                    if question is None:
+                        break
+                    if logic.mode.uses_buzzer:
+                        logic.set_current_team(rng.choice(logic.teams)["team_id"])
+                    logic.mark_answer(question["id"], rng.random() < 0.6, question["points"])
+                    answer_calls += counter.calls - before
+                    played += 1
+                play_s = time.perf_counter() - start
+                logic.end_session()
+
+            results[name] = {
+                "questions": played,
+                "preload_ms": preload_s * 1000,
+                "per_question_ms": play_s / max(played, 1) * 1000,
+                "frame_db_calls": frame_calls,
+                "db_calls_per_answer": answer_calls / max(played, 1),
+            }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks modes",
+                                     description="Play a full game in every mode and time it.")
+    parser.add_argument("--questions", type=int, default=2000)
+    parser.add_argument("--teams", type=int, default=4)
+    parser.add_argument("--frames", type=int, default=60, help="state polls per question")
+    args = parser.parse_args(argv)
+
+    for name, res in run_mode_benchmark(args.questions, args.teams, args.frames).items():
+        print(f"[MODES] {name:>9}: {res['questions']:5d} questions, preload {res['preload_ms']:6.1f} ms, "
+              f"{res['per_question_ms']:5.2f} ms/question, "
+              f"{res['db_calls_per_answer']:.1f} DB calls/answer, "
+              f"{res['frame_db_calls']} during frames")
@@ -0,0 +1,76 @@
+"""
+Question packs: what a session pays to start from packs of growing
+size (open, preload, first question) and the cost of each later draw.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from game_modes import RandomMode
+from question_pack import PACK_SUFFIX, QuestionPack, write_pack
+
+
+def _synthetic_questions(count, seed=0):
+    rng = random.Random(seed)
+    for q_id in range(1, count + 1):
+        multiple_choice = q_id % 3 == 0
+        yield {
+            "id": q_id,
+            "question": f"Question {q_id}: " + " ".join(f"word{rng.randrange(1000)}" for _ in range(8)) + "?",
+            "fill_in_blank_text": None,
+            "points": rng.choice((10, 20, 30, 50)),
+            "category": f"Category {q_id % 12}",
+            "question_type": "multiple_choice" if multiple_choice else "open_ended",
+            "options": [
+                {"id": q_id * 4 + i, "text": f"Answer {i}", "is_correct": i == 0} for i in range(4)
+            ] if multiple_choice else [],
+            "attempts": 0,
+            "correct": 0,
+        }
+
+
+def run_pack_benchmark(sizes=(1_000, 100_000, 1_000_000), draws=100, seed=0):
+    """
+    Write synthetic packs, then time what a session pays to start from one
+    (open the pack, preload a random-mode game, draw the first question)
+    and the average cost of a draw after that.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in sizes:
+            path = os.path.join(tmp, f"bench{PACK_SUFFIX}")
+            write_pack(path, _synthetic_questions(count, seed), name=f"{count} questions")
+
+            start = time.perf_counter()
+            pack = QuestionPack(path)
+            mode = RandomMode(None, seed=seed)
+            mode.preload(pack.session_bank())
+            mode.next_question()
+            first_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(draws):
+                mode.next_question()
+            draw_s = (time.perf_counter() - start) / draws
+            pack.close()
+            results.append({
+                "questions": count,
+                "file_bytes": os.path.getsize(path),
+                "first_question_ms": first_s * 1000,
+                "draw_ms": draw_s * 1000,
+            })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks packs",
+                                     description="Session start-up time vs question pack size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    args = parser.parse_args(argv)
+
+    for res in run_pack_benchmark(args.sizes):
+        print(f"[PACK] {res['questions']:>9} questions ({res['file_bytes'] / 1024 / 1024:6.1f} MB) | "
+              f"open + first question {res['first_question_ms']:6.2f} ms | "
+              f"{res['draw_ms'] * 1000:5.1f} us/draw")
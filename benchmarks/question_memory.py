@@ -0,0 +1,118 @@
+"""
+Preloaded question bank memory: the same synthetic bank loaded as
+question dicts and as Question objects, measured with tracemalloc.
+"""
+import argparse
+import random
+import sqlite3
+import time
+import tracemalloc
+
+from question_model import build_bank
+
+QUESTION_TYPES = ("multiple_choice", "open_ended", "fill_in_blank")
+CATEGORIES = 12
+
+
+def _seed_rows(conn, count, seed):
+    """`count` synthetic questions (a third multiple choice with 4 options) in an in-memory DB."""
+    rng = random.Random(seed)
+    conn.execute("""
+        CREATE TABLE questions (id INTEGER PRIMARY KEY, question_group_id INTEGER, question TEXT,
+            fill_in_blank_text TEXT, points INTEGER, category TEXT, question_type TEXT,
+            attempts INTEGER, correct INTEGER)
+    """)
+    conn.execute("CREATE TABLE question_options (id INTEGER PRIMARY KEY, question_id INTEGER, option_text TEXT, is_correct INTEGER)")
+    questions, options = [], []
+    for q_id in range(1, count + 1):
+        question_type = QUESTION_TYPES[q_id % len(QUESTION_TYPES)]
+        text = f"Question {q_id}: " + " ".join(f"word{rng.randrange(1000)}" for _ in range(rng.randint(4, 12))) + "?"
+        blank = "word1" if question_type == "fill_in_blank" else None
+        attempts = rng.randrange(20)
+        questions.append((q_id, 1, text, blank, rng.choice((10, 20, 30, 50)),
+                          f"Category {q_id % CATEGORIES}", question_type, attempts, rng.randint(0, attempts)))
+        if question_type == "multiple_choice":
+            for i in range(4):
+                options.append((None, q_id, f"Answer {i} to {q_id}", int(i == 0)))
+    conn.executemany("INSERT INTO questions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", questions)
+    conn.executemany("INSERT INTO question_options VALUES (?, ?, ?, ?)", options)
+
+
+def _build_dict_bank(question_rows, option_rows):
+    """The question dicts DBManager.get_question_bank used to return."""
+    bank = [
+        {
+            'id': r[0],
+            'question_group_id': r[1],
+            'question': r[2],
+            'fill_in_blank_text': r[3],
+            'points': r[4],
+            'category': r[5],
+            'question_type': r[6],
+            'options': [],
+            'attempts': r[7],
+            'correct': r[8],
+        }
+        for r in question_rows
+    ]
+    by_id = {q['id']: q for q in bank}
+    for q_id, opt_id, text, is_correct in option_rows:
+        if by_id[q_id]['question_type'] == 'multiple_choice':
+            by_id[q_id]['options'].append({'id': opt_id, 'text': text, 'is_correct': bool(is_correct)})
+    return bank
+
+
+def _measure(conn, build):
+    """(bytes the built bank keeps, peak bytes while building, seconds)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    question_rows = conn.execute("SELECT * FROM questions ORDER BY category, id").fetchall()
+    option_rows = conn.execute("SELECT question_id, id, option_text, is_correct FROM question_options ORDER BY id").fetchall()
+    bank = build(question_rows, option_rows)
+    del question_rows, option_rows
+    seconds = time.perf_counter() - start
+    kept, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del bank
+    return kept, peak, seconds
+
+
+def run_memory_benchmark(sizes=(10_000, 100_000, 1_000_000), seed=0):
+    """
+    Load the same synthetic bank (rows straight from SQLite) as question
+    dicts and as Question objects, and compare what tracemalloc says each
+    one keeps alive. Returns one result dict per size.
+    """
+    results = []
+    for count in sizes:
+        conn = sqlite3.connect(":memory:")
+        _seed_rows(conn, count, seed)
+        dict_kept, dict_peak, dict_s = _measure(conn, _build_dict_bank)
+        compact_kept, compact_peak, compact_s = _measure(conn, build_bank)
+        conn.close()
+        results.append({
+            "questions": count,
+            "dict_bytes": dict_kept,
+            "compact_bytes": compact_kept,
+            "dict_peak_bytes": dict_peak,
+            "compact_peak_bytes": compact_peak,
+            "dict_load_s": dict_s,
+            "compact_load_s": compact_s,
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks memory",
+                                     description="Memory use of preloaded question banks: dicts vs Question objects.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args(argv)
+
+    mb = 1024 * 1024
+    for res in run_memory_benchmark(args.sizes):
+        n = res["questions"]
+        print(f"[MEMORY] {n:>9} questions | dicts {res['dict_bytes'] / mb:8.1f} MB "
+              f"({res['dict_bytes'] / n:5.0f} B/question, peak {res['dict_peak_bytes'] / mb:.0f} MB) | "
+              f"compact {res['compact_bytes'] / mb:8.1f} MB "
+              f"({res['compact_bytes'] / n:5.0f} B/question, peak {res['compact_peak_bytes'] / mb:.0f} MB) | "
+              f"{res['dict_bytes'] / res['compact_bytes']:.1f}x smaller")
@@ -0,0 +1,122 @@
+"""
+Loopback load test for the remote server: many WebSocket clients time
+command round trips through the frame-paced command queue.
+"""
+import argparse
+import asyncio
+import base64
+import json
+import secrets
+import statistics
+import threading
+import time
+
+from remote_server import RemoteServer, encode_frame, read_message, OP_TEXT
+
+# The game loop runs at 60 FPS, so a command waits up to one frame for pickup
+FRAME_TIME = 1 / 60
+
+
+def run_frame_loop(server, stop_event):
+    """Stand-in for the pygame loop: drain the command queue once per frame."""
+    while not stop_event.is_set():
+        frame_start = time.perf_counter()
+        server.process_commands(lambda command: {"ok": True})
+        elapsed = time.perf_counter() - frame_start
+        time.sleep(max(0.0, FRAME_TIME - elapsed))
+
+
+async def run_client(host, port, requests, latencies, errors):
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+        key = base64.b64encode(secrets.token_bytes(16)).decode("ascii")
+        writer.write(
+            "GET /ws HTTP/1.1\r\n"
+            f"Host: {host}:{port}\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n\r\n".encode("latin-1")
+        )
+        await writer.drain()
+        await reader.readuntil(b"\r\n\r\n")
+
+        for i in range(requests):
+            sent = time.perf_counter()
+            writer.write(encode_frame(json.dumps({"type": "ping", "id": i}), mask=True))
+            await writer.drain()
+            # Skip state broadcasts until our pong arrives
+            while True:
+                opcode, data = await read_message(reader)
+                if opcode != OP_TEXT:
+                    continue
+                msg = json.loads(data)
+                if msg.get("type") == "pong" and msg.get("id") == i:
+                    break
+            latencies.append((time.perf_counter() - sent) * 1000.0)
+        writer.close()
+    except (OSError, asyncio.IncompleteReadError) as exc:
+        errors.append(str(exc))
+
+
+async def run_clients(host, port, clients, requests):
+    latencies = []
+    errors = []
+    await asyncio.gather(*(
+        run_client(host, port, requests, latencies, errors) for _ in range(clients)
+    ))
+    return latencies, errors
+
+
+def run_load_test(clients=200, requests=20, target_ms=50.0):
+    """
+    Start a loopback RemoteServer, connect `clients` WebSocket clients and
+    time `requests` command round trips each through the command queue.
+    Returns a dict of latency statistics in ms.
+    """
+    server = RemoteServer(host="127.0.0.1", port=0).start()
+    stop_event = threading.Event()
+    frame_thread = threading.Thread(target=run_frame_loop, args=(server, stop_event), daemon=True)
+    frame_thread.start()
+
+    started = time.perf_counter()
+    latencies, errors = asyncio.run(run_clients("127.0.0.1", server.port, clients, requests))
+    duration = time.perf_counter() - started
+
+    stop_event.set()
+    frame_thread.join()
+    server.stop()
+
+    latencies.sort()
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] if latencies else 0.0
+
+    return {
+        "clients": clients,
+        "round_trips": len(latencies),
+        "errors": len(errors),
+        "throughput": len(latencies) / duration if duration else 0.0,
+        "mean_ms": statistics.fmean(latencies) if latencies else 0.0,
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+        "max_ms": latencies[-1] if latencies else 0.0,
+        "target_ms": target_ms,
+        "passed": not errors and bool(latencies) and pct(0.99) < target_ms,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks remote",
+                                     description="Loopback load test for the remote server")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--target-ms", type=float, default=50.0)
+    args = parser.parse_args(argv)
+
+    r = run_load_test(args.clients, args.requests, args.target_ms)
+    print(f"[LOADGEN] {r['clients']} clients, {r['round_trips']} round trips, "
+          f"{r['errors']} errors, {r['throughput']:.0f} req/s")
+    print(f"[LOADGEN] mean {r['mean_ms']:.1f} ms | p50 {r['p50_ms']:.1f} | "
+          f"p95 {r['p95_ms']:.1f} | p99 {r['p99_ms']:.1f} | max {r['max_ms']:.1f}")
+    print(f"[LOADGEN] {'PASS' if r['passed'] else 'FAIL'} (p99 < {r['target_ms']:.0f} ms)")
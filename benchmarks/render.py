@@ -0,0 +1,64 @@
+"""
+Frame cost at native window size against a fixed base resolution that
+DisplayManager scales into the window in one pass.
+"""
+import argparse
+import time
+
+import pygame
+
+from display_manager import DisplayManager
+from responsive_layout import ResponsiveLayout
+
+
+def run_render_benchmark(window_sizes=((1280, 720), (1920, 1080), (3840, 2160)),
+                         base=(1280, 720), frames=60):
+    """
+    Draw the same screen (a question, 24 buttons, a ticking clock) at
+    native window size and at a fixed base resolution, for each window
+    size; "fixed, idle" leaves the clock out, so frames repeat and are
+    not scaled again. Returns {(width, height): {mode: (draw ms, present ms)}}.
+    """
+    pygame.display.init()
+    pygame.font.init()
+
+    question = ("Which nineteenth-century naturalist, after a five-year voyage aboard HMS Beagle, "
+                "published a book in 1859 on evolution by natural selection?")
+    results = {}
+    for size in window_sizes:
+        results[size] = {}
+        for mode, changing in (("native", True), ("fixed", True), ("fixed, idle", False)):
+            manager = DisplayManager()
+            manager.update_display_size(*size)
+            if mode != "native":
+                manager.set_base_resolution(*base)
+            layout = ResponsiveLayout(manager)
+            draw_s = present_s = 0.0
+            for i in range(frames + 1):
+                start = time.perf_counter()
+                manager.screen.fill('white')
+                layout.draw_text_block(layout.text_box(0.05, 0.2), question, size_multiplier=1.2)
+                layout.create_grid_buttons([f"Team {n + 1}" for n in range(24)], 0.3, 0.15, 0.1, (0, 0, 255))
+                if changing:
+                    layout.draw_text_centered(0.9, f"Time left: {i}")
+                drawn = time.perf_counter()
+                manager.present()
+                if i:  # the first frame fills the caches
+                    draw_s += drawn - start
+                    present_s += time.perf_counter() - drawn
+            results[size][mode] = (draw_s / frames * 1000, present_s / frames * 1000)
+    pygame.quit()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks render",
+                                     description="Frame cost at native resolution vs a fixed base resolution "
+                                                 "scaled to the window.")
+    parser.add_argument("--base", type=int, nargs=2, default=[1280, 720], metavar=("W", "H"))
+    parser.add_argument("--frames", type=int, default=60)
+    args = parser.parse_args(argv)
+
+    for size, modes in run_render_benchmark(base=tuple(args.base), frames=args.frames).items():
+        print(f"[RENDER] window {size[0]}x{size[1]} (draw + present): " + " | ".join(
+            f"{mode} {draw:5.2f} + {present:5.2f} ms" for mode, (draw, present) in modes.items()))
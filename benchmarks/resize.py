@@ -0,0 +1,72 @@
+"""
+Resize handling during a simulated window drag: set_mode and a layout
+rebuild on every VIDEORESIZE, against DisplayManager's coalesced resizes.
+"""
+import argparse
+import time
+
+import pygame
+
+from display_manager import RESIZE_SETTLE_MS, DisplayManager
+from responsive_layout import ResponsiveLayout
+
+
+def run_resize_benchmark(events=120, interval_ms=16, start=(1280, 720), step=8):
+    """
+    A window edge dragged for `events` VIDEORESIZE events, `interval_ms`
+    apart (simulated clock), handled the old way (set_mode and a layout
+    rebuild on every event) and coalesced (request_resize/settle_resize).
+    A frame is drawn after every event. Returns per mode: set_mode calls,
+    layout rebuilds, font sizes loaded and total ms.
+    """
+    pygame.display.init()
+    pygame.font.init()
+
+    results = {}
+    for mode in ("immediate", "coalesced"):
+        manager = DisplayManager()
+        manager.update_display_size(*start)
+        layout = ResponsiveLayout(manager)
+        manager.set_mode_calls = rebuilds = 0
+        now = 0.0
+        began = time.perf_counter()
+        for i in range(1, events + 2):
+            if i <= events:
+                size = (start[0] + i * step, start[1] + i * step * start[1] // start[0])
+                if mode == "immediate":
+                    manager.update_display_size(*size)
+                    layout.update_scale_factors()
+                    rebuilds += 1
+                else:
+                    manager.request_resize(*size, now=now)
+                now += interval_ms / 1000
+            else:
+                now += RESIZE_SETTLE_MS / 1000  # the drag has stopped
+            if manager.settle_resize(now=now):
+                layout.update_scale_factors()
+                rebuilds += 1
+            manager.screen.fill('white')
+            layout.draw_text_centered(0.1, "Clynboozle", size_multiplier=1.5)
+            layout.create_grid_buttons([f"Group {n + 1}" for n in range(12)], 0.3, 0.3, 0.1, (0, 0, 255))
+            manager.present()
+        results[mode] = {
+            "set_mode_calls": manager.set_mode_calls,
+            "layout_rebuilds": rebuilds,
+            "font_sizes": len(layout.text_cache.fonts),
+            "final_size": (manager.current_width, manager.current_height),
+            "total_ms": (time.perf_counter() - began) * 1000,
+        }
+    pygame.quit()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks resize",
+                                     description="Resize handling during a simulated window drag.")
+    parser.add_argument("--events", type=int, default=120, help="resize events in the drag")
+    args = parser.parse_args(argv)
+
+    for mode, res in run_resize_benchmark(args.events).items():
+        print(f"[RESIZE] {mode:>9}: {res['set_mode_calls']:4d} set_mode calls, "
+              f"{res['layout_rebuilds']:4d} layout rebuilds, {res['font_sizes']:3d} font sizes loaded, "
+              f"final {res['final_size'][0]}x{res['final_size'][1]}, {res['total_ms']:7.1f} ms")
@@ -0,0 +1,133 @@
+"""
+Room stress test: many games at once in one SessionManager, timing every
+answer and counting lock errors, pool use and question-cache hits.
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+from benchmarks.common import next_question, seed_benchmark_db
+from db_manager import DBManager
+from game_modes import MODES
+from session_manager import POOL_SIZE, SessionManager
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def _play_room(logic, rng, latencies, errors):
+    """Play one room to the end, timing every answer."""
+    while logic.questions_left():
+        question = next_question(logic)
+        if question is None:
+            break
+        start = time.perf_counter()
+        try:
+            logic.mark_answer(question["id"], rng.random() < 0.6, question["points"])
+        except sqlite3.OperationalError:
+            errors.append(1)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+def run_stress_test(sessions=50, questions=40, teams=4, mode="random", threaded=True,
+                    pool_size=POOL_SIZE, seed=0):
+    """
+    Run `sessions` rooms at once in one SessionManager against a temporary
+    database. Threaded, every room plays in its own thread and their writes
+    queue up behind the DB writer thread; otherwise the rooms take turns in
+    one thread, the way the pygame UI drives them. Reports answer latency,
+    lock errors, pool use and question-cache hits.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "stress.db")
+        _, group_id = seed_benchmark_db(path, questions, categories=6)
+        manager = SessionManager(DBManager(path, pool_size=pool_size))
+        latencies, errors = [], []
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            rooms = []
+            for _ in range(sessions):
+                logic = manager.create_room(30, group_id, mode)
+                logic.setup_teams([f"Team {i + 1}" for i in range(teams)])
+                rooms.append(logic)
+            setup_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            if threaded:
+                workers = [
+                    threading.Thread(target=_play_room, args=(logic, random.Random(seed + i), latencies, errors))
+                    for i, logic in enumerate(rooms)
+                ]
+                for worker in workers:
+                    worker.start()
+                for worker in workers:
+                    worker.join()
+            else:
+                rngs = [random.Random(seed + i) for i in range(len(rooms))]
+                while any(logic.questions_left() for logic in rooms):
+                    for logic, rng in zip(rooms, rngs):
+                        if logic.questions_left():
+                            question = next_question(logic)
+                            if question is None:
+                                continue
+                            begin = time.perf_counter()
+                            logic.mark_answer(question["id"], rng.random() < 0.6, question["points"])
+                            latencies.append(time.perf_counter() - begin)
+            play_s = time.perf_counter() - start
+            manager.close_all()
+        if not latencies:
+            manager.db.close()
+            raise RuntimeError(f"No answers were recorded in {sessions} '{mode}' rooms")
+
+        pool = manager.db.pool
+        result = {
+            "sessions": sessions,
+            "answers": len(latencies),
+            "lock_errors": len(errors),
+            "setup_s": setup_s,
+            "answers_per_s": len(latencies) / play_s if play_s else 0.0,
+            "p50_ms": _percentile(latencies, 0.5) * 1000,
+            "p95_ms": _percentile(latencies, 0.95) * 1000,
+            "max_ms": max(latencies, default=0.0) * 1000,
+            "connections_opened": pool.opened if pool else None,
+            "connections_acquired": pool.acquired if pool else None,
+            "cache_hits": manager.questions.hits,
+            "cache_misses": manager.questions.misses,
+        }
+        manager.db.close()
+        return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks rooms",
+                                     description="Stress test many concurrent rooms in one process.")
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--questions", type=int, default=40, help="questions per game")
+    parser.add_argument("--teams", type=int, default=4)
+    parser.add_argument("--mode", default="random", choices=sorted(MODES))
+    parser.add_argument("--pool", type=int, default=POOL_SIZE, help="idle connections kept (0 = no pool)")
+    parser.add_argument("--serial", action="store_true", help="rooms take turns in one thread, like the UI")
+    args = parser.parse_args(argv)
+
+    res = run_stress_test(args.sessions, args.questions, args.teams, args.mode,
+                          threaded=not args.serial, pool_size=args.pool)
+    print(f"[ROOMS] {res['sessions']} rooms, {res['answers']} answers in "
+          f"{'one thread' if args.serial else 'one thread per room'} ({res['setup_s']:.2f}s setup)")
+    print(f"[ROOMS] {res['answers_per_s']:.0f} answers/s | latency p50 {res['p50_ms']:.1f} ms, "
+          f"p95 {res['p95_ms']:.1f} ms, max {res['max_ms']:.1f} ms | lock errors {res['lock_errors']}")
+    if res["connections_opened"] is not None:
+        print(f"[ROOMS] pool: {res['connections_opened']} connections opened for "
+              f"{res['connections_acquired']} uses | question cache: "
+              f"{res['cache_hits']} hits, {res['cache_misses']} misses")
@@ -0,0 +1,60 @@
+"""
+Adaptive sampler draws: AdaptiveSelector on a large synthetic group,
+against rebuilding a weight list for every draw.
+"""
+import argparse
+import random
+import time
+
+from question_sampler import TIER_WIDTH, AdaptiveSelector, smoothed_correct_rate
+
+
+def run_benchmark(questions=100_000, draws=10_000, seed=0):
+    """
+    Build a selector over a synthetic group and time draws, against
+    rebuilding a weight list per draw (what a naive sampler would do).
+    """
+    rng = random.Random(seed)
+    bank = []
+    for q_id in range(questions):
+        attempts = rng.randint(0, 20)
+        bank.append((q_id, rng.choice((10, 20, 30)), attempts, rng.randint(0, attempts)))
+
+    start = time.perf_counter()
+    selector = AdaptiveSelector(bank, seed=seed)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(draws):
+        selector.draw(0.2 + 0.6 * (i % 2))
+    draw_s = time.perf_counter() - start
+
+    naive_draws = min(draws, 200)
+    left = {q[0]: smoothed_correct_rate(q[2], q[3]) for q in bank}
+    start = time.perf_counter()
+    for i in range(naive_draws):
+        target = 0.2 + 0.6 * (i % 2)
+        ids = list(left)
+        weights = [2.0 ** (-((left[q] - target) / TIER_WIDTH) ** 2) for q in ids]
+        del left[rng.choices(ids, weights)[0]]
+    naive_s = time.perf_counter() - start
+
+    return {
+        "questions": questions,
+        "draws": draws,
+        "build_ms": build_s * 1000,
+        "draw_us": draw_s / draws * 1e6,
+        "naive_draw_us": naive_s / naive_draws * 1e6,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks sampler",
+                                     description="Benchmark the adaptive question sampler.")
+    parser.add_argument("--questions", type=int, default=100_000)
+    parser.add_argument("--draws", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    res = run_benchmark(args.questions, args.draws)
+    print(f"[SAMPLER] {res['questions']:,} questions: build {res['build_ms']:.0f} ms, "
+          f"{res['draw_us']:.1f} us/draw (rebuilding weights per draw: {res['naive_draw_us']:,.0f} us/draw)")
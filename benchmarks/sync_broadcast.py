@@ -0,0 +1,192 @@
+"""
+Delta state broadcast: a synthetic game replayed through StateSync to
+many subscribers, against re-sending the whole state on every change.
+"""
+import argparse
+import random
+import socket
+import threading
+import time
+
+from state_sync import QueueTransport, SocketTransport, StateMirror, StateSync
+
+
+def _synthetic_game(sync, teams=6, questions=200, seed=0):
+    """Drive a StateSync with the event mix of a typical game."""
+    rng = random.Random(seed)
+    sync.on_game_event("session", 1)
+    sync.on_game_event("teams", [{"team_id": t, "team_name": f"Team {t}"} for t in range(1, teams + 1)])
+    sync.on_game_event("scores", {t: 0 for t in range(1, teams + 1)})
+    scores = {t: 0 for t in range(1, teams + 1)}
+    turn = 1
+    for qid in range(1, questions + 1):
+        sync.on_game_event("question", {
+            "id": qid,
+            "question": f"Sample question number {qid} about some topic?",
+            "question_type": "multiple_choice",
+            "fill_in_blank_text": None,
+            "options": [{"text": f"Option {c}"} for c in "ABCD"],
+        })
+        correct = rng.random() < 0.6
+        sync.on_game_event("answered", qid, correct)
+        sync.on_game_event("question", None)
+        if correct:
+            scores[turn] += 10
+            sync.on_game_event("score", turn, scores[turn])
+        turn = turn % teams + 1
+        sync.on_game_event("turn", turn)
+
+
+def run_benchmark(subscribers=50, transport="queue", questions=200, stalled=0):
+    """
+    Replay a synthetic game through StateSync with `subscribers` clients and
+    compare against re-sending the full state on every change. Bytes/sec
+    is what reached the clients over the measured wall time (publishing
+    until every client has read everything). With transport="socket",
+    `stalled` more clients connect but never read; they must not slow the
+    publisher, and are dropped once they fall too far behind.
+    Returns a dict of bytes and CPU figures.
+    """
+    results = {}
+    for strategy in ("delta", "full"):
+        sync = StateSync()
+        readers = []
+        sockets = []
+        mirrors = []
+        stalled_transports = []
+        for _ in range(subscribers):
+            mirror = StateMirror()
+            mirrors.append(mirror)
+            if transport == "socket":
+                server_side, client_side = socket.socketpair()
+                sockets.extend([server_side, client_side])
+                t = threading.Thread(target=_drain_socket, args=(client_side, mirror), daemon=True)
+                t.start()
+                readers.append(t)
+                # The game below is published in one burst, so readers may lag the whole game
+                sync.subscribe(SocketTransport(server_side, max_queued=questions * 8))
+            else:
+                sync.subscribe(QueueTransport())
+        if transport == "socket":
+            for _ in range(stalled):
+                server_side, client_side = socket.socketpair()
+                server_side.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4096)
+                sockets.extend([server_side, client_side])
+                stalled_transports.append(sync.subscribe(SocketTransport(server_side)))
+
+        if strategy == "full":
+            # Baseline: every change re-sends the whole state to everyone
+            full_transports = list(sync.subscribers)
+            sync.subscribers = []
+            original_publish = sync.publish
+
+            def publish_full(*delta, _orig=original_publish, _subs=full_transports, _sync=sync):
+                version = _orig(*delta)
+                data = _sync.snapshot_message()
+                for tr in list(_subs):
+                    try:
+                        tr.send(data)
+                    except OSError:
+                        _subs.remove(tr)
+                return version
+            sync.publish = publish_full
+            subs = full_transports
+        else:
+            subs = sync.subscribers
+
+        counter = _ByteCounter([tr for tr in subs if tr not in stalled_transports])
+        slowest = [0.0]
+        timed_publish = sync.publish
+
+        def publish_timed(*delta, _publish=timed_publish):
+            start = time.perf_counter()
+            version = _publish(*delta)
+            slowest[0] = max(slowest[0], time.perf_counter() - start)
+            return version
+        sync.publish = publish_timed
+
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        _synthetic_game(sync, questions=questions)
+        cpu = time.process_time() - cpu_start
+
+        if transport == "socket":
+            dropped = sum(tr.closed for tr in stalled_transports)
+            for tr in list(subs):
+                tr.close(flush=tr not in stalled_transports)
+            for t in readers:
+                t.join(timeout=5)
+            wall = time.perf_counter() - wall_start
+            for s in sockets:
+                s.close()
+        else:
+            dropped = 0
+            for tr in subs:
+                mirror = StateMirror()
+                while not tr.queue.empty():
+                    mirror.receive(tr.queue.get_nowait())
+                mirrors.append(mirror)
+            wall = time.perf_counter() - wall_start
+
+        events = sync.version
+        results[strategy] = {
+            "events": events,
+            "bytes_total": counter.total,
+            "bytes_per_event": counter.total / events,
+            "bytes_per_sec": counter.total / wall,
+            "cpu_ms": cpu * 1000.0,
+            "cpu_us_per_event": cpu / events * 1e6,
+            "wall_ms": wall * 1000.0,
+            "slowest_publish_ms": slowest[0] * 1000.0,
+            "stalled_dropped": dropped,
+            "in_sync": all(m.state == sync.state for m in mirrors[-subscribers:]),
+        }
+    return results
+
+
+class _ByteCounter:
+    """Wraps transports' send() to count bytes leaving the publisher."""
+
+    def __init__(self, transports):
+        self.total = 0
+        for tr in transports:
+            original = tr.send
+
+            def counted(data, _orig=original):
+                self.total += len(data)
+                _orig(data)
+            tr.send = counted
+
+
+def _drain_socket(sock, mirror):
+    buffer = b""
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            break
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            mirror.receive(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks sync",
+                                     description="Benchmark delta state broadcast")
+    parser.add_argument("--subscribers", type=int, default=50)
+    parser.add_argument("--transport", choices=["queue", "socket"], default="queue")
+    parser.add_argument("--questions", type=int, default=200)
+    parser.add_argument("--stalled", type=int, default=0,
+                        help="extra socket clients that never read (with --transport socket)")
+    args = parser.parse_args(argv)
+
+    res = run_benchmark(args.subscribers, args.transport, args.questions, args.stalled)
+    print(f"[SYNC] {args.subscribers} subscribers over {args.transport}, "
+          f"{res['delta']['events']} state changes")
+    for name, r in res.items():
+        print(f"[SYNC] {name:>5}: {r['bytes_per_event']:8.0f} B/event | "
+              f"{r['bytes_per_sec'] / 1024:8.1f} KiB/s in {r['wall_ms']:7.1f} ms | "
+              f"CPU {r['cpu_us_per_event']:7.1f} us/event | slowest publish {r['slowest_publish_ms']:6.2f} ms | "
+              f"in sync: {r['in_sync']}")
+        if args.stalled:
+            print(f"[SYNC] {name:>5}: {r['stalled_dropped']}/{args.stalled} stalled clients dropped")
@@ -0,0 +1,81 @@
+"""
+Team setup: teams and players added one row (and one commit) at a time
+and read back with a players query per team, against DBManager.add_teams
+and get_teams_for_session.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from db_manager import DBManager
+
+
+def _fetch_teams_per_team(db, session_id):
+    """get_teams_for_session() as it was: one players query per team (for comparison)."""
+    conn = db.create_connection()
+    cursor = conn.cursor()
+    cursor.execute("SELECT id, team_name FROM teams WHERE session_id = ?;", (session_id,))
+    results = []
+    for team_id, team_name in cursor.fetchall():
+        cursor.execute("SELECT id, player_name FROM players WHERE team_id = ?;", (team_id,))
+        results.append({'team_id': team_id, 'team_name': team_name,
+                        'players': [{'id': p[0], 'player_name': p[1]} for p in cursor.fetchall()]})
+    conn.close()
+    return results
+
+
+def run_team_setup_benchmark(teams=100, players=5, sessions=20, db_name=None):
+    """
+    Sets up `teams` teams of `players` players in each of `sessions` new
+    sessions on a temporary database, per row (add_team/add_player_to_team,
+    a commit each, then one players query per team) and in bulk (add_teams,
+    get_teams_for_session). Reports milliseconds per session setup.
+    """
+    tmp = None
+    if db_name is None:
+        tmp = tempfile.TemporaryDirectory()
+        db_name = os.path.join(tmp.name, "teams.db")
+    db = DBManager(db_name)
+    group_id = db.insert_question_group("Teams")
+    names = [f"Team {i + 1}" for i in range(teams)]
+    rosters = [[f"Player {i + 1}.{j + 1}" for j in range(players)] for i in range(teams)]
+
+    def per_row(session_id):
+        for name, roster in zip(names, rosters):
+            team_id = db.add_team(session_id, name)
+            for player in roster:
+                db.add_player_to_team(team_id, player)
+            db.init_session_state(session_id, [team_id])
+        return _fetch_teams_per_team(db, session_id)
+
+    def bulk(session_id):
+        db.add_teams(session_id, names, rosters)
+        return db.get_teams_for_session(session_id)
+
+    results = {}
+    for label, setup in (("per row", per_row), ("bulk", bulk)):
+        elapsed = 0.0
+        for _ in range(sessions):
+            session_id = db.create_new_session(30, group_id)
+            start = time.perf_counter()
+            fetched = setup(session_id)
+            elapsed += time.perf_counter() - start
+            assert len(fetched) == teams and all(len(t['players']) == players for t in fetched)
+        results[label] = elapsed * 1000 / sessions
+    db.close()
+    if tmp is not None:
+        tmp.cleanup()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks teams",
+                                     description="Time setting up teams per row vs in bulk.")
+    parser.add_argument("--teams", type=int, default=100)
+    parser.add_argument("--players", type=int, default=5, help="players per team")
+    args = parser.parse_args(argv)
+
+    res = run_team_setup_benchmark(args.teams, args.players)
+    for label, ms in res.items():
+        print(f"[DB] {args.teams} teams x {args.players} players, {label:>7}: {ms:8.2f} ms per session")
@@ -0,0 +1,142 @@
+import time
+import pygame
+
+# Keys handed out to teams in roster order (team 1 -> "1", team 2 -> "2", ...)
+DEFAULT_BUZZER_KEYS = [
+    pygame.K_1, pygame.K_2, pygame.K_3,
+    pygame.K_4, pygame.K_5, pygame.K_6,
+    pygame.K_7, pygame.K_8, pygame.K_9,
+]
+
+# How long poll_until() sleeps between queue drains (seconds)
+POLL_INTERVAL = 0.0005
+
+
+class BuzzerArbiter:
+    """
+    Captures buzzer key presses and decides which team buzzed in first.
+
+    Every press is stamped when it is taken off the event queue. If the
+    event carries an SDL timestamp (``event.timestamp``, in ms) that value
+    is used instead, so the frame in which the event was read no longer
+    matters. Presses are compared by timestamp; exact ties go to the team
+    that has won the fewest buzzes so far, then to roster order.
+
+    Once a winner is resolved the arbiter disarms, which locks every other
+    team out until the next call to arm().
+    """
+
+    def __init__(self, clock=None):
+        self.clock = clock if clock else (lambda: time.perf_counter() * 1000.0)
+        self.key_map = {}       # { pygame key: team_id }
+        self.team_order = []    # team IDs in roster order, used for tie-breaks
+        self.win_counts = {}    # { team_id: buzzes won this session }
+        self.armed = False
+        self.winner_team_id = None
+        self.presses = []
+        self._seq = 0
+
+    # ----------------------------------------------------------------
+    #                          SETUP
+    # ----------------------------------------------------------------
+    def assign_keys(self, team_ids, keys=None):
+        """
+        Map buzzer keys to teams in roster order. Returns { team_id: key }.
+        """
+        keys = keys if keys else DEFAULT_BUZZER_KEYS
+        self.team_order = list(team_ids)
+        self.key_map = {k: t_id for k, t_id in zip(keys, self.team_order)}
+        self.win_counts = {t_id: 0 for t_id in self.team_order}
+        return {t_id: k for k, t_id in self.key_map.items()}
+
+    def key_name_for_team(self, team_id):
+        for key, t_id in self.key_map.items():
+            if t_id == team_id:
+                return pygame.key.name(key)
+        return None
+
+    # ----------------------------------------------------------------
+    #                          CAPTURE
+    # ----------------------------------------------------------------
+    def arm(self):
+        """Open the buzz window for a new question."""
+        self.armed = True
+        self.winner_team_id = None
+        self.presses = []
+
+    def disarm(self):
+        self.armed = False
+
+    def event_timestamp(self, event):
+        """
+        Returns the press time in ms: the SDL timestamp when the event has
+        one, otherwise the arbiter clock at the moment of capture.
+        """
+        ts = getattr(event, "timestamp", None)
+        if ts is not None:
+            return float(ts)
+        return self.clock()
+
+    def submit(self, event):
+        """
+        Record a KEYDOWN event if it is a buzzer press while armed.
+        Returns True if the event was consumed by the arbiter; keys pressed
+        while disarmed are left for the caller.
+        """
+        if not self.armed or event.type != pygame.KEYDOWN:
+            return False
+        team_id = self.key_map.get(event.key)
+        if team_id is None:
+            return False
+        self.presses.append((self.event_timestamp(event), self._seq, team_id))
+        self._seq += 1
+        return True
+
+    def capture(self):
+        """
+        Drain KEYDOWN events from the pygame queue into the arbiter.
+        Key presses that are not buzzers are posted back for the main loop.
+        """
+        leftovers = [e for e in pygame.event.get(pygame.KEYDOWN) if not self.submit(e)]
+        for event in leftovers:
+            pygame.event.post(event)
+        return self.resolve() if self.presses else None
+
+    def poll_until(self, deadline):
+        """
+        Poll the event queue until `deadline` (arbiter clock, ms) or until a
+        winner is found. Used in place of the frame sleep while armed so
+        presses are stamped within ~POLL_INTERVAL of arriving.
+        """
+        while self.armed and self.clock() < deadline:
+            if self.capture() is not None:
+                break
+            time.sleep(POLL_INTERVAL)
+        return self.winner_team_id
+
+    # ----------------------------------------------------------------
+    #                          ARBITRATION
+    # ----------------------------------------------------------------
+    def _tie_break_key(self, press):
+        timestamp, seq, team_id = press
+        try:
+            roster_idx = self.team_order.index(team_id)
+        except ValueError:
+            roster_idx = len(self.team_order)
+        return (timestamp, self.win_counts.get(team_id, 0), roster_idx, seq)
+
+    def resolve(self):
+        """
+        Pick the winner among the captured presses and lock out everyone else.
+        Returns the winning team_id or None if nobody has buzzed.
+        """
+        if self.winner_team_id is not None:
+            return self.winner_team_id
+        if not self.presses:
+            return None
+
+        first = min(self.presses, key=self._tie_break_key)
+        self.winner_team_id = first[2]
+        self.win_counts[self.winner_team_id] = self.win_counts.get(self.winner_team_id, 0) + 1
+        self.armed = False
+        return self.winner_team_id
@@ -1,38 +1,290 @@
+import json
+import queue
+import random
 import sqlite3
+import threading
+import time
+
+from question_model import build_bank
 
 DB_NAME = "clynboozle.db"
 
+# Stored in PRAGMA user_version once create_tables() has run; bump it whenever
+# the schema below changes so existing databases get the new tables/columns
+SCHEMA_VERSION = 3
+
+# Seconds a connection waits on a locked database before failing (busy_timeout)
+BUSY_TIMEOUT = 5.0
+# Write batches that still fail with "database is locked" are retried this
+# often, backing off exponentially (with jitter) from RETRY_DELAY up to RETRY_MAX_DELAY
+WRITE_RETRIES = 5
+RETRY_DELAY = 0.02
+RETRY_MAX_DELAY = 1.0
+# Most queued writes the writer thread groups into one transaction
+MAX_WRITE_BATCH = 64
+
+
+def is_busy_error(error):
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+def with_retries(fn, retries=WRITE_RETRIES, delay=RETRY_DELAY, max_delay=RETRY_MAX_DELAY):
+    """
+    Call fn(); while it fails with "database is locked" / "busy", sleep
+    and try again, doubling the delay, at most `retries` more times.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return fn()
+        except sqlite3.OperationalError as e:
+            if attempt == retries or not is_busy_error(e):
+                raise
+            time.sleep(min(delay * 2 ** attempt, max_delay) * (0.5 + random.random() / 2))
+
+
+class PooledConnection(sqlite3.Connection):
+    """
+    Connection handed out by a ConnectionPool: close() rolls back anything
+    uncommitted and puts it back in the pool instead of closing it.
+    """
+
+    pool = None
+
+    def close(self):
+        if self.pool is None or not self.pool.release(self):
+            super().close()
+
+
+class ConnectionPool:
+    """
+    Reuses SQLite connections so several GameLogic instances (one per
+    room) can share one DBManager without connecting on every query.
+    acquire() never blocks: when no idle connection is left it opens a
+    new one, and release() keeps at most `size` idle ones.
+    """
+
+    def __init__(self, connect, size=8):
+        self.connect = connect  # returns a new PooledConnection
+        self.size = size
+        self.idle = []
+        self.lock = threading.Lock()
+        self.acquired = 0
+        self.opened = 0
+
+    def acquire(self):
+        with self.lock:
+            self.acquired += 1
+            if self.idle:
+                return self.idle.pop()
+            self.opened += 1
+        conn = self.connect()
+        conn.pool = self
+        return conn
+
+    def release(self, conn):
+        """Take a connection back. Returns False if the pool is full."""
+        conn.rollback()
+        with self.lock:
+            if len(self.idle) >= self.size:
+                return False
+            self.idle.append(conn)
+            return True
+
+    def close_all(self):
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for conn in idle:
+            conn.pool = None
+            conn.close()
+
+
+class WriteJob:
+    def __init__(self, work):
+        self.work = work  # work(cursor) -> result
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class WriteQueue:
+    """
+    The single writer of a DBManager. Jobs are queued from any thread and
+    run in order on one connection by one thread, so writers never fight
+    each other for SQLite's lock. Whatever is queued when the writer wakes
+    up is grouped into one transaction (BEGIN IMMEDIATE ... COMMIT); each
+    job runs in its own savepoint, so a failing job only undoes itself.
+    A batch that hits a lock held by another process is retried with
+    backoff. submit() blocks until the job is committed.
+    """
+
+    def __init__(self, connect, max_batch=MAX_WRITE_BATCH, retries=WRITE_RETRIES):
+        self.connect = connect
+        self.max_batch = max_batch
+        self.retries = retries
+        self.jobs = queue.Queue()
+        self.thread = None
+        self.cursor = None  # the writer's cursor while a batch runs
+        self.lock = threading.Lock()
+        self.batches = 0
+        self.jobs_done = 0
+        self.attempts = 0
+
+    def submit(self, work):
+        if threading.current_thread() is self.thread:
+            # A job that writes through another DBManager method: same transaction
+            return work(self.cursor)
+        self._ensure_started()
+        job = WriteJob(work)
+        self.jobs.put(job)
+        job.done.wait()
+        if job.error is not None:
+            raise job.error
+        return job.result
+
+    def _ensure_started(self):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+                self.thread.start()
+
+    def close(self):
+        with self.lock:
+            thread = self.thread
+        if thread is not None and thread.is_alive():
+            self.jobs.put(None)
+            thread.join()
+
+    def _run(self):
+        conn = self.connect()
+        conn.isolation_level = None  # transactions are managed here
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        running = True
+        while running:
+            job = self.jobs.get()
+            if job is None:
+                break
+            batch = [job]
+            while len(batch) < self.max_batch:
+                try:
+                    job = self.jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    running = False
+                    break
+                batch.append(job)
+            try:
+                with_retries(lambda: self._commit(conn, batch), self.retries)
+            except Exception as e:
+                for job in batch:
+                    job.error = e
+            self.batches += 1
+            self.jobs_done += len(batch)
+            for job in batch:
+                job.done.set()
+        conn.close()
+
+    def _commit(self, conn, batch):
+        self.attempts += 1
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE;")
+        self.cursor = cursor
+        try:
+            for job in batch:
+                job.result, job.error = None, None
+                cursor.execute("SAVEPOINT job;")
+                try:
+                    job.result = job.work(cursor)
+                except sqlite3.OperationalError as e:
+                    if is_busy_error(e):
+                        raise
+                    job.error = e
+                except Exception as e:
+                    job.error = e
+                if job.error is not None:
+                    cursor.execute("ROLLBACK TO job;")
+                cursor.execute("RELEASE job;")
+            cursor.execute("COMMIT;")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK;")
+            raise
+        finally:
+            self.cursor = None
+
+
 class DBManager:
     """
     Manages the SQLite database connection and queries.
+
+    Safe to share between threads (and to run next to other processes on
+    the same file): the database is in WAL mode so reads run concurrently
+    on their own connections, and every write goes through one WriteQueue
+    thread that serializes and batches them. Connections wait up to
+    busy_timeout seconds on a lock, and write batches are retried with
+    backoff after that.
+
+    With pool_size, read connections come from a shared ConnectionPool
+    instead of being opened per call (see session_manager.py). Pass
+    check_schema=False to skip create_tables() here and call it later
+    (pygame_main.py does that on its startup thread).
     """
 
-    def __init__(self, db_name=DB_NAME):
+    def __init__(self, db_name=DB_NAME, pool_size=None, busy_timeout=BUSY_TIMEOUT, check_schema=True):
         self.db_name = db_name
-        self.create_tables()
+        self.busy_timeout = busy_timeout
+        self.pool = None
+        if pool_size:
+            self.pool = ConnectionPool(lambda: self._connect(PooledConnection), pool_size)
+        self.writer = WriteQueue(self._connect)
+        if check_schema:
+            self.create_tables()
 
     # ----------------------------------------------------------------
     #                          CONNECTIONS
     # ----------------------------------------------------------------
+    def _connect(self, factory=sqlite3.Connection):
+        return sqlite3.connect(
+            self.db_name, timeout=self.busy_timeout, factory=factory, check_same_thread=False
+        )
+
     def create_connection(self):
         """
-        Establishes a connection to the SQLite database.
-        Returns the connection object.
+        Establishes a connection to the SQLite database (or takes one from
+        the pool). Returns the connection object; close() it when done.
+        Use it for reads; writes go through _write().
         """
-        return sqlite3.connect(self.db_name)
+        if self.pool is not None:
+            return self.pool.acquire()
+        return self._connect()
+
+    def _write(self, work):
+        """
+        Run work(cursor) on the writer thread, inside a transaction, and
+        wait for it to be committed. Returns what work returned.
+        """
+        return self.writer.submit(work)
 
     def _exec_commit(self, sql, params=None):
         """
-        Helper method to connect, execute a single SQL, commit, and close.
-        Returns the cursor and connection if needed.
+        Helper method to execute a single SQL statement on the writer and
+        wait for the commit. Returns the cursor's lastrowid.
         """
         if params is None:
             params = ()
-        conn = self.create_connection()
-        cursor = conn.cursor()
-        cursor.execute(sql, params)
-        conn.commit()
-        return cursor, conn
+
+        def work(cursor):
+            cursor.execute(sql, params)
+            return cursor.lastrowid
+
+        return self._write(work)
+
+    def close(self):
+        """Stop the writer thread and close pooled connections."""
+        self.writer.close()
+        if self.pool is not None:
+            self.pool.close_all()
 
     # ----------------------------------------------------------------
     #                          TABLE CREATION
@@ -43,15 +295,31 @@ class DBManager:
           1. groups (id, group_name)
           2. questions (id, question, question_group_id, points, category, question_type, fill_in_blank_text)
           3. question_options (id, question_id, option_text, is_correct)
-          4. sessions (id, created_at, is_active, time_per_question, current_turn_team_id, question_group_id)
+          4. sessions (id, created_at, is_active, time_per_question, current_turn_team_id, question_group_id,
+                       game_mode, mode_options, question_pack)
           5. teams (id, session_id, team_name)
           6. players (id, team_id, player_name)
           7. session_state (id, session_id, team_id, score)
           8. session_questions (id, session_id, question_id, was_correct, answered_at)
+          9. session_events (id, session_id, seq, event_type, payload, created_at)
+         10. session_snapshots (id, session_id, seq, state, created_at)
+         11. question_stats (question_id, attempts, correct, last_seen, total_answer_seconds, timed_attempts)
+
+        Skipped when the file's user_version already equals SCHEMA_VERSION.
+        Returns True if the schema was created or migrated, False if it was
+        already up to date.
         """
         conn = self.create_connection()
         cursor = conn.cursor()
 
+        cursor.execute("PRAGMA user_version;")
+        if cursor.fetchone()[0] == SCHEMA_VERSION:
+            conn.close()
+            return False
+
+        # WAL: readers never block the writer (persists in the file)
+        cursor.execute("PRAGMA journal_mode=WAL;")
+
         # 1. groups table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS groups (
@@ -80,6 +348,12 @@ class DBManager:
         except sqlite3.OperationalError:
             pass  # Already exists, ignore
 
+        # Per-category decks are built from (question_group_id, category)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_questions_group_category
+            ON questions(question_group_id, category);
+        """)
+
         # 3. question_options table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS question_options (
@@ -105,6 +379,14 @@ class DBManager:
             );
         """)
 
+        # Attempt adding the game mode columns (see game_modes.py) if they didn't exist
+        # (and question_pack: the pack file a session plays from, see question_pack.py)
+        for column in ("game_mode TEXT DEFAULT 'random'", "mode_options TEXT", "question_pack TEXT"):
+            try:
+                cursor.execute(f"ALTER TABLE sessions ADD COLUMN {column};")
+            except sqlite3.OperationalError:
+                pass  # Already exists, ignore
+
         # 5. teams table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS teams (
@@ -114,6 +396,10 @@ class DBManager:
                 FOREIGN KEY(session_id) REFERENCES sessions(id)
             );
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_teams_session
+            ON teams(session_id);
+        """)
 
         # 6. players table
         cursor.execute("""
@@ -124,6 +410,10 @@ class DBManager:
                 FOREIGN KEY(team_id) REFERENCES teams(id)
             );
         """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_players_team
+            ON players(team_id);
+        """)
 
         # 7. session_state table
         cursor.execute("""
@@ -136,6 +426,11 @@ class DBManager:
                 FOREIGN KEY(team_id) REFERENCES teams(id)
             );
         """)
+        # Scores are read per session and updated per (session, team)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_session_state_session_team
+            ON session_state(session_id, team_id);
+        """)
 
         # 8. session_questions table
         cursor.execute("""
@@ -151,9 +446,59 @@ class DBManager:
                 UNIQUE(session_id, question_id)
             );
         """)
+
+        # Attempt adding answer_seconds (time from reveal to answer) if it didn't exist
+        try:
+            cursor.execute("ALTER TABLE session_questions ADD COLUMN answer_seconds REAL;")
+        except sqlite3.OperationalError:
+            pass  # Already exists, ignore
+
+        # 9. session_events table (append-only log, see session_log.py)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS session_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                event_type TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY(session_id) REFERENCES sessions(id),
+                UNIQUE(session_id, seq)
+            );
+        """)
+
+        # 10. session_snapshots table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS session_snapshots (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_id INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                state TEXT NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY(session_id) REFERENCES sessions(id),
+                UNIQUE(session_id, seq)
+            );
+        """)
+
+        # 11. question_stats table (per-question aggregates of session_questions)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS question_stats (
+                question_id INTEGER PRIMARY KEY,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                correct INTEGER NOT NULL DEFAULT 0,
+                last_seen TEXT,
+                total_answer_seconds REAL NOT NULL DEFAULT 0,
+                timed_attempts INTEGER NOT NULL DEFAULT 0,
+                FOREIGN KEY(question_id) REFERENCES questions(id)
+            );
+        """)
+
+        # Last, so an interrupted migration simply runs again next launch
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
         
         conn.commit()
         conn.close()
+        return True
 
     # ----------------------------------------------------------------
     #                          GROUPS + QUESTIONS
@@ -167,11 +512,27 @@ class DBManager:
             INSERT INTO groups (group_name)
             VALUES (?);
         """
-        cursor, conn = self._exec_commit(sql, (group_name,))
-        group_id = cursor.lastrowid
-        conn.close()
+        group_id = self._exec_commit(sql, (group_name,))
         return group_id
 
+    def get_question_groups(self):
+        """[(group_id, group_name), ...] in id order."""
+        conn = self.create_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, group_name FROM groups ORDER BY id ASC;")
+        groups = cursor.fetchall()
+        conn.close()
+        return groups
+
+    def get_question_group_name(self, question_group_id):
+        """The group's name, or None if there is no such group."""
+        conn = self.create_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT group_name FROM groups WHERE id = ?;", (question_group_id,))
+        row = cursor.fetchone()
+        conn.close()
+        return row[0] if row else None
+
     def insert_question(self, question_data):
         """
         Inserts a question record and any associated options.
@@ -213,21 +574,19 @@ class DBManager:
             question_data.get('question_type', 'multiple_choice')
         )
 
-        conn = self.create_connection()
-        cursor = conn.cursor()
-        cursor.execute(sql, params)
-        question_id = cursor.lastrowid
+        def work(cursor):
+            cursor.execute(sql, params)
+            question_id = cursor.lastrowid
 
-        if question_data.get('question_type') == 'multiple_choice':
-            for opt in question_data.get('options', []):
-                cursor.execute("""
-                    INSERT INTO question_options (question_id, option_text, is_correct)
-                    VALUES (?, ?, ?);
-                """, (question_id, opt["text"], 1 if opt["is_correct"] else 0))
+            if question_data.get('question_type') == 'multiple_choice':
+                for opt in question_data.get('options', []):
+                    cursor.execute("""
+                        INSERT INTO question_options (question_id, option_text, is_correct)
+                        VALUES (?, ?, ?);
+                    """, (question_id, opt["text"], 1 if opt["is_correct"] else 0))
+            return question_id
 
-        conn.commit()
-        conn.close()
-        return question_id
+        return self._write(work)
 
     def update_question(self, question_data):
         """
@@ -269,35 +628,33 @@ class DBManager:
             question_data.get('question_id')
         )
 
-        conn = self.create_connection()
-        cursor = conn.cursor()
-        cursor.execute(sql_update, params)
-
-        # If multiple-choice, update the options
-        if question_data.get('question_type') == 'multiple_choice':
-            cursor.execute("""
-                DELETE FROM question_options
-                WHERE question_id = ?;
-            """, (question_data["question_id"],))
+        def work(cursor):
+            cursor.execute(sql_update, params)
 
-            for opt in question_data.get('options', []):
+            # If multiple-choice, update the options
+            if question_data.get('question_type') == 'multiple_choice':
                 cursor.execute("""
-                    INSERT INTO question_options (question_id, option_text, is_correct)
-                    VALUES (?, ?, ?);
-                """, (
-                    question_data["question_id"],
-                    opt["text"],
-                    1 if opt["is_correct"] else 0
-                ))
-        else:
-            # If not multiple_choice, remove existing options if any
-            cursor.execute("""
-                DELETE FROM question_options
-                WHERE question_id = ?;
-            """, (question_data["question_id"],))
+                    DELETE FROM question_options
+                    WHERE question_id = ?;
+                """, (question_data["question_id"],))
+
+                for opt in question_data.get('options', []):
+                    cursor.execute("""
+                        INSERT INTO question_options (question_id, option_text, is_correct)
+                        VALUES (?, ?, ?);
+                    """, (
+                        question_data["question_id"],
+                        opt["text"],
+                        1 if opt["is_correct"] else 0
+                    ))
+            else:
+                # If not multiple_choice, remove existing options if any
+                cursor.execute("""
+                    DELETE FROM question_options
+                    WHERE question_id = ?;
+                """, (question_data["question_id"],))
 
-        conn.commit()
-        conn.close()
+        self._write(work)
 
     def get_question(self, question_id):
         """
@@ -351,7 +708,7 @@ class DBManager:
         Fetches all questions for a particular group (basic info).
         """
         sql = """
-            SELECT id, question
+            SELECT id, question, points
             FROM questions
             WHERE question_group_id = ?;
         """
@@ -360,29 +717,31 @@ class DBManager:
         cursor.execute(sql, (question_group_id,))
         rows = cursor.fetchall()
         conn.close()
-        return [{'id': r[0], 'question': r[1]} for r in rows]
+        return [{'id': r[0], 'question': r[1], 'points': r[2]} for r in rows]
 
     def delete_question(self, question_id):
         """
         Deletes a question and all its options.
         """
-        conn = self.create_connection()
-        cursor = conn.cursor()
+        def work(cursor):
+            # Delete options first
+            cursor.execute("""
+                DELETE FROM question_options
+                WHERE question_id = ?;
+            """, (question_id,))
 
-        # Delete options first
-        cursor.execute("""
-            DELETE FROM question_options
-            WHERE question_id = ?;
-        """, (question_id,))
+            cursor.execute("""
+                DELETE FROM question_stats
+                WHERE question_id = ?;
+            """, (question_id,))
 
-        # Then the question itself
-        cursor.execute("""
-            DELETE FROM questions
-            WHERE id = ?;
-        """, (question_id,))
+            # Then the question itself
+            cursor.execute("""
+                DELETE FROM questions
+                WHERE id = ?;
+            """, (question_id,))
 
-        conn.commit()
-        conn.close()
+        self._write(work)
 
     def get_random_question(self, question_group_id, session_id):
         """
@@ -452,33 +811,154 @@ class DBManager:
         """
         Deletes a group and all associated questions (and their options).
         """
-        # 1. Find all questions for this group
-        questions = self.get_questions_for_question_group(question_group_id)
+        def work(cursor):
+            # 1. Find all questions for this group
+            cursor.execute("""
+                SELECT id
+                FROM questions
+                WHERE question_group_id = ?;
+            """, (question_group_id,))
+            question_ids = [r[0] for r in cursor.fetchall()]
+
+            # 2. Delete options and stats for each question
+            for q_id in question_ids:
+                cursor.execute("""
+                    DELETE FROM question_options
+                    WHERE question_id = ?;
+                """, (q_id,))
+                cursor.execute("""
+                    DELETE FROM question_stats
+                    WHERE question_id = ?;
+                """, (q_id,))
+
+            # 3. Delete questions
+            cursor.execute("""
+                DELETE FROM questions
+                WHERE question_group_id = ?;
+            """, (question_group_id,))
+
+            # 4. Delete the group itself
+            cursor.execute("""
+                DELETE FROM groups
+                WHERE id = ?;
+            """, (question_group_id,))
+
+        self._write(work)
 
+    # ----------------------------------------------------------------
+    #                          QUESTION STATS
+    # ----------------------------------------------------------------
+    def get_question_stats_for_group(self, question_group_id):
+        """
+        Returns { question_id: { attempts, correct, correct_rate, last_seen,
+        avg_answer_seconds } } for questions of the group that have been
+        answered at least once. Reads question_stats only.
+        """
         conn = self.create_connection()
         cursor = conn.cursor()
+        cursor.execute("""
+            SELECT qs.question_id, qs.attempts, qs.correct, qs.last_seen,
+                   qs.total_answer_seconds, qs.timed_attempts
+            FROM question_stats qs
+            JOIN questions q ON q.id = qs.question_id
+            WHERE q.question_group_id = ? AND qs.attempts > 0;
+        """, (question_group_id,))
+        rows = cursor.fetchall()
+        conn.close()
+        return {
+            r[0]: {
+                'attempts': r[1],
+                'correct': r[2],
+                'correct_rate': r[2] / r[1],
+                'last_seen': r[3],
+                'avg_answer_seconds': r[4] / r[5] if r[5] else None,
+            }
+            for r in rows
+        }
 
-        # 2. Delete options for each question
-        for q in questions:
-            cursor.execute("""
-                DELETE FROM question_options
-                WHERE question_id = ?;
-            """, (q["id"],))
+    def get_session_question_bank(self, session_id, question_group_id):
+        """
+        Every question of the group not yet answered in the session, with
+        options and stats. Game modes preload this once so nothing is
+        fetched per question (see get_question_bank for the fields).
+        """
+        answered = self.get_answered_question_ids(session_id)
+        return [q for q in self.get_question_bank(question_group_id) if q['id'] not in answered]
 
-        # 3. Delete questions
+    def get_question_bank(self, question_group_id):
+        """
+        Every question of the group with options and stats, in two queries,
+        as compact Question objects (see question_model.py) that read like
+        question dicts:
+        [{ id, question_group_id, question, fill_in_blank_text, points,
+           category, question_type, options, attempts, correct }, ...]
+        Walks the (question_group_id, category) index.
+        """
+        conn = self.create_connection()
+        cursor = conn.cursor()
         cursor.execute("""
-            DELETE FROM questions
-            WHERE question_group_id = ?;
+            SELECT
+                q.id, q.question_group_id, q.question, q.fill_in_blank_text,
+                q.points, q.category, q.question_type,
+                COALESCE(qs.attempts, 0), COALESCE(qs.correct, 0)
+            FROM questions q
+            LEFT JOIN question_stats qs ON qs.question_id = q.id
+            WHERE q.question_group_id = ?
+            ORDER BY q.category, q.id;
         """, (question_group_id,))
+        question_rows = cursor.fetchall()
 
-        # 4. Delete the group itself
         cursor.execute("""
-            DELETE FROM groups
-            WHERE id = ?;
+            SELECT o.question_id, o.id, o.option_text, o.is_correct
+            FROM question_options o
+            JOIN questions q ON q.id = o.question_id
+            WHERE q.question_group_id = ?
+            ORDER BY o.id;
         """, (question_group_id,))
+        option_rows = cursor.fetchall()
 
-        conn.commit()
         conn.close()
+        return build_bank(question_rows, option_rows)
+
+    def get_answered_question_ids(self, session_id):
+        """Set of question ids already answered in the session."""
+        conn = self.create_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT question_id
+            FROM session_questions
+            WHERE session_id = ? AND was_correct IS NOT NULL;
+        """, (session_id,))
+        answered = {r[0] for r in cursor.fetchall()}
+        conn.close()
+        return answered
+
+    def rebuild_question_stats(self):
+        """
+        Recomputes question_stats from the full session_questions history in
+        one bulk statement. Returns the number of questions with stats.
+        """
+        def work(cursor):
+            cursor.execute("DELETE FROM question_stats;")
+            cursor.execute("""
+                INSERT INTO question_stats
+                    (question_id, attempts, correct, last_seen, total_answer_seconds, timed_attempts)
+                SELECT
+                    sq.question_id,
+                    COUNT(*),
+                    SUM(CASE WHEN sq.was_correct THEN 1 ELSE 0 END),
+                    MAX(sq.answered_at),
+                    COALESCE(SUM(sq.answer_seconds), 0),
+                    COUNT(sq.answer_seconds)
+                FROM session_questions sq
+                JOIN questions q ON q.id = sq.question_id
+                JOIN sessions s ON s.id = sq.session_id AND s.question_pack IS NULL
+                WHERE sq.was_correct IS NOT NULL
+                GROUP BY sq.question_id;
+            """)
+            return cursor.rowcount
+
+        return self._write(work)
 
     # ----------------------------------------------------------------
     #                          SESSIONS
@@ -492,9 +972,7 @@ class DBManager:
             INSERT INTO sessions (time_per_question, is_active, question_group_id)
             VALUES (?, 1, ?);
         """
-        cursor, conn = self._exec_commit(sql, (time_per_question, question_group_id))
-        sid = cursor.lastrowid
-        conn.close()
+        sid = self._exec_commit(sql, (time_per_question, question_group_id))
         return sid
 
     def get_session(self, session_id):
@@ -504,7 +982,8 @@ class DBManager:
         sql = """
             SELECT
                 id, created_at, is_active, time_per_question,
-                current_turn_team_id, question_group_id
+                current_turn_team_id, question_group_id,
+                game_mode, mode_options, question_pack
             FROM sessions
             WHERE id = ?;
         """
@@ -523,9 +1002,32 @@ class DBManager:
             'is_active': bool(row[2]),
             'time_per_question': row[3],
             'current_turn_team_id': row[4],
-            'question_group_id': row[5]
+            'question_group_id': row[5],
+            'game_mode': row[6] or 'random',
+            'mode_options': json.loads(row[7]) if row[7] else {},
+            'question_pack': row[8]
         }
 
+    def get_latest_resumable_session(self):
+        """
+        Returns the ID of the newest active session that has teams,
+        or None if there is nothing to resume.
+        """
+        sql = """
+            SELECT s.id
+            FROM sessions s
+            WHERE s.is_active = 1
+            AND EXISTS (SELECT 1 FROM teams t WHERE t.session_id = s.id)
+            ORDER BY s.id DESC
+            LIMIT 1;
+        """
+        conn = self.create_connection()
+        cursor = conn.cursor()
+        cursor.execute(sql)
+        row = cursor.fetchone()
+        conn.close()
+        return row[0] if row else None
+
     def update_session_status(self, session_id, is_active):
         """
         Marks a session active/inactive.
@@ -545,9 +1047,7 @@ class DBManager:
             INSERT INTO teams (session_id, team_name)
             VALUES (?, ?);
         """
-        cursor, conn = self._exec_commit(sql, (session_id, team_name))
-        team_id = cursor.lastrowid
-        conn.close()
+        team_id = self._exec_commit(sql, (session_id, team_name))
         return team_id
 
     def add_player_to_team(self, team_id, player_name):
@@ -555,45 +1055,74 @@ class DBManager:
             INSERT INTO players (team_id, player_name)
             VALUES (?, ?);
         """
-        cursor, conn = self._exec_commit(sql, (team_id, player_name))
-        player_id = cursor.lastrowid
-        conn.close()
+        player_id = self._exec_commit(sql, (team_id, player_name))
         return player_id
 
+    def add_teams(self, session_id, team_names, rosters=None):
+        """
+        Adds several teams to a session in one transaction: the teams, their
+        players (rosters[i] lists the player names of team_names[i]) and a
+        session_state row with score 0 for each. Returns the new teams,
+        shaped like get_teams_for_session().
+        """
+        if not team_names:
+            return []
+        rosters = rosters or [[] for _ in team_names]
+
+        def work(cursor):
+            cursor.executemany("""
+                INSERT INTO teams (session_id, team_name)
+                VALUES (?, ?);
+            """, [(session_id, name) for name in team_names])
+            # The writer thread is the only writer, so our rows are the session's newest
+            cursor.execute("""
+                SELECT id
+                FROM teams
+                WHERE session_id = ?
+                ORDER BY id DESC
+                LIMIT ?;
+            """, (session_id, len(team_names)))
+            team_ids = [row[0] for row in reversed(cursor.fetchall())]
+            cursor.executemany("""
+                INSERT INTO players (team_id, player_name)
+                VALUES (?, ?);
+            """, [(t_id, player) for t_id, roster in zip(team_ids, rosters) for player in roster])
+            cursor.executemany("""
+                INSERT INTO session_state (session_id, team_id, score)
+                VALUES (?, ?, 0);
+            """, [(session_id, t_id) for t_id in team_ids])
+            return self._fetch_teams(cursor, "t.session_id = ? AND t.id >= ?", (session_id, team_ids[0]))
+
+        return self._write(work)
+
     def get_teams_for_session(self, session_id):
         """
         Returns a list of teams in this session, each with a list of players.
         """
         conn = self.create_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT id, team_name
-            FROM teams
-            WHERE session_id = ?;
-        """, (session_id,))
-        team_rows = cursor.fetchall()
+        results = self._fetch_teams(conn.cursor(), "t.session_id = ?", (session_id,))
+        conn.close()
+        return results
 
+    def _fetch_teams(self, cursor, where, params):
+        """Teams matching `where` (on teams t) with their players, in one JOIN."""
+        cursor.execute(f"""
+            SELECT t.id, t.team_name, p.id, p.player_name
+            FROM teams t
+            LEFT JOIN players p ON p.team_id = t.id
+            WHERE {where}
+            ORDER BY t.id, p.id;
+        """, params)
         results = []
-        for (team_id, team_name) in team_rows:
-            # get players
-            cursor.execute("""
-                SELECT id, player_name
-                FROM players
-                WHERE team_id = ?;
-            """, (team_id,))
-            player_rows = cursor.fetchall()
-            players = [
-                {'id': p[0], 'player_name': p[1]}
-                for p in player_rows
-            ]
-            results.append({
-                'team_id': team_id,
-                'team_name': team_name,
-                'players': players
-            })
-
-        conn.close()
+        for team_id, team_name, player_id, player_name in cursor.fetchall():
+            if not results or results[-1]['team_id'] != team_id:
+                results.append({
+                    'team_id': team_id,
+                    'team_name': team_name,
+                    'players': []
+                })
+            if player_id is not None:
+                results[-1]['players'].append({'id': player_id, 'player_name': player_name})
         return results
 
     # ----------------------------------------------------------------
@@ -603,15 +1132,13 @@ class DBManager:
         """
         Inserts rows into session_state for each team with score=0.
         """
-        conn = self.create_connection()
-        cursor = conn.cursor()
-        for t_id in team_ids:
-            cursor.execute("""
+        def work(cursor):
+            cursor.executemany("""
                 INSERT INTO session_state (session_id, team_id, score)
                 VALUES (?, ?, 0);
-            """, (session_id, t_id))
-        conn.commit()
-        conn.close()
+            """, [(session_id, t_id) for t_id in team_ids])
+
+        self._write(work)
 
     def get_session_state(self, session_id):
         """
@@ -655,6 +1182,27 @@ class DBManager:
         """
         self._exec_commit(sql, (new_score, session_id, team_id))
 
+    def adjust_score(self, session_id, team_id, delta):
+        """
+        Adds `delta` to a team's score in place (score = score + ?) and
+        returns the new score.
+        """
+        def work(cursor):
+            cursor.execute("""
+                UPDATE session_state
+                SET score = score + ?
+                WHERE session_id = ? AND team_id = ?;
+            """, (delta, session_id, team_id))
+            cursor.execute("""
+                SELECT score
+                FROM session_state
+                WHERE session_id = ? AND team_id = ?;
+            """, (session_id, team_id))
+            row = cursor.fetchone()
+            return row[0] if row else None
+
+        return self._write(work)
+
     def update_current_turn(self, session_id, next_team_id):
         sql = """
             UPDATE sessions
@@ -663,19 +1211,65 @@ class DBManager:
         """
         self._exec_commit(sql, (next_team_id, session_id))
 
-    def mark_question_answered(self, session_id, question_id, was_correct):
-        """Records that a question was answered in the session."""
-        sql = """
+    def mark_question_answered(self, session_id, question_id, was_correct, answer_seconds=None):
+        """
+        Records that a question was answered in the session and folds the
+        answer into question_stats in the same transaction (except for
+        sessions playing from a question pack). Re-marking a question only
+        corrects its earlier result.
+        """
+        def work(cursor):
+            self._record_answer(cursor, session_id, question_id, was_correct, answer_seconds)
+
+        self._write(work)
+
+    def _record_answer(self, cursor, session_id, question_id, was_correct, answer_seconds):
+        cursor.execute("""
+            SELECT was_correct
+            FROM session_questions
+            WHERE session_id = ? AND question_id = ?;
+        """, (session_id, question_id))
+        row = cursor.fetchone()
+        previous = row[0] if row else None
+
+        cursor.execute("""
             INSERT INTO session_questions 
-                (session_id, question_id, was_correct, answered)
-            VALUES (?, ?, ?, 1)
+                (session_id, question_id, was_correct, answered, answer_seconds)
+            VALUES (?, ?, ?, 1, ?)
             ON CONFLICT(session_id, question_id) 
             DO UPDATE SET 
-                was_correct = ?,
+                was_correct = excluded.was_correct,
                 answered = 1,
-                answered_at = CURRENT_TIMESTAMP;
-        """
-        self._exec_commit(sql, (session_id, question_id, was_correct, was_correct))
+                answered_at = CURRENT_TIMESTAMP,
+                answer_seconds = excluded.answer_seconds;
+        """, (session_id, question_id, was_correct, answer_seconds))
+
+        # Questions played from a pack aren't in `questions`; keep their ids out of the stats
+        cursor.execute("SELECT question_pack FROM sessions WHERE id = ?;", (session_id,))
+        row = cursor.fetchone()
+        if row and row[0]:
+            return
+
+        if previous is None:
+            timed = 1 if answer_seconds is not None else 0
+            cursor.execute("""
+                INSERT INTO question_stats
+                    (question_id, attempts, correct, last_seen, total_answer_seconds, timed_attempts)
+                VALUES (?, 1, ?, CURRENT_TIMESTAMP, ?, ?)
+                ON CONFLICT(question_id)
+                DO UPDATE SET
+                    attempts = attempts + 1,
+                    correct = correct + excluded.correct,
+                    last_seen = CURRENT_TIMESTAMP,
+                    total_answer_seconds = total_answer_seconds + excluded.total_answer_seconds,
+                    timed_attempts = timed_attempts + excluded.timed_attempts;
+            """, (question_id, 1 if was_correct else 0, answer_seconds or 0.0, timed))
+        else:
+            cursor.execute("""
+                UPDATE question_stats
+                SET correct = correct + ?, last_seen = CURRENT_TIMESTAMP
+                WHERE question_id = ?;
+            """, ((1 if was_correct else 0) - (1 if previous else 0), question_id))
 
     def any_questions_left_for_session(self, session_id, question_group_id):
         """
@@ -701,27 +1295,176 @@ class DBManager:
         conn.close()
         return row is not None
 
-    def create_new_session(self, time_per_question, question_group_id):
-        """Creates a new session and initializes session questions."""
+    def create_new_session(self, time_per_question, question_group_id, game_mode="random", mode_options=None,
+                           question_pack=None):
+        """
+        Creates a new session and initializes session questions. With
+        question_pack (a pack file path) the questions come from the pack
+        and question_group_id is None.
+        """
+        def work(cursor):
+            # Create the session
+            cursor.execute("""
+                INSERT INTO sessions
+                    (time_per_question, question_group_id, is_active, game_mode, mode_options, question_pack)
+                VALUES (?, ?, 1, ?, ?, ?);
+            """, (time_per_question, question_group_id, game_mode, json.dumps(mode_options or {}), question_pack))
+
+            session_id = cursor.lastrowid
+
+            # Initialize questions for this session
+            cursor.execute("""
+                INSERT INTO session_questions (session_id, question_id, was_correct, answered)
+                SELECT ?, id, NULL, 0
+                FROM questions
+                WHERE question_group_id = ?;
+            """, (session_id, question_group_id))
+            return session_id
+
+        return self._write(work)
+
+    def restore_session_state(self, session_id, scores, current_turn_team_id, answered):
+        """
+        Overwrites the materialized session tables (session_state, sessions,
+        session_questions) with state rebuilt from the event log, in one
+        transaction. `answered` is { question_id: was_correct }. Answers only
+        the log had are recorded as mark_question_answered would, so
+        question_stats counts them too.
+        """
+        def work(cursor):
+            cursor.execute("""
+                SELECT question_id, was_correct
+                FROM session_questions
+                WHERE session_id = ? AND was_correct IS NOT NULL;
+            """, (session_id,))
+            stored = dict(cursor.fetchall())
+            for q_id, was_correct in answered.items():
+                if q_id not in stored or bool(stored[q_id]) != bool(was_correct):
+                    self._record_answer(cursor, session_id, q_id, was_correct, None)
+
+            cursor.executemany("""
+                UPDATE session_state
+                SET score = ?
+                WHERE session_id = ? AND team_id = ?;
+            """, [(score, session_id, t_id) for t_id, score in scores.items()])
+            cursor.execute("""
+                UPDATE sessions
+                SET current_turn_team_id = ?
+                WHERE id = ?;
+            """, (current_turn_team_id, session_id))
+
+        self._write(work)
+
+    def record_answer_batch(self, session_id, events, answers, scores, current_turn_team_id):
+        """
+        Writes play that was held in memory (a lightning streak) in one
+        transaction: the log events, the answers (with question_stats, as in
+        mark_question_answered), every team's score and the current turn.
+        events: [(seq, event_type, payload), ...]
+        answers: [(question_id, was_correct, answer_seconds), ...]
+        """
+        def work(cursor):
+            cursor.executemany("""
+                INSERT INTO session_events (session_id, seq, event_type, payload)
+                VALUES (?, ?, ?, ?);
+            """, [(session_id, seq, event_type, json.dumps(payload)) for seq, event_type, payload in events])
+            for question_id, was_correct, answer_seconds in answers:
+                self._record_answer(cursor, session_id, question_id, was_correct, answer_seconds)
+            cursor.executemany("""
+                UPDATE session_state
+                SET score = ?
+                WHERE session_id = ? AND team_id = ?;
+            """, [(score, session_id, t_id) for t_id, score in scores.items()])
+            cursor.execute("""
+                UPDATE sessions
+                SET current_turn_team_id = ?
+                WHERE id = ?;
+            """, (current_turn_team_id, session_id))
+
+        self._write(work)
+
+    # ----------------------------------------------------------------
+    #                     SESSION EVENT LOG
+    # ----------------------------------------------------------------
+    def append_session_event(self, session_id, seq, event_type, payload):
+        """Appends one event to a session's log (see session_log.py)."""
+        sql = """
+            INSERT INTO session_events (session_id, seq, event_type, payload)
+            VALUES (?, ?, ?, ?);
+        """
+        self._exec_commit(sql, (session_id, seq, event_type, json.dumps(payload)))
+
+    def get_session_events(self, session_id, after_seq=0):
+        """
+        Returns [(seq, event_type, payload), ...] for events after `after_seq`, in order.
+        """
         conn = self.create_connection()
         cursor = conn.cursor()
-        
-        # Create the session
         cursor.execute("""
-            INSERT INTO sessions (time_per_question, question_group_id, is_active)
-            VALUES (?, ?, 1);
-        """, (time_per_question, question_group_id))
-        
-        session_id = cursor.lastrowid
-        
-        # Initialize questions for this session
+            SELECT seq, event_type, payload
+            FROM session_events
+            WHERE session_id = ? AND seq > ?
+            ORDER BY seq ASC;
+        """, (session_id, after_seq))
+        rows = cursor.fetchall()
+        conn.close()
+        return [(r[0], r[1], json.loads(r[2])) for r in rows]
+
+    def get_recent_session_events(self, session_id, event_types, limit=20):
+        """
+        Returns the newest events of the given types, newest first:
+        [(seq, event_type, payload, created_at), ...]
+        """
+        placeholders = ", ".join("?" for _ in event_types)
+        conn = self.create_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT seq, event_type, payload, created_at
+            FROM session_events
+            WHERE session_id = ? AND event_type IN ({placeholders})
+            ORDER BY seq DESC
+            LIMIT ?;
+        """, (session_id, *event_types, limit))
+        rows = cursor.fetchall()
+        conn.close()
+        return [(r[0], r[1], json.loads(r[2]), r[3]) for r in rows]
+
+    def save_session_snapshot(self, session_id, seq, state):
+        sql = """
+            INSERT OR REPLACE INTO session_snapshots (session_id, seq, state)
+            VALUES (?, ?, ?);
+        """
+        self._exec_commit(sql, (session_id, seq, json.dumps(state)))
+
+    def get_latest_session_snapshot(self, session_id):
+        """
+        Returns (seq, state) of the newest snapshot, or None.
+        """
+        conn = self.create_connection()
+        cursor = conn.cursor()
         cursor.execute("""
-            INSERT INTO session_questions (session_id, question_id, was_correct, answered)
-            SELECT ?, id, NULL, 0
-            FROM questions
-            WHERE question_group_id = ?;
-        """, (session_id, question_group_id))
-        
-        conn.commit()
+            SELECT seq, state
+            FROM session_snapshots
+            WHERE session_id = ?
+            ORDER BY seq DESC
+            LIMIT 1;
+        """, (session_id,))
+        row = cursor.fetchone()
         conn.close()
-        return session_id
\ No newline at end of file
+        return (row[0], json.loads(row[1])) if row else None
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Database maintenance.")
+    parser.add_argument("--db", default=DB_NAME, help="database file")
+    parser.add_argument("--rebuild-stats", action="store_true",
+                        help="recompute question_stats from the answer history")
+    args = parser.parse_args()
+
+    if args.rebuild_stats:
+        count = DBManager(args.db).rebuild_question_stats()
+        print(f"[DB] Rebuilt stats for {count} questions")
+    else:
+        parser.print_help()
@@ -1,5 +1,10 @@
+import time
+
 import pygame
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional
+
+# A window resize is applied once its size has held still this long
+RESIZE_SETTLE_MS = 200
 
 class DisplayManager:
     def __init__(self):
@@ -16,45 +21,180 @@ class DisplayManager:
         self.scale_x = 1.0
         self.scale_y = 1.0
         
+        # Fixed-resolution mode (set_base_resolution): screens draw into an
+        # offscreen base-size surface that present() scales into the window
+        self.fixed_resolution = False
+        self.offset = (0, 0)  # top-left of the scaled frame in the window
+        self.last_frame = None  # pixels last scaled into the window
+        
+        # Resizes are coalesced: request_resize() notes the size and
+        # settle_resize() applies it once dragging stops
+        self.pending_size = None
+        self.resize_requested_at = 0.0
+        self.set_mode_calls = 0  # instrumentation: display surfaces created
+        
         # Initialize the display
         self.update_display_size()
     
     def update_display_size(self, custom_width=None, custom_height=None):
         """Update the display size and scaling factors."""
         if custom_width and custom_height:
-            self.current_width = custom_width
-            self.current_height = custom_height
+            width, height = custom_width, custom_height
         else:
             # Default to 80% of screen size if no custom size
-            self.current_width = int(self.native_width * 0.8)
-            self.current_height = int(self.native_height * 0.8)
-        
-        # Update scale factors
-        self.scale_x = self.current_width / self.base_width
-        self.scale_y = self.current_height / self.base_height
+            width = int(self.native_width * 0.8)
+            height = int(self.native_height * 0.8)
         
         # Set the new display mode
-        self.screen = pygame.display.set_mode((self.current_width, self.current_height), pygame.RESIZABLE)
+        self.window = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+        self.set_mode_calls += 1
+        self.window_width, self.window_height = width, height
+        self.pending_size = None
+        
+        if self.fixed_resolution:
+            # Layout stays at the base size; only the final scale changes
+            self._fit_frame()
+        else:
+            self.current_width, self.current_height = width, height
+            self.scale_x = self.current_width / self.base_width
+            self.scale_y = self.current_height / self.base_height
+            self.offset = (0, 0)
+            self.screen = self.window
         return self.screen
     
+    def set_base_resolution(self, width: int, height: int):
+        """
+        Switch to fixed-resolution rendering: every screen is laid out and
+        drawn at width x height, whatever the window size, and present()
+        scales the finished frame into the window (letterboxed to keep the
+        aspect ratio). Draw cost no longer grows with the window, and a
+        screen looks the same on every display.
+        """
+        self.fixed_resolution = True
+        self.base_width, self.base_height = width, height
+        self.current_width, self.current_height = width, height
+        self.screen = pygame.Surface((width, height)).convert()
+        self._fit_frame()
+        return self.screen
+    
+    def request_resize(self, width: int, height: int, now: Optional[float] = None):
+        """
+        Note a window resize (VIDEORESIZE) without re-creating the display.
+        Until settle_resize() applies it, screens keep drawing at the old
+        size and present() scales that frame into the resized window, so
+        dragging an edge doesn't rebuild the display and layout caches
+        dozens of times a second.
+        """
+        self.pending_size = (width, height)
+        self.resize_requested_at = time.perf_counter() if now is None else now
+        if not self.fixed_resolution and self.screen is self.window:
+            # Hold on to the old size in an offscreen frame
+            self.screen = pygame.Surface((self.current_width, self.current_height)).convert()
+        # SDL has usually resized the window surface already
+        self.window = pygame.display.get_surface()
+        self.window_width, self.window_height = self.window.get_size()
+        self._fit_frame()
+    
+    def settle_resize(self, now: Optional[float] = None) -> bool:
+        """
+        Apply a pending resize once no new one came for RESIZE_SETTLE_MS:
+        one set_mode for the final size. Returns True when it did, so the
+        caller rebuilds its layout (once per settled size).
+        """
+        if self.pending_size is None:
+            return False
+        now = time.perf_counter() if now is None else now
+        if (now - self.resize_requested_at) * 1000 < RESIZE_SETTLE_MS:
+            return False
+        self.update_display_size(*self.pending_size)
+        return True
+    
+    @property
+    def scaling(self) -> bool:
+        """True while `screen` is an offscreen frame present() scales into the window."""
+        return self.fixed_resolution or self.pending_size is not None
+    
+    def _fit_frame(self):
+        """Scale and offset of the offscreen frame inside the current window."""
+        frame_width, frame_height = self.screen.get_size() if self.pending_size else (self.base_width, self.base_height)
+        scale = min(self.window_width / frame_width, self.window_height / frame_height)
+        self.frame_scale = scale
+        if self.fixed_resolution:
+            self.scale_x = self.scale_y = scale
+        frame_size = (max(1, round(frame_width * scale)), max(1, round(frame_height * scale)))
+        self.offset = ((self.window_width - frame_size[0]) // 2, (self.window_height - frame_size[1]) // 2)
+        self.frame_rect = pygame.Rect(self.offset, frame_size)
+        # Whole-number zoom (e.g. 720p on a 4K projector) keeps pixels sharp
+        self.integer_scale = (frame_size[0] % frame_width == 0 and
+                              frame_size[0] // frame_width == frame_size[1] // frame_height and
+                              frame_size[1] % frame_height == 0)
+        # Letterbox bars only change with the window; the frame is redrawn
+        self.window.fill((0, 0, 0))
+        self.last_frame = None
+    
+    def present(self, rects=None):
+        """
+        Put the frame on the window and flip. In fixed mode (or while a
+        resize settles) that is one scale pass, skipped when the frame is
+        the same as last time (menus and questions sit still for most
+        frames; comparing the frame's pixels is far cheaper than scaling
+        them to 4K).
+        
+        `rects`: only these areas changed (e.g. Animator.dirty_rects()),
+        so only they are sent to the display; [] sends nothing.
+        """
+        if rects is not None and not self.scaling:
+            if rects:
+                pygame.display.update(rects)
+            return
+        if self.scaling:
+            pixels = self.screen.get_view("1").raw
+            if pixels != self.last_frame:
+                self.last_frame = pixels
+                self._scale_frame()
+        pygame.display.flip()
+    
+    def _scale_frame(self):
+        frame = self.window.subsurface(self.frame_rect)
+        if self.frame_rect.size == self.screen.get_size():
+            frame.blit(self.screen, (0, 0))
+        elif self.integer_scale:
+            pygame.transform.scale(self.screen, self.frame_rect.size, frame)
+        else:
+            pygame.transform.smoothscale(self.screen, self.frame_rect.size, frame)
+    
+    def map_pos(self, pos) -> Tuple[int, int]:
+        """A window position (mouse) in the coordinates screens draw in."""
+        if not self.scaling:
+            return pos
+        # Same as unscale_pos in fixed mode, and also right mid-resize
+        return (int((pos[0] - self.offset[0]) / self.frame_scale),
+                int((pos[1] - self.offset[1]) / self.frame_scale))
+    
+    def map_event(self, event):
+        """The event with its mouse position mapped through map_pos."""
+        if not self.scaling or not hasattr(event, "pos"):
+            return event
+        return pygame.event.Event(event.type, {**event.dict, "pos": self.map_pos(event.pos)})
+    
     def scale_rect(self, rect: pygame.Rect) -> pygame.Rect:
         """Scale a rectangle according to current display size."""
         return pygame.Rect(
-            rect.x * self.scale_x,
-            rect.y * self.scale_y,
+            self.offset[0] + rect.x * self.scale_x,
+            self.offset[1] + rect.y * self.scale_y,
             rect.width * self.scale_x,
             rect.height * self.scale_y
         )
     
     def scale_pos(self, x: float, y: float) -> Tuple[float, float]:
         """Scale a position according to current display size."""
-        return (x * self.scale_x, y * self.scale_y)
+        return (self.offset[0] + x * self.scale_x, self.offset[1] + y * self.scale_y)
     
     def unscale_pos(self, x: float, y: float) -> Tuple[float, float]:
         """Convert screen coordinates back to design coordinates."""
-        return (x / self.scale_x, y / self.scale_y)
+        return ((x - self.offset[0]) / self.scale_x, (y - self.offset[1]) / self.scale_y)
     
     def get_scaled_font(self, base_size: int) -> pygame.font.Font:
         """Get a font scaled to current display size."""
         scaled_size = int(base_size * min(self.scale_x, self.scale_y))
-        return pygame.font.Font(None, scaled_size)
\ No newline at end of file
+        return pygame.font.Font(None, scaled_size)
@@ -1,4 +1,25 @@
+import os
+import re
+import time
 from db_manager import DBManager
+from game_modes import create_mode
+from question_pack import QuestionPack
+from session_log import (
+    SessionLog, SESSION_START, TEAMS, ANSWER, SCORE_ADJUST, RANDOM_EVENT, TURN, UNDO, REDO,
+    SCORING_EVENTS
+)
+
+
+def question_display_text(question):
+    """
+    The question text as players see it (fill-in answers blanked out).
+    """
+    q_text = question["question"]
+    if question["question_type"] == "fill_in_blank" and question.get("fill_in_blank_text"):
+        pat = re.escape(question["fill_in_blank_text"])
+        q_text = re.sub(pat, "_____", q_text, flags=re.IGNORECASE)
+    return q_text
+
 
 class GameLogic:
     """
@@ -8,41 +29,108 @@ class GameLogic:
     - Score and turn tracking
     - Single group per session
     - Marking questions answered
-    - Retrieving random questions
+    - Retrieving questions, turn order and scoring through the session's
+      game mode (game_modes.py)
+    - Optional leaderboard-aware random events (random_events.py)
     - Ending sessions
+
+    Every state change is also appended to the session's event log
+    (session_log.py), which load_session() replays to resume a game.
+
+    Rapid-fire modes (lightning) keep answers, events and scores in memory
+    and write them in one transaction when the turn passes, the questions
+    run out or the session ends (flush_answers()).
+
+    Listeners registered with add_listener() are called as
+    listener(event, *args) after every state change:
+      ("session", session_id)          session started / ended (None)
+      ("teams", teams)                 roster set up or loaded
+      ("scores", { team_id: score })   all scores replaced
+      ("score", team_id, score)        one team's score changed
+      ("turn", team_id)                turn handed to a team
+      ("question", question)           question revealed (None = closed)
+      ("answered", question_id, was_correct)
     """
 
-    def __init__(self, db=None):
+    def __init__(self, db=None, question_cache=None):
         # If no db passed, create a default one
         self.db = db if db else DBManager()
+        # Shared QuestionCache when several games run in one process (session_manager.py)
+        self.question_cache = question_cache
         self.current_session_id = None
         self.current_session_info = None
         self.teams = []
+        self.team_index = {}  # { team_id: team dict from self.teams }
         self.scores = {}
+        self.listeners = []
+        self.log = None
+        self.random_events = None  # RandomEventEngine, when the session uses events
+        self.question_shown_at = None  # monotonic time the open question was revealed
+        self.current_question = None  # the open question, until it is answered
+        self.mode = None  # GameMode for the current session
+        self.own_pack = None  # QuestionPack opened here (no shared question_cache); closed with the session
+        self.prefetched = None  # next question, drawn ahead by prefetch_question()
+        self.held_answers = []  # [(question_id, was_correct, answer_seconds)] not yet written
+
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def _emit(self, event, *args):
+        for callback in self.listeners:
+            callback(event, *args)
 
-    def create_new_session(self, time_per_question, question_group_id):
+    def _log(self, event_type, payload):
+        if self.log:
+            self.log.append(event_type, payload)
+
+    def create_new_session(self, time_per_question, question_group_id, game_mode="random", mode_options=None,
+                           question_pack=None):
         """
-        Creates a brand-new session in the DB, storing question_group_id and time_per_question,
-        ensuring we do not accidentally reuse or conflict with an old session.
+        Creates a brand-new session in the DB, storing question_group_id, time_per_question
+        and the game mode, ensuring we do not accidentally reuse or conflict with an old session.
+        With question_pack (a pack file, see question_pack.py) the questions come from the
+        pack instead of a group. The pack's absolute path is stored, so a resume
+        finds it whatever the working directory.
         """
         # If there was an old session still active, end it
         if self.current_session_id is not None:
             self.end_session()
+        if question_pack:
+            question_pack = os.path.abspath(question_pack)
 
         # Create new session and initialize questions
-        self.current_session_id = self.db.create_new_session(time_per_question, question_group_id)
+        self.current_session_id = self.db.create_new_session(
+            time_per_question, question_group_id, game_mode, mode_options, question_pack
+        )
         self.current_session_info = self.db.get_session(self.current_session_id)
+        self.log = SessionLog(self.db, self.current_session_id)
+        self._log(SESSION_START, {
+            "time_per_question": time_per_question,
+            "question_group_id": question_group_id,
+            "game_mode": game_mode,
+            "question_pack": question_pack,
+        })
+        self._start_mode()
 
         # Clear local team references
-        self.teams = []
+        self._set_teams([])
         self.scores = {}
 
+        self._emit("session", self.current_session_id)
         return self.current_session_id
 
 
     def load_session(self, session_id):
         """
-        Load an existing session.
+        Load an existing session, e.g. to resume after a crash.
+
+        Sessions with an event log are rebuilt from the latest snapshot plus
+        the events after it, and the materialized tables are brought back
+        in line with the log. Older sessions fall back to the tables.
         """
         s_data = self.db.get_session(session_id)
         if not s_data:
@@ -50,111 +138,380 @@ class GameLogic:
 
         self.current_session_id = session_id
         self.current_session_info = s_data
-        # Load teams, scores, etc.
-        self.teams = self.db.get_teams_for_session(session_id)
-        state_data = self.db.get_session_state(session_id)
-        self.scores = state_data["scores"]
+        self._set_teams(self.db.get_teams_for_session(session_id))
+        self.log = SessionLog.rebuild(self.db, session_id)
+
+        if self.log.seq:
+            self.scores = self.log.scores()
+            current_tid = self.log.state["turn"]
+            answered = {int(q_id): c for q_id, c in self.log.state["answered"].items()}
+            self.db.restore_session_state(session_id, self.scores, current_tid, answered)
+        else:
+            state_data = self.db.get_session_state(session_id)
+            self.scores = state_data["scores"]
+            current_tid = state_data["current_turn_team_id"]
+        self.current_session_info["current_turn_team_id"] = current_tid
+        # After restore_session_state: answers only the log saw must not be drawn again
+        self._start_mode()
+
+        self._emit("session", session_id)
+        self._emit("teams", self.teams)
+        self._emit("scores", dict(self.scores))
+        self._emit("turn", current_tid)
         return True
 
-    def setup_teams(self, team_names):
+    def setup_teams(self, team_names, rosters=None):
+        """
+        Adds teams (and optionally their players: rosters[i] lists the
+        player names of team_names[i]) to the current session, all in one
+        transaction, each starting on 0 points.
+        """
         if not self.current_session_id:
             return
 
-        # Insert teams
-        for name in team_names:
-            self.db.add_team(self.current_session_id, name)
-
-        # Re-fetch teams and init state
-        self.teams = self.db.get_teams_for_session(self.current_session_id)
+        new_teams = self.db.add_teams(self.current_session_id, team_names, rosters)
+        self._set_teams(self.teams + new_teams)
         team_ids = [t["team_id"] for t in self.teams]
-        self.db.init_session_state(self.current_session_id, team_ids)
 
-        # Now check if there's a current_turn_team_id
-        state_data = self.db.get_session_state(self.current_session_id)
-        if not state_data["current_turn_team_id"] and team_ids:
+        # Now check if there's a current_turn_team_id (current_session_info tracks it)
+        turn_tid = self.current_session_info["current_turn_team_id"]
+        if not turn_tid and team_ids:
             # Set the turn to the first team
-            self.db.update_current_turn(self.current_session_id, team_ids[0])
-            # Optionally update your local self.current_session_info as well
-            self.current_session_info["current_turn_team_id"] = team_ids[0]
+            turn_tid = team_ids[0]
+            self.db.update_current_turn(self.current_session_id, turn_tid)
+            self.current_session_info["current_turn_team_id"] = turn_tid
+
+        self.scores.update({t["team_id"]: 0 for t in new_teams})
+        self._log(TEAMS, {"teams": [[t["team_id"], t["team_name"]] for t in self.teams]})
+        self._log(TURN, {"team_id": turn_tid})
+        self._emit("teams", self.teams)
+        self._emit("scores", dict(self.scores))
+        self._emit("turn", turn_tid)
+
 
+    def _set_teams(self, teams):
+        self.teams = teams
+        self.team_index = {t["team_id"]: t for t in teams}
+
+    def team_name(self, team_id):
+        """The team's name, or None if it isn't in this session."""
+        team = self.team_index.get(team_id)
+        return team["team_name"] if team else None
+
+    def _start_mode(self):
+        """
+        Build the session's game mode (and random event engine, if the
+        session has events on) and preload its questions. Seeded with the
+        session id, so a resumed session draws the same way.
+        """
+        info = self.current_session_info
+        source = self.question_cache or self.db
+        self.mode = create_mode(info["game_mode"], self, info["mode_options"], seed=self.current_session_id)
+        self.random_events = None
+        if info["mode_options"].get("random_events"):
+            # numpy; only imported by sessions that use events
+            from random_events import RandomEventEngine, DEFAULT_EVENT_RATE
+            self.random_events = RandomEventEngine(
+                seed=self.current_session_id,
+                event_rate=info["mode_options"].get("event_rate", DEFAULT_EVENT_RATE),
+            )
+        self.prefetched = None
+        whole_group = self.mode.plans_whole_group()
+        answered = self.db.get_answered_question_ids(self.current_session_id) \
+            if whole_group or info.get("question_pack") else None
+        if info.get("question_pack"):
+            # Played straight from the pack file; questions are read on demand
+            if self.question_cache:
+                pack = self.question_cache.get_pack(info["question_pack"])
+            else:
+                self._close_pack()
+                pack = self.own_pack = QuestionPack(info["question_pack"])
+            bank = pack.session_bank(() if whole_group else answered)
+        elif whole_group:
+            bank = source.get_question_bank(info["question_group_id"])
+        else:
+            bank = source.get_session_question_bank(self.current_session_id, info["question_group_id"])
+        if whole_group:
+            self.mode.preload(bank, answered)
+        else:
+            self.mode.preload(bank)
+
+    def _close_pack(self):
+        if self.own_pack is not None:
+            self.own_pack.close()
+            self.own_pack = None
 
     def begin_game_loop(self):
         """
-        Get a random question if any remain. Return the question dict or None if no questions left.
+        Get the next question from the game mode. Return the question dict, or None if
+        no questions are left (or, on a grid, until a tile is picked with choose_question()).
         """
-        if not self.current_session_id:
+        if not self.current_session_id or not self.mode:
             print("[DEBUG] No current session ID")
             return None
-            
-        s_data = self.db.get_session(self.current_session_id)
-        if not s_data or not s_data["is_active"]:
-            print("[DEBUG] Session not found or not active")
+        if not self.current_session_info["is_active"]:
+            print("[DEBUG] Session not active")
             return None
 
-        question_group_id = s_data["question_group_id"]
-        if not question_group_id:
-            print("[DEBUG] No question group ID found")
-            return None
+        question, self.prefetched = self.prefetched or self.mode.next_question(), None
+        print(f"[DEBUG] Got question: {question['question'] if question else None}")
+        return self._open_question(question)
 
-        print(f"[DEBUG] Checking for questions in group {question_group_id}")
-        any_left = self.db.any_questions_left_for_session(self.current_session_id, question_group_id)
-        print(f"[DEBUG] Questions remaining: {any_left}")
+    def prefetch_question(self):
+        """
+        Draw the next question ahead of time (while the feedback screen is
+        up), for begin_game_loop() to open. Not for modes whose draw depends
+        on the scores when it is opened (adaptive) or where the host picks.
+        Returns the question, or None.
+        """
+        if self.prefetched is None and self.mode and not self.mode.picks_questions \
+                and getattr(self.mode, "selector", None) is None:
+            self.prefetched = self.mode.next_question()
+        return self.prefetched
 
-        if not any_left:
-            print("[DEBUG] No questions remain")
+    def choose_question(self, question_id):
+        """
+        Open a specific question (grid mode). Returns it, or None if it is
+        no longer on the board.
+        """
+        if not self.current_session_id or not self.mode or not self.mode.picks_questions:
             return None
+        return self._open_question(self.mode.choose(question_id))
 
-        # Fetch a random question
-        question = self.db.get_random_question(question_group_id, self.current_session_id)
-        print(f"[DEBUG] Got random question: {question}")
+    def _open_question(self, question):
+        if question is None:
+            return None
+        self.question_shown_at = time.monotonic()
+        self.current_question = question
+        self._emit("question", question)
         return question
 
+    def question_time_left(self):
+        """
+        Seconds left on the open question's clock (time_per_question), or
+        None when no question is open or the session has no time limit.
+        """
+        if self.question_shown_at is None or not self.current_session_info:
+            return None
+        limit = self.current_session_info.get("time_per_question") or 0
+        if not limit:
+            return None
+        return max(0.0, limit - (time.monotonic() - self.question_shown_at))
+
+    def questions_left(self):
+        return bool(self.mode and (self.prefetched is not None or self.mode.questions_left()))
+
+    def current_round_name(self):
+        return self.mode.round_name() if self.mode else None
 
     def mark_answer(self, question_id, was_correct, points=0):
         """
-        Mark a question as answered, update score if correct, rotate turn to the next team.
+        Mark a question as answered, score it for the current team under the
+        mode's rules and pass the turn as the mode says. Works from the
+        in-memory turn and team order, so nothing is read back from the DB.
+        Returns the score change applied.
         """
         if not self.current_session_id:
-            return
+            return 0
+
+        current_tid = self.get_current_team_id()
+        penalty = 0 if was_correct else self.mode.wrong_penalty(points)
+        if self.mode.rapid_fire and self.log:
+            self.log.hold()
 
-        # Mark question answered
-        self.db.mark_question_answered(self.current_session_id, question_id, was_correct)
+        # Log first, so a crash mid-update is repaired on resume
+        payload = {
+            "question_id": question_id,
+            "team_id": current_tid,
+            "was_correct": bool(was_correct),
+            "points": points,
+        }
+        if penalty:
+            payload["penalty"] = penalty
+        self._log(ANSWER, payload)
+
+        # Mark question answered (also updates question_stats)
+        answer_seconds = None
+        if self.question_shown_at is not None:
+            answer_seconds = round(time.monotonic() - self.question_shown_at, 2)
+            self.question_shown_at = None
+        if self._holding():
+            self.held_answers.append((question_id, bool(was_correct), answer_seconds))
+        else:
+            self.db.mark_question_answered(self.current_session_id, question_id, was_correct, answer_seconds)
+        self.current_question = None
+        self._emit("answered", question_id, bool(was_correct))
+        self._emit("question", None)
+
+        self.mode.question_answered(question_id)
 
         # Update scores
-        state_data = self.db.get_session_state(self.current_session_id)
-        current_tid = state_data["current_turn_team_id"]
-        old_score = state_data["scores"].get(current_tid, 0)
-        new_score = old_score + (points if was_correct else 0)
-        self.db.update_score(self.current_session_id, current_tid, new_score)
-
-        # Rotate turn if multiple teams
-        if len(state_data["scores"]) > 1:
-            all_ids = list(state_data["scores"].keys())  # team IDs
-            c_idx = all_ids.index(current_tid)
-            n_idx = (c_idx + 1) % len(all_ids)
-            next_tid = all_ids[n_idx]
-            self.db.update_current_turn(self.current_session_id, next_tid)
+        delta = points if was_correct else -penalty
+        if delta:
+            self._apply_score_delta(current_tid, delta)
+
+        # Pass the turn
+        next_tid = self.mode.next_turn(current_tid, [t["team_id"] for t in self.teams])
+        if next_tid != current_tid:
+            self._log(TURN, {"team_id": next_tid})
+            self.current_session_info["current_turn_team_id"] = next_tid
+            if not self._holding():
+                self.db.update_current_turn(self.current_session_id, next_tid)
+            self._emit("turn", next_tid)
+        if next_tid != current_tid or not self.mode.questions_left():
+            self.flush_answers()
+        return delta
+
+    def _holding(self):
+        return bool(self.log and self.log.holding)
+
+    def flush_answers(self):
+        """
+        Write everything held in memory during a rapid-fire streak (events,
+        answers, scores, turn) in one transaction. No-op when nothing is held.
+        """
+        if not self._holding():
+            return
+        events = self.log.take_held()
+        answers, self.held_answers = self.held_answers, []
+        self.db.record_answer_batch(
+            self.current_session_id, events, answers, dict(self.scores), self.get_current_team_id()
+        )
+        self.log.snapshot_if_due()
+
+    def _apply_score_delta(self, team_id, delta):
+        """
+        Add `delta` to one team's score in the DB (score = score + ?) and in
+        memory, and notify listeners. Returns the new score. While holding,
+        only memory changes; flush_answers() writes the totals.
+        """
+        new_score = None
+        if not self._holding():
+            new_score = self.db.adjust_score(self.current_session_id, team_id, delta)
+        if new_score is None:
+            new_score = self.scores.get(team_id, 0) + delta
+        self.scores[team_id] = new_score
+        self._emit("score", team_id, new_score)
+        return new_score
+
+    def adjust_score(self, team_id, delta, reason="manual"):
+        """
+        Manually add (or with a negative delta, remove) points for a team.
+        The change is logged, so it shows in the audit trail and can be undone.
+        Returns the new score.
+        """
+        if not self.current_session_id or not delta:
+            return self.scores.get(team_id)
+        self._log(SCORE_ADJUST, {"team_id": team_id, "delta": delta, "reason": reason})
+        return self._apply_score_delta(team_id, delta)
+
+    def roll_random_event(self):
+        """
+        Give the random event engine its roll for this turn and apply the
+        result like any other score change (logged, undoable, broadcast).
+        Returns { team_id, delta, pct } or None if nothing happened.
+        """
+        if not self.random_events or not self.current_session_id or not self.teams:
+            return None
+        questions_left, points_left = self.mode.remaining_points()
+        team_ids = [t["team_id"] for t in self.teams]
+        rolled = self.random_events.roll_one(
+            [self.scores.get(t_id, 0) for t_id in team_ids], points_left, questions_left
+        )
+        if rolled is None:
+            return None
+        team_index, delta, pct = rolled
+        event = {"team_id": team_ids[team_index], "delta": delta, "pct": pct}
+        self._log(RANDOM_EVENT, event)
+        self._apply_score_delta(event["team_id"], delta)
+        return event
+
+    def set_current_team(self, team_id):
+        """
+        Hand the turn to a specific team (e.g. the winner of a buzz-in).
+        """
+        if not self.current_session_id:
+            return
+        self._log(TURN, {"team_id": team_id})
+        if not self._holding():
+            self.db.update_current_turn(self.current_session_id, team_id)
+        if self.current_session_info is not None:
+            self.current_session_info["current_turn_team_id"] = team_id
+        self._emit("turn", team_id)
+
+    def can_undo(self):
+        return bool(self.log and self.log.last_scoring_action())
+
+    def can_redo(self):
+        return bool(self.log and self.log.last_undone_action())
+
+    def undo_last_score(self):
+        """
+        Revert the most recent scoring action by appending a compensating
+        event. Returns (team_id, delta applied) or None if nothing to undo.
+        """
+        if not self.current_session_id or not self.can_undo():
+            return None
+        seq, team_id, delta = self.log.last_scoring_action()
+        self.log.append(UNDO, {"undone_seq": seq, "team_id": team_id, "delta": -delta})
+        self._apply_score_delta(team_id, -delta)
+        return team_id, -delta
+
+    def redo_last_score(self):
+        """
+        Re-apply the most recently undone scoring action.
+        Returns (team_id, delta applied) or None if nothing to redo.
+        """
+        if not self.current_session_id or not self.can_redo():
+            return None
+        undone_seq, team_id, delta = self.log.last_undone_action()
+        self.log.append(REDO, {"redone_seq": undone_seq, "team_id": team_id, "delta": delta})
+        self._apply_score_delta(team_id, delta)
+        return team_id, delta
+
+    def score_audit_trail(self, limit=20):
+        """
+        The newest scoring events for this session, newest first:
+        [(seq, event_type, payload, created_at), ...]
+        """
+        if not self.current_session_id:
+            return []
+        self.flush_answers()
+        return self.db.get_recent_session_events(
+            self.current_session_id, SCORING_EVENTS + (UNDO, REDO), limit
+        )
 
     def get_current_team_id(self):
         """
         Return the ID of the team whose turn it is.
         """
-        st = self.db.get_session_state(self.current_session_id)
-        return st["current_turn_team_id"]
+        if not self.current_session_info:
+            return None
+        return self.current_session_info["current_turn_team_id"]
 
     def get_scores(self):
         """
         Return a dict of { team_id: score }
         """
-        return self.db.get_session_state(self.current_session_id)["scores"]
+        return dict(self.scores)
 
     def end_session(self):
         """
         Mark the current session inactive.
         """
         if self.current_session_id:
+            self.flush_answers()
             self.db.update_session_status(self.current_session_id, False)
             self.current_session_id = None
             self.current_session_info = None
-            self.teams = []
+            self._set_teams([])
             self.scores = {}
+            self.log = None
+            self.random_events = None
+            self.mode = None
+            self._close_pack()
+            self.prefetched = None
+            self.held_answers = []
+            self.current_question = None
+            self.question_shown_at = None
+            self._emit("session", None)
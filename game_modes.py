@@ -0,0 +1,307 @@
+import random
+
+from question_pack import PackBank
+from question_sampler import AdaptiveSelector, CategoryDecks, target_correct_rate
+
+# Grid board size: categories across, questions down
+GRID_COLUMNS = 6
+GRID_ROWS = 5
+# Lightning: questions a team answers in a row before the turn moves on
+LIGHTNING_STREAK = 5
+# Buzzer: share of a question's points lost on a wrong answer
+BUZZER_PENALTY = 0.5
+
+
+class GameMode:
+    """
+    Strategy for how a session plays: which question comes next, who
+    answers after whom, and what an answer is worth.
+
+    preload() receives every unanswered question of the session once, at
+    session start (or resume). After that a mode answers everything from
+    memory, so neither the game loop nor the drawing code touches the DB.
+    A mode that plans its order over the whole group (plans_whole_group())
+    gets every question instead, plus the ids already answered.
+    A session playing from a question pack gets a PackBank instead, which
+    reads questions from the pack file as they are drawn.
+
+    Subclasses override the hooks they need:
+      next_question()            the next question, or None
+      next_turn(team_id, ids)    who answers after `team_id`
+      wrong_penalty(points)      points lost on a wrong answer
+    """
+
+    name = None
+    label = None
+    uses_buzzer = False       # teams buzz in to win each question
+    picks_questions = False   # the host picks questions from a board
+    rapid_fire = False        # no feedback screen; answers are written in batches
+
+    def __init__(self, logic, options=None, seed=None):
+        self.logic = logic
+        self.options = dict(options or {})
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.questions = {}   # { question_id: question } still in play
+        self.points_left = 0
+
+    def plans_whole_group(self):
+        return False
+
+    def preload(self, bank, answered_ids=None):
+        """
+        bank: full question dicts (options + stats) not yet answered, or a
+        PackBank. For plans_whole_group() modes, every question, with
+        answered_ids the ones already played.
+        """
+        if isinstance(bank, PackBank):
+            # Used as is, so start-up doesn't grow with the pack
+            self.questions = bank
+            self.points_left = bank.points_left
+            return
+        self.questions = {q["id"]: q for q in bank}
+        self.points_left = sum(q["points"] or 0 for q in bank)
+
+    def _take(self, question_id):
+        question = self.questions.pop(question_id, None)
+        if question:
+            self.points_left -= question["points"] or 0
+        return question
+
+    # ----------------------------------------------------------------
+    #                          SELECTION
+    # ----------------------------------------------------------------
+    def next_question(self):
+        raise NotImplementedError
+
+    def questions_left(self):
+        return bool(self.questions)
+
+    def remaining_points(self):
+        """(questions_left, points_left), kept up to date in memory."""
+        return len(self.questions), self.points_left
+
+    def question_answered(self, question_id):
+        self._take(question_id)
+
+    def round_name(self):
+        return None
+
+    # ----------------------------------------------------------------
+    #                          TURNS + SCORING
+    # ----------------------------------------------------------------
+    def next_turn(self, current_team_id, team_ids):
+        """Round robin in roster order."""
+        if len(team_ids) < 2:
+            return current_team_id
+        c_idx = team_ids.index(current_team_id) if current_team_id in team_ids else -1
+        return team_ids[(c_idx + 1) % len(team_ids)]
+
+    def wrong_penalty(self, points):
+        return 0
+
+
+class RandomMode(GameMode):
+    """
+    Questions in random order (clyn-requests.md item 7). Options:
+      adaptive      draw by historical difficulty vs the score gap
+      category_mix  spread categories evenly (CategoryDecks)
+      rounds        round quotas per category (implies category_mix)
+    """
+
+    name = "random"
+    label = "Random"
+
+    def plans_whole_group(self):
+        # Category decks schedule the whole group, so a resume rebuilds them and skips what was played
+        return bool(self.options.get("rounds") or self.options.get("category_mix"))
+
+    def preload(self, bank, answered_ids=None):
+        super().preload(bank)
+        self.decks = None
+        self.selector = None
+        if self.plans_whole_group():
+            by_category = {}
+            for q in bank:
+                by_category.setdefault(q["category"], []).append(q["id"])
+            self.decks = CategoryDecks(by_category, self.options.get("rounds"), seed=self.seed)
+            if answered_ids:
+                self.decks.consume(answered_ids)
+            # Questions left out of every round (or already answered) are not in play
+            in_play = {q_id for q_id, _ in self.decks.order}
+            super().preload([q for q in bank if q["id"] in in_play])
+        elif self.options.get("adaptive"):
+            self.selector = AdaptiveSelector(
+                [(q["id"], q["points"], q["attempts"], q["correct"]) for q in bank], seed=self.seed
+            )
+        elif isinstance(bank, PackBank):
+            # Same pop() as the list, drawn lazily from the pack
+            self.order = bank.shuffled(self.rng)
+        else:
+            # Shuffled once; each draw pops from the end
+            self.order = list(self.questions)
+            self.rng.shuffle(self.order)
+
+    def next_question(self):
+        if self.decks is not None:
+            return self._take_id(self.decks.draw())
+        if self.selector is not None:
+            current_tid = self.logic.get_current_team_id()
+            others = [sc for t_id, sc in self.logic.scores.items() if t_id != current_tid]
+            target = target_correct_rate(self.logic.scores.get(current_tid, 0), others, self.points_left)
+            return self._take_id(self.selector.draw(target))
+        while self.order:
+            question = self._take(self.order.pop())
+            if question:
+                return question
+        return None
+
+    def _take_id(self, question_id):
+        return self._take(question_id) if question_id is not None else None
+
+    def round_name(self):
+        return self.decks.current_round_name() if self.decks is not None else None
+
+
+class BuzzerMode(RandomMode):
+    """
+    Random questions; teams buzz in and the fastest answers. A wrong
+    answer costs a share of the question's points (option "penalty").
+    """
+
+    name = "buzzer"
+    label = "Buzzer"
+    uses_buzzer = True
+
+    def next_turn(self, current_team_id, team_ids):
+        # Whoever buzzes first answers next, so the turn just stays put
+        return current_team_id
+
+    def wrong_penalty(self, points):
+        return int(round((points or 0) * self.options.get("penalty", BUZZER_PENALTY)))
+
+
+def lightning_order(questions, teams, streak=LIGHTNING_STREAK):
+    """
+    Which team (roster position) answers each question of a lightning
+    game: cycles of one streak per team, the streak shrinking once a full
+    cycle no longer fits, so every team gets the same number of
+    questions. Shorter than `questions` when some are left over.
+    """
+    teams = max(teams, 1)
+    order = []
+    left = questions
+    while True:
+        streak = min(streak, left // teams)
+        if not streak:
+            return order
+        for team in range(teams):
+            order.extend([team] * streak)
+        left -= streak * teams
+
+
+class LightningMode(RandomMode):
+    """
+    Rapid-fire: a team answers `streak` questions in a row before the
+    turn moves on. The next question follows straight away, and GameLogic
+    holds the streak's answers in memory and writes them in one
+    transaction when the turn passes. Every team gets the same number of
+    questions (lightning_order); questions left over are not played.
+    """
+
+    name = "lightning"
+    label = "Lightning"
+    rapid_fire = True
+
+    def preload(self, bank, answered_ids=None):
+        super().preload(bank, answered_ids)
+        # Counted from the log, so a resumed game carries on in the same streak
+        log = getattr(self.logic, "log", None)
+        self.played = len(log.state["answered"]) if log else 0
+        self.total = self.played + len(self.questions)
+        self.turn_order = None
+
+    def _turn_order(self, teams):
+        if self.turn_order is None or self.turn_order[0] != teams:
+            self.turn_order = (teams, lightning_order(self.total, teams, self.options.get("streak", LIGHTNING_STREAK)))
+        return self.turn_order[1]
+
+    def questions_left(self):
+        return super().questions_left() and self.played < len(self._turn_order(self._team_count()))
+
+    def remaining_points(self):
+        # Not counting questions drawn and still open, nor those left over
+        playable = len(self._turn_order(self._team_count())) - self.played
+        return max(0, min(len(self.questions), playable)), self.points_left
+
+    def _team_count(self):
+        return len(self.logic.teams) if self.logic else 1
+
+    def next_question(self):
+        if not self.questions_left():
+            return None
+        return super().next_question()
+
+    def next_turn(self, current_team_id, team_ids):
+        order = self._turn_order(len(team_ids))
+        self.played += 1
+        if 0 < self.played < len(order) and order[self.played] == order[self.played - 1]:
+            return current_team_id
+        return super().next_turn(current_team_id, team_ids)
+
+
+class GridMode(GameMode):
+    """
+    Board of questions (clyn-requests.md item 2): one column per category,
+    sorted by points, and the team whose turn it is picks a tile.
+    """
+
+    name = "grid"
+    label = "Grid"
+    picks_questions = True
+
+    def plans_whole_group(self):
+        # The board is laid out from every question, so a resume shows the same board
+        return True
+
+    def preload(self, bank, answered_ids=None):
+        by_category = {}
+        for q in bank:
+            by_category.setdefault(q["category"] or "General", []).append(q)
+        self.board = []  # [(category, [question_id, ...]), ...]
+        on_board = []
+        for category in sorted(by_category)[:GRID_COLUMNS]:
+            column = sorted(by_category[category], key=lambda q: (q["points"] or 0, q["id"]))[:GRID_ROWS]
+            self.board.append((category, [q["id"] for q in column]))
+            on_board.extend(column)
+        self.tile_points = {q["id"]: q["points"] for q in on_board}  # answered tiles keep theirs
+        # Tiles answered before a resume stay on the board, closed
+        answered_ids = answered_ids or ()
+        super().preload([q for q in on_board if q["id"] not in answered_ids])
+
+    def next_question(self):
+        # Nothing opens until a tile is picked
+        return None
+
+    def choose(self, question_id):
+        return self._take(question_id)
+
+    def tiles(self):
+        """[(category, [(question_id, points, still_open), ...]), ...] for drawing."""
+        return [
+            (category, [
+                (q_id, self.tile_points[q_id], q_id in self.questions)
+                for q_id in ids
+            ])
+            for category, ids in self.board
+        ]
+
+
+MODES = {mode.name: mode for mode in (RandomMode, GridMode, BuzzerMode, LightningMode)}
+
+
+def create_mode(name, logic, options=None, seed=None):
+    mode_cls = MODES.get(name or RandomMode.name)
+    if mode_cls is None:
+        raise ValueError(f"Unknown game mode '{name}', expected one of {sorted(MODES)}")
+    return mode_cls(logic, options, seed)
@@ -1,14 +1,27 @@
+from startup import StartupProfile, Warmup, FIRST_FRAME_BUDGET_MS  # first: the profile starts here
+import os
 import pygame
 import re
-from db_manager import DBManager
-from game_logic import GameLogic
 from display_manager import DisplayManager
-from responsive_layout import ResponsiveLayout
+from responsive_layout import ResponsiveLayout, SHADOW_OFFSET, BUTTON_RADIUS, adjust_color
+from animation import Animator, linear, pulse
+from buzzer import BuzzerArbiter
 
-pygame.init()
+# Only what the splash frame needs is imported up front. The DB, game
+# rules and rooms are imported behind the splash (load_game), the rest
+# (remote_server, audience_window, ...) when first used.
+
+startup_profile = StartupProfile()
+startup_profile.mark("imports")
+
+# Only the subsystems the game uses (no mixer / joystick)
+pygame.display.init()
+pygame.font.init()
+startup_profile.mark("pygame init")
 
 # Initialize Display Manager
 display_manager = DisplayManager()
+startup_profile.mark("window")
 
 # ---------------------------
 # Game States
@@ -31,8 +44,42 @@ current_state = MAIN_MENU
 # ---------------------------
 # Database + Game Logic
 # ---------------------------
-db = DBManager()
-game_logic = GameLogic(db)
+# Set up by load_game() while the splash frame is up
+db = None
+# Every room (session) gets its own GameLogic; `game_logic` is the one on screen
+session_manager = None
+game_logic = None
+state_sync = None  # versioned deltas for remote/spectator displays
+
+# Cached "is there a crashed session to resume?" answer for the main menu
+resume_cache = {"checked": False, "session_id": None}
+
+
+def invalidate_resume_cache(event, *args):
+    if event == "session":
+        resume_cache["checked"] = False
+
+buzzer = BuzzerArbiter()
+remote = None  # RemoteServer, only when started with --remote
+audience = None  # AudienceDisplay while the projector window is open
+audience_layout = None
+animator = Animator()  # tweens for the host view, driven by perf_counter
+shown_scores = {}  # { ("score", session_id, team_id): score last drawn }, for count-ups
+board_closed = {}  # { session_id: {question_id, ...} } grid tiles already shown turned over
+
+FPS = 60
+IDLE_FPS = 15  # while nothing moves and no input arrives
+FULL_REFRESH_S = 1.0  # a whole frame goes to the display at least this often
+SCORE_COUNT_S = 0.6  # scoreboard count-up
+TILE_FLIP_S = 0.4  # grid tile turning over once answered
+CLOCK_PULSE_S = 1.0  # the question clock pulses in its last seconds
+SCORE_ADJUST_STEP = 5  # points per click on the scoreboard -/+ buttons
+# Font sizes (layout size multipliers) loaded behind the splash frame
+WARM_FONT_SIZES = (0.75, 0.8, 1.0, 1.2, 1.5)
+# Gameplay layout shared by draw_gameplay and the next-question prefetch
+QUESTION_BOX = (0.08, 0.11)  # text_box(y, height) of the question text
+QUESTION_TEXT_SIZE = 1.2
+OPTION_BUTTON_SIZE = (0.7, 0.08)  # multiple-choice buttons (width, height)
 
 # ---------------------------
 # Shared Variables
@@ -46,9 +93,19 @@ input_text = ""  # For add_group screen
 session_setup_data = {
     "question_group_id": None,
     "time_per_question": "30",
+    "game_mode": "random",
+    "random_events": False,
+    "adaptive": False,
+    "category_mix": False,
+    "rounds": None,  # round quotas loaded with --rounds
+    "question_pack": None,  # pack file given with --pack
+    "use_pack": False,  # play the pack instead of a question group
 }
 team_list = []  # list of team names user adds
 team_input_text = ""  # used to type new team name
+screen_data = {}  # what the screen on display loaded in its on_enter hook
+after_frame = []  # [fn(layout)] run once the current frame is on screen (prefetching)
+prefetch_job = None  # Warmup drawing the next question while the feedback screen is up
 
 
 # ---------------------------
@@ -57,18 +114,143 @@ team_input_text = ""  # used to type new team name
 
 def get_team_name(team_id):
     """
-    A small helper that returns the team name from game_logic.teams
+    A small helper that returns the team name from game_logic's team index
     or a fallback if not found.
     """
-    for t in game_logic.teams:
-        if t["team_id"] == team_id:
-            return t["team_name"]
-    return f"Team {team_id}"
+    return game_logic.team_name(team_id) or f"Team {team_id}"
+
+
+def process_buzzer():
+    """
+    Resolve a pending buzz-in and hand the question to the winning team.
+    """
+    winner = buzzer.resolve()
+    if winner is not None and question_data.get("buzz_winner") is None:
+        question_data["buzz_winner"] = winner
+        game_logic.set_current_team(winner)
+        print(f"[UI] {get_team_name(winner)} buzzed in first")
+
+
+def stash_room():
+    """Remember the room on screen so switching back restores it."""
+    if game_logic.current_session_id in session_manager.rooms and current_state in (TEAM_SETUP, GAMEPLAY, FEEDBACK):
+        buzzer.disarm()
+        session_manager.ui_state[game_logic.current_session_id] = {
+            "state": current_state,
+            "question_data": dict(question_data),
+        }
+
+
+def show_room(logic):
+    """Put a room on screen, restoring where it was left."""
+    global game_logic
+    game_logic = logic
+    if not logic.current_session_id:
+        question_data.clear()
+        change_state(MAIN_MENU)
+        return
+    saved = session_manager.ui_state.pop(logic.current_session_id, None)
+    question_data.clear()
+    if saved:
+        question_data.update(saved["question_data"])
+        change_state(saved["state"])
+    else:
+        question_data["active_question"] = None
+        change_state(GAMEPLAY)
+    if buzz_in_active():
+        buzzer.assign_keys([t["team_id"] for t in game_logic.teams])
+        if question_data.get("active_question") and question_data.get("buzz_winner") is None:
+            buzzer.arm()
+    print(f"[UI] Showing room for session {logic.current_session_id}")
+
+
+def end_room():
+    """End the room on screen; the next open room (or the main menu) takes over."""
+    buzzer.disarm()
+    show_room(session_manager.close_room(game_logic.current_session_id))
+
+
+def draw_room_header(layout):
+    """Room number (with several rooms open) and the open question's clock."""
+    position, count = session_manager.room_position()
+    if count > 1:
+        label = layout.render_text(f"Room {position}/{count}  (F3: next room, F4: new room)",
+                                   (100, 100, 100), size_multiplier=0.5)
+        layout.display_manager.screen.blit(label, (int(layout.screen_width * 0.02), int(layout.screen_height * 0.01)))
+    time_left = game_logic.question_time_left()
+    if time_left is not None:
+        size_multiplier = 0.7
+        if 0 < time_left < 5:
+            # Pulses while time runs out; stops by itself once the clock isn't drawn
+            animator.keep("clock_pulse", 0.0, 1.0, CLOCK_PULSE_S, pulse, repeat=True)
+            size_multiplier += 0.25 * animator.value("clock_pulse", 0.0, layout.text_box(0.0, 0.08, 0.8, 0.2))
+        clock = layout.render_text(f"{time_left:.0f}s", (255, 0, 0) if time_left < 5 else (0, 0, 0),
+                                   size_multiplier=size_multiplier)
+        layout.display_manager.screen.blit(clock, (
+            int(layout.screen_width * 0.98) - clock.get_width(), int(layout.screen_height * 0.01)
+        ))
+
+
+def buzz_in_active():
+    """True while the session's game mode has teams buzz in for questions."""
+    return game_logic.mode is not None and game_logic.mode.uses_buzzer
+
+
+def open_question(q):
+    """Show a freshly drawn (or picked) question on every screen."""
+    question_data["active_question"] = q
+    question_data["user_answer"] = ""
+    question_data["buzz_winner"] = None
+    question_data["remote_answer"] = None
+    state_sync.set_extra("submitted", None)
+    if q and buzz_in_active():
+        buzzer.arm()
+    print(f"[DEBUG] Loaded question: {q['question'] if q else 'None'}")
+
+
+def open_next_question():
+    """Open the game mode's next question (already drawn if it was prefetched)."""
+    if game_logic.mode is None or game_logic.mode.picks_questions or not game_logic.questions_left():
+        return
+    print(f"[DEBUG] Loading new question for session {game_logic.current_session_id}")
+    open_question(game_logic.begin_game_loop())
+
+
+def answer_result_text():
+    """Feedback line for the last answer: (text, was_correct)."""
+    points = question_data.get("last_points", 0)
+    if question_data.get("last_was_correct"):
+        return f"Correct! +{points} points!", True
+    if points < 0:
+        return f"Incorrect! {points} points", False
+    return "Incorrect!", False
+
+
+def roll_random_event():
+    """
+    Give the random event engine its roll after an answer and remember the
+    result for the feedback screen.
+    """
+    event = game_logic.roll_random_event()
+    question_data["random_event"] = event
+    if event:
+        print(f"[UI] Random event: {event['delta']:+d} for {get_team_name(event['team_id'])}")
+
+
+def random_event_text(event):
+    if event["delta"] > 0:
+        return f"Lucky break! {get_team_name(event['team_id'])} gains {event['delta']} points"
+    return f"Bad luck! {get_team_name(event['team_id'])} loses {-event['delta']} points"
 
 
 # ---------------------------
 # Draw Screens
 # ---------------------------
+def check_resume_session():
+    resume_cache["session_id"] = db.get_latest_resumable_session()
+    resume_cache["checked"] = True
+
+
 def draw_main_menu(layout):
     """Draw the main menu screen with responsive elements."""
     
@@ -103,7 +285,23 @@ def draw_main_menu(layout):
         text="Quit"
     )
     
-    return start_game_btn, manage_question_groups_btn, quit_btn
+    # Offer to resume an unfinished session (looked up once, not every frame)
+    if not resume_cache["checked"]:
+        check_resume_session()
+    
+    resume_btn = None
+    if resume_cache["session_id"] is not None and resume_cache["session_id"] not in session_manager.rooms:
+        resume_btn = layout.create_centered_button(
+            y_percent=0.75,
+            width_percent=0.4,
+            height_percent=0.1,
+            color=(0, 150, 0),
+            text="Resume Session"
+        )
+        if screen_data.get("resume_error"):
+            layout.draw_text_centered(0.87, screen_data["resume_error"], size_multiplier=0.7, color=(255, 0, 0))
+    
+    return start_game_btn, manage_question_groups_btn, quit_btn, resume_btn
 
 def draw_manage_question_groups(layout):
     """Draw the manage groups screen with responsive elements."""
@@ -157,12 +355,8 @@ def draw_select_question_group(layout):
         text="Back"
     )
     
-    # Get groups from database
-    conn = db.create_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, group_name FROM groups")
-    question_groups = cursor.fetchall()
-    conn.close()
+    # Loaded once when the screen was entered (enter_group_list)
+    question_groups = screen_data["groups"]
     
     # Create grid of group buttons
     buttons = layout.create_grid_buttons(
@@ -257,8 +451,9 @@ def draw_view_question_group(layout, question_group_id):
         text="Delete Group"
     )
     
-    # Question list
-    questions = db.get_questions_for_question_group(question_group_id)
+    # Question list, loaded once when the screen was entered (enter_view_group)
+    questions = screen_data["questions"]
+    stats = screen_data["stats"]
     question_buttons = []
     current_y = 0.2  # Start at 20% of screen height
     
@@ -267,12 +462,20 @@ def draw_view_question_group(layout, question_group_id):
         q_btn = layout.create_positioned_button(
             x_percent=0.05,
             y_percent=current_y,
-            width_percent=0.7,
+            width_percent=0.55,
             height_percent=0.08,
             color=(128, 128, 128),
             text=q['question']
         )
         
+        # Difficulty from past answers
+        label, label_color = question_difficulty_label(stats.get(q['id']))
+        label_surf = layout.render_text(label, label_color, size_multiplier=0.7)
+        layout.display_manager.screen.blit(label_surf, (
+            int(layout.screen_width * 0.62),
+            int(layout.screen_height * (current_y + 0.04)) - label_surf.get_height() // 2
+        ))
+        
         # Delete button
         del_btn = layout.create_positioned_button(
             x_percent=0.8,
@@ -288,6 +491,22 @@ def draw_view_question_group(layout, question_group_id):
     
     return back_btn, add_question_btn, delete_question_group_btn, question_buttons
 
+def question_difficulty_label(stat):
+    """
+    Short difficulty summary for the group view, from a question_stats row.
+    """
+    if not stat:
+        return "Not played yet", (128, 128, 128)
+    rate = stat["correct_rate"]
+    label = f"{rate:.0%} of {stat['attempts']} correct"
+    if stat["avg_answer_seconds"] is not None:
+        label += f", {stat['avg_answer_seconds']:.0f}s"
+    if rate >= 0.7:
+        return label, (0, 150, 0)
+    if rate >= 0.4:
+        return label, (200, 120, 0)
+    return label, (200, 0, 0)
+
 def draw_select_question_type(layout):
     """Draw the question type selection screen with responsive elements."""
     layout.display_manager.screen.fill('white')
@@ -439,21 +658,29 @@ def draw_add_questions(layout):
 # ---------------------------
 def draw_session_setup(layout):
     """Draw the game session setup screen with responsive elements."""
+    from game_modes import MODES
     layout.display_manager.screen.fill('white')
     
     # Title
     layout.draw_text_centered(0.08, "Session Setup", size_multiplier=1.5)
     
-    # Get question groups from database
-    conn = db.create_connection()
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, group_name FROM groups ORDER BY id ASC;")
-    question_groups = cursor.fetchall()
-    conn.close()
+    # Loaded once when the screen was entered (enter_session_setup)
+    question_groups = screen_data["groups"]
     
-    # Create grid of group buttons
+    # Create grid of group buttons (the --pack file first, as group None)
     question_group_buttons = []
     current_y = 0.2
+    pack = screen_data.get("pack")
+    if pack:
+        btn = layout.create_centered_button(
+            y_percent=current_y,
+            width_percent=0.7,
+            height_percent=0.08,
+            color=(0, 200, 0) if session_setup_data["use_pack"] else (0, 200, 200),
+            text=f"Pack: {pack.name} ({len(pack)} questions)"
+        )
+        question_group_buttons.append((btn, None))
+        current_y += 0.1
     for gid, gname in question_groups:
         btn = layout.create_centered_button(
             y_percent=current_y,
@@ -474,6 +701,47 @@ def draw_session_setup(layout):
         label="Time per Question (sec):"
     )
     
+    # Game mode (click to cycle)
+    mode_btn = layout.create_positioned_button(
+        x_percent=0.7,
+        y_percent=0.6,
+        width_percent=0.25,
+        height_percent=0.06,
+        color=(0, 150, 200),
+        text=f"Mode: {MODES[session_setup_data['game_mode']].label}"
+    )
+    
+    # Random events toggle
+    events_btn = layout.create_positioned_button(
+        x_percent=0.7,
+        y_percent=0.68,
+        width_percent=0.25,
+        height_percent=0.06,
+        color=(0, 200, 0) if session_setup_data["random_events"] else (128, 128, 128),
+        text="Random Events: On" if session_setup_data["random_events"] else "Random Events: Off"
+    )
+    
+    # Category-stratified draws / rounds toggle
+    mix_label = "Rounds" if session_setup_data["rounds"] else "Category Mix"
+    category_btn = layout.create_positioned_button(
+        x_percent=0.05,
+        y_percent=0.6,
+        width_percent=0.25,
+        height_percent=0.06,
+        color=(0, 200, 0) if session_setup_data["category_mix"] else (128, 128, 128),
+        text=f"{mix_label}: On" if session_setup_data["category_mix"] else f"{mix_label}: Off"
+    )
+    
+    # Adaptive question selection toggle
+    adaptive_btn = layout.create_positioned_button(
+        x_percent=0.05,
+        y_percent=0.68,
+        width_percent=0.25,
+        height_percent=0.06,
+        color=(0, 200, 0) if session_setup_data["adaptive"] else (128, 128, 128),
+        text="Adaptive: On" if session_setup_data["adaptive"] else "Adaptive: Off"
+    )
+    
     # Create session button
     create_session_btn = layout.create_centered_button(
         y_percent=0.75,
@@ -492,7 +760,8 @@ def draw_session_setup(layout):
         text="Back"
     )
     
-    return back_btn, question_group_buttons, time_box, create_session_btn
+    return (back_btn, question_group_buttons, time_box, mode_btn, events_btn, adaptive_btn,
+            category_btn, create_session_btn)
 
 def draw_team_setup(layout):
     """Draw the team setup screen with responsive elements."""
@@ -550,6 +819,7 @@ def draw_team_setup(layout):
 
 def draw_gameplay(layout):
     """Draw the main gameplay screen with responsive elements."""
+    from game_logic import question_display_text
     layout.display_manager.screen.fill('white')
     
     # Check for active session
@@ -564,7 +834,8 @@ def draw_gameplay(layout):
         )
         return end_btn, None, None, None
     
-    s_data = db.get_session(game_logic.current_session_id)
+    # Session info is cached by GameLogic, so frames never hit the DB
+    s_data = game_logic.current_session_info
     if not s_data or not s_data["is_active"]:
         layout.draw_text_centered(0.08, "Session is not active!", size_multiplier=1.2, color=(255, 0, 0))
         end_btn = layout.create_centered_button(
@@ -576,36 +847,37 @@ def draw_gameplay(layout):
         )
         return end_btn, None, None, None
     
-    # Question handling
-    if "active_question" not in question_data or question_data["active_question"] is None:
-        print(f"[DEBUG] Loading new question for session {game_logic.current_session_id}")
-        # Check if any questions are available
-        available = db.any_questions_left_for_session(game_logic.current_session_id, s_data['question_group_id'])
-        if not available:
-            print("[DEBUG] No questions available")
-            question_data["active_question"] = None
-        else:
-            print("[DEBUG] Getting next question")
-            q = game_logic.begin_game_loop()
-            question_data["active_question"] = q
-            question_data["user_answer"] = ""
-            print(f"[DEBUG] Loaded question: {q['question'] if q else 'None'}")
+    draw_room_header(layout)
     
+    # The question was opened on entering the screen (enter_gameplay)
     aq = question_data.get("active_question")
+    if aq is None and game_logic.mode.picks_questions and game_logic.questions_left():
+        return draw_question_board(layout)
     if aq is None:
-        if not db.any_questions_left_for_session(game_logic.current_session_id, s_data['question_group_id']):
-            end_btn = draw_final_scores(layout)
-            return end_btn, None, None, None
+        # Either the group is used up or the last round is over
+        end_btn = draw_final_scores(layout)
+        return end_btn, None, None, None
     
     # Display question
     qtype = aq["question_type"]
-    q_text = aq["question"]
-    
-    if qtype == "fill_in_blank" and aq.get("fill_in_blank_text"):
-        pat = re.escape(aq["fill_in_blank_text"])
-        q_text = re.sub(pat, "_____", q_text, flags=re.IGNORECASE)
-    
-    layout.draw_text_centered(0.1, q_text, size_multiplier=1.2)
+    q_text = question_display_text(aq)
+    
+    round_name = game_logic.current_round_name()
+    if round_name:
+        layout.draw_text_centered(0.03, round_name, size_multiplier=0.7, color=(100, 100, 100))
+    
+    # Long questions wrap, and shrink if they still don't fit above the answers
+    layout.draw_text_block(layout.text_box(*QUESTION_BOX), q_text, size_multiplier=QUESTION_TEXT_SIZE)
+    
+    # Rapid-fire modes skip the feedback screen, so the last result shows here
+    if game_logic.mode.rapid_fire and "last_was_correct" in question_data:
+        msg_text, was_correct = answer_result_text()
+        event = question_data.get("random_event")
+        if event:
+            msg_text += "  |  " + random_event_text(event)
+        layout.draw_text_centered(
+            0.72, msg_text, size_multiplier=0.7, color=(0, 150, 0) if was_correct else (255, 0, 0)
+        )
     
     # End session button
     end_btn = layout.create_positioned_button(
@@ -620,14 +892,34 @@ def draw_gameplay(layout):
     clickable_buttons = []
     current_y = 0.2
     
+    # In buzz-in mode nobody may answer until a team has buzzed
+    awaiting_buzz = buzz_in_active() and question_data.get("buzz_winner") is None
+    if buzz_in_active():
+        if awaiting_buzz:
+            keys = ", ".join(
+                f"{t['team_name']} [{buzzer.key_name_for_team(t['team_id'])}]"
+                for t in game_logic.teams
+            )
+            layout.draw_text_centered(current_y, "Buzz in!  " + keys, size_multiplier=0.8, color=(0, 0, 255))
+        else:
+            layout.draw_text_centered(
+                current_y,
+                f"{get_team_name(question_data['buzz_winner'])} buzzed in!",
+                size_multiplier=0.8,
+                color=(0, 150, 0)
+            )
+        current_y += 0.08
+    
     # Handle different question types
-    if qtype == "multiple_choice":
+    if awaiting_buzz:
+        pass
+    elif qtype == "multiple_choice":
         options = aq.get("options", [])
         for i, opt in enumerate(options):
             btn = layout.create_centered_button(
                 y_percent=current_y,
-                width_percent=0.7,
-                height_percent=0.08,
+                width_percent=OPTION_BUTTON_SIZE[0],
+                height_percent=OPTION_BUTTON_SIZE[1],
                 color=(0, 0, 255),
                 text=opt["text"]
             )
@@ -680,7 +972,28 @@ def draw_gameplay(layout):
             ("OPEN_CORRECT", None, correct_btn),
             ("OPEN_WRONG", None, wrong_btn)
         ])
+        
+        if question_data.get("remote_answer"):
+            layout.draw_text_block(
+                layout.text_box(current_y + 0.1, 0.08),
+                f"Phone answer: {question_data['remote_answer']}",
+                size_multiplier=0.8,
+                color=(0, 0, 255)
+            )
+    
+    # With the audience on a projector, the host view can show the answer
+    if audience and not awaiting_buzz:
+        answer = correct_answer_text(aq)
+        if answer:
+            layout.draw_text_block(layout.text_box(0.76, 0.07), f"Answer: {answer}",
+                                   size_multiplier=0.8, color=(0, 150, 0))
+    
+    draw_score_controls(layout, clickable_buttons)
     
+    return end_btn, None, clickable_buttons, None
+
+def draw_score_controls(layout, clickable_buttons):
+    """Scoreboard with manual corrections, plus Undo / Redo."""
     # Display scores
     current_y = 0.5
     layout.draw_text_centered(current_y, "Scores:", size_multiplier=0.8)
@@ -689,11 +1002,137 @@ def draw_gameplay(layout):
     scores = game_logic.get_scores()
     for tid, sc in scores.items():
         team_name = get_team_name(tid)
-        layout.draw_text_centered(current_y, f"{team_name}: {sc}", size_multiplier=0.8)
+        # New scores count up (or down) from what is on screen
+        key = ("score", game_logic.current_session_id, tid)
+        last = shown_scores.get(key)
+        if last is not None and last != sc:
+            animator.animate(key, animator.value(key, last), sc, SCORE_COUNT_S)
+        shown_scores[key] = sc
+        shown = round(animator.value(key, sc, layout.text_box(current_y, 0.05, 0.05, 0.68)))
+        layout.draw_text_centered(current_y, f"{team_name}: {shown}", size_multiplier=0.8)
+        
+        # Manual score correction
+        minus_btn = layout.create_positioned_button(
+            x_percent=0.75,
+            y_percent=current_y,
+            width_percent=0.06,
+            height_percent=0.045,
+            color=(200, 0, 0),
+            text=f"-{SCORE_ADJUST_STEP}"
+        )
+        plus_btn = layout.create_positioned_button(
+            x_percent=0.83,
+            y_percent=current_y,
+            width_percent=0.06,
+            height_percent=0.045,
+            color=(0, 200, 0),
+            text=f"+{SCORE_ADJUST_STEP}"
+        )
+        clickable_buttons.extend([
+            ("SCORE_ADJUST", (tid, -SCORE_ADJUST_STEP), minus_btn),
+            ("SCORE_ADJUST", (tid, SCORE_ADJUST_STEP), plus_btn)
+        ])
         current_y += 0.05
     
+    # Undo / redo the last scoring actions
+    if game_logic.can_undo():
+        undo_btn = layout.create_positioned_button(
+            x_percent=0.3,
+            y_percent=0.85,
+            width_percent=0.12,
+            height_percent=0.08,
+            color=(128, 128, 128),
+            text="Undo"
+        )
+        clickable_buttons.append(("UNDO", None, undo_btn))
+    if game_logic.can_redo():
+        redo_btn = layout.create_positioned_button(
+            x_percent=0.44,
+            y_percent=0.85,
+            width_percent=0.12,
+            height_percent=0.08,
+            color=(128, 128, 128),
+            text="Redo"
+        )
+        clickable_buttons.append(("REDO", None, redo_btn))
+    
+
+def draw_question_board(layout):
+    """Grid mode: the team whose turn it is picks a tile."""
+    layout.draw_text_centered(
+        0.04,
+        f"{get_team_name(game_logic.get_current_team_id())}, pick a question!",
+        size_multiplier=1.0
+    )
+    
+    clickable_buttons = []
+    columns = game_logic.mode.tiles()
+    col_width = 0.9 / max(len(columns), 1)
+    # Tiles taken since the board was last on screen turn over (not on resume)
+    sid = game_logic.current_session_id
+    closed = {q_id for _, tiles in columns for q_id, _, still_open in tiles if not still_open}
+    for q_id in closed - board_closed.setdefault(sid, closed):
+        animator.animate(("tile", sid, q_id), 0.0, 1.0, TILE_FLIP_S, linear)
+    board_closed[sid] = closed
+    for c_idx, (category, tiles) in enumerate(columns):
+        x = 0.05 + c_idx * col_width
+        header = layout.render_text(category, (0, 0, 0), size_multiplier=0.6)
+        layout.display_manager.screen.blit(header, (
+            int(layout.screen_width * x),
+            int(layout.screen_height * 0.1)
+        ))
+        for r_idx, (q_id, points, still_open) in enumerate(tiles):
+            if animator.running(("tile", sid, q_id)):
+                draw_tile_flip(layout, ("tile", sid, q_id), x, 0.15 + r_idx * 0.065, col_width - 0.01, 0.055,
+                               str(points))
+                continue
+            btn = layout.create_positioned_button(
+                x_percent=x,
+                y_percent=0.15 + r_idx * 0.065,
+                width_percent=col_width - 0.01,
+                height_percent=0.055,
+                color=(0, 0, 200) if still_open else (200, 200, 200),
+                text=str(points) if still_open else ""
+            )
+            if still_open:
+                clickable_buttons.append(("PICK", q_id, btn))
+    
+    end_btn = layout.create_positioned_button(
+        x_percent=0.05,
+        y_percent=0.85,
+        width_percent=0.2,
+        height_percent=0.08,
+        color=(255, 0, 0),
+        text="End Session"
+    )
+    draw_score_controls(layout, clickable_buttons)
     return end_btn, None, clickable_buttons, None
 
+def draw_tile_flip(layout, key, x_percent, y_percent, width_percent, height_percent, label):
+    """
+    A grid tile (showing `label`) squeezed to its edge and opened again as
+    the closed tile. Drawn with plain rects rather than draw_button: the
+    face is a different width every frame, and each width would render
+    and cache a new button skin.
+    """
+    tile = layout.text_box(y_percent, height_percent, x_percent, width_percent)
+    flip = animator.value(key, 1.0, tile.union(tile.move(0, SHADOW_OFFSET)))
+    width = max(1, int(tile.width * abs(1 - 2 * flip)))
+    face = pygame.Rect(0, tile.y, width, tile.height)
+    face.centerx = tile.centerx
+    color = (0, 0, 200) if flip < 0.5 else (200, 200, 200)
+    radius = min(BUTTON_RADIUS, width // 2)
+    screen = layout.display_manager.screen
+    pygame.draw.rect(screen, (0, 0, 0), face.move(0, SHADOW_OFFSET), border_radius=radius)
+    pygame.draw.rect(screen, color, face, border_radius=radius)
+    pygame.draw.rect(screen, adjust_color(color, 50), (face.x, face.y, width, 2), border_radius=radius)
+    if flip < 0.5 and label:
+        # The open face's label, laid out for the full tile (cached) and squeezed with it
+        size, lines = layout.fit_button_text(tile, label)
+        text = layout.text_cache.render(lines[0], size, (255, 255, 255))
+        text = pygame.transform.scale(text, (max(1, text.get_width() * width // tile.width), text.get_height()))
+        screen.blit(text, text.get_rect(center=face.center))
+
 def draw_final_scores(layout):
     """Draw the final scores screen with responsive elements."""
     layout.display_manager.screen.fill('white')
@@ -746,19 +1185,24 @@ def draw_feedback(layout):
     layout.display_manager.screen.fill('white')
     
     # Title
+    draw_room_header(layout)
     layout.draw_text_centered(0.08, "Result", size_multiplier=1.5)
     
     # Result message
-    was_correct = question_data.get("last_was_correct", False)
+    msg_text, was_correct = answer_result_text()
     if was_correct:
-        msg_text = f"Correct! +{question_data.get('last_points', 0)} points!"
         msg_color = (0, 255, 0)  # Green
     else:
-        msg_text = "Incorrect!"
         msg_color = (255, 0, 0)  # Red
     
     layout.draw_text_centered(0.25, msg_text, size_multiplier=1.2, color=msg_color)
     
+    if question_data.get("random_event"):
+        layout.draw_text_centered(
+            0.35, random_event_text(question_data["random_event"]),
+            size_multiplier=0.9, color=(200, 120, 0)
+        )
+    
     # Control buttons
     next_btn = layout.create_centered_button(
         y_percent=0.5,
@@ -776,68 +1220,214 @@ def draw_feedback(layout):
         text="End Session"
     )
     
-    return next_btn, end_btn
+    undo_btn = None
+    if game_logic.can_undo():
+        undo_btn = layout.create_positioned_button(
+            x_percent=0.05,
+            y_percent=0.85,
+            width_percent=0.2,
+            height_percent=0.08,
+            color=(128, 128, 128),
+            text="Undo Score"
+        )
+    
+    return next_btn, end_btn, undo_btn
+
+
+# ---------------------------
+# Audience Window
+# ---------------------------
+def correct_answer_text(aq):
+    if aq["question_type"] == "multiple_choice":
+        return ", ".join(o["text"] for o in aq.get("options", []) if o["is_correct"])
+    if aq["question_type"] == "fill_in_blank":
+        return aq.get("fill_in_blank_text")
+    return None
+
+
+def audience_content_key():
+    """
+    Everything the audience view depends on; it is redrawn only when this changes.
+    """
+    aq = question_data.get("active_question")
+    return (
+        current_state,
+        state_sync.version,
+        aq["id"] if aq else None,
+        question_data.get("buzz_winner"),
+        question_data.get("last_was_correct"),
+        audience.current_width,
+        audience.current_height,
+    )
+
+
+def host_frame_key(mouse_pos, mouse_pressed):
+    """
+    What the host view shows apart from animations. While it stays the
+    same, a frame only sends the animated areas to the display.
+    """
+    aq = question_data.get("active_question")
+    time_left = game_logic.question_time_left()
+    return (
+        current_state,
+        state_sync.version,
+        game_logic.current_session_id,
+        aq["id"] if aq else None,
+        question_data.get("buzz_winner"),
+        question_data.get("remote_answer"),
+        question_data.get("last_was_correct"),
+        None if time_left is None else round(time_left),
+        mouse_pos,
+        mouse_pressed,
+        display_manager.current_width,
+        display_manager.current_height,
+    )
+
+
+def draw_audience(layout):
+    """
+    Draw the projector view from the same in-memory state as the host view
+    (question_data + state_sync.state). No answers, no controls, no DB calls.
+    """
+    from game_logic import question_display_text
+    layout.display_manager.screen.fill('white')
+    st = state_sync.state
+    aq = question_data.get("active_question") if current_state == GAMEPLAY else None
+
+    if aq:
+        layout.draw_text_block(layout.text_box(0.04, 0.15), question_display_text(aq), size_multiplier=1.4)
+        current_y = 0.25
+        for i, opt in enumerate(aq.get("options", [])):
+            rect = pygame.Rect(
+                int(layout.screen_width * 0.15),
+                int(layout.screen_height * current_y),
+                int(layout.screen_width * 0.7),
+                int(layout.screen_height * 0.08),
+            )
+            layout.draw_button(rect, (0, 0, 255), f"{chr(65 + i)}. {opt['text']}", (255, 255, 255))
+            current_y += 0.1
+        if question_data.get("buzz_winner") is not None:
+            layout.draw_text_centered(
+                0.2, f"{get_team_name(question_data['buzz_winner'])} buzzed in!",
+                size_multiplier=0.9, color=(0, 150, 0)
+            )
+    elif current_state == FEEDBACK:
+        msg_text, was_correct = answer_result_text()
+        msg_color = (0, 200, 0) if was_correct else (255, 0, 0)
+        layout.draw_text_centered(0.25, msg_text, size_multiplier=1.6, color=msg_color)
+        if question_data.get("random_event"):
+            layout.draw_text_centered(
+                0.4, random_event_text(question_data["random_event"]),
+                size_multiplier=1.1, color=(200, 120, 0)
+            )
+    else:
+        layout.draw_text_centered(0.3, "Clynboozle", size_multiplier=2.5)
+
+    if st["teams"]:
+        current_y = 0.7
+        layout.draw_text_centered(current_y, "Scores", size_multiplier=0.9)
+        current_y += 0.05
+        for team_id, team_name in st["teams"]:
+            marker = "> " if team_id == st["turn"] else ""
+            layout.draw_text_centered(
+                current_y,
+                f"{marker}{team_name}: {st['scores'].get(str(team_id), 0)}",
+                size_multiplier=0.8
+            )
+            current_y += 0.05
+
+
+def toggle_audience(layout):
+    """Open or close the projector window; its layout shares the host's text cache."""
+    global audience, audience_layout
+    if audience:
+        audience.close()
+        audience = None
+        audience_layout = None
+        return
+    from audience_window import AudienceDisplay
+    try:
+        audience = AudienceDisplay()
+    except RuntimeError as exc:
+        print(f"[UI] {exc}")
+        return
+    audience_layout = ResponsiveLayout(audience, text_cache=layout.text_cache)
 
 
 # ---------------------------
 # Event Handlers
 # ---------------------------
 def handle_main_menu(event, buttons):
-    global current_state
-    start_game_btn, manage_question_groups_btn, quit_btn = buttons
+    from question_pack import PackFormatError
+    start_game_btn, manage_question_groups_btn, quit_btn, resume_btn = buttons
     if start_game_btn.collidepoint(event.pos):
-        current_state = SESSION_SETUP
+        change_state(SESSION_SETUP)
+    elif resume_btn and resume_btn.collidepoint(event.pos):
+        try:
+            logic = session_manager.load_room(resume_cache["session_id"])
+        except (OSError, PackFormatError) as e:
+            # The session plays from a question pack that was moved, deleted or replaced
+            print(f"[UI] Could not resume session {resume_cache['session_id']}: {e}")
+            missing = getattr(e, "filename", None)
+            screen_data["resume_error"] = f"Question pack not found: {os.path.basename(missing)}" if missing \
+                else "The session's question pack can't be read"
+            return
+        if logic:
+            print(f"[UI] Resumed session {logic.current_session_id}")
+            show_room(logic)
     elif manage_question_groups_btn.collidepoint(event.pos):
-        current_state = MANAGE_GROUPS
+        change_state(MANAGE_GROUPS)
     elif quit_btn.collidepoint(event.pos):
+        for logic in session_manager.rooms.values():
+            logic.flush_answers()
         pygame.quit()
         exit()
 
 
 def handle_manage_question_groups(event, buttons):
-    global current_state
     back_btn, add_question_group_btn, select_question_group_btn = buttons
     if back_btn.collidepoint(event.pos):
-        current_state = MAIN_MENU
+        change_state(MAIN_MENU)
     elif add_question_group_btn.collidepoint(event.pos):
-        current_state = ADD_GROUP
+        change_state(ADD_GROUP)
     elif select_question_group_btn.collidepoint(event.pos):
-        current_state = SELECT_GROUP
+        change_state(SELECT_GROUP)
 
 
 def handle_add_question_group(event, buttons):
-    global current_state, input_text
+    global input_text
     back_btn, input_box, save_btn = buttons
     if back_btn.collidepoint(event.pos):
-        current_state = MANAGE_GROUPS
+        change_state(MANAGE_GROUPS)
     elif save_btn.collidepoint(event.pos) and input_text:
         db.insert_question_group(input_text)
         input_text = ""
-        current_state = MANAGE_GROUPS
+        change_state(MANAGE_GROUPS)
 
 
 def handle_select_question_group(event, buttons):
-    global current_state, selected_question_group_id
+    global selected_question_group_id
     back_btn, question_group_buttons = buttons
     if back_btn.collidepoint(event.pos):
-        current_state = MANAGE_GROUPS
+        change_state(MANAGE_GROUPS)
     else:
         for group_btn, g_id in question_group_buttons:
             if group_btn.collidepoint(event.pos):
                 selected_question_group_id = g_id
-                current_state = VIEW_GROUP
+                change_state(VIEW_GROUP)
 
 
 def handle_view_question_group(event, buttons):
-    global current_state, question_data
+    global question_data
     back_btn, add_question_btn, delete_question_group_btn, question_buttons = buttons
     if back_btn.collidepoint(event.pos):
-        current_state = SELECT_GROUP
+        change_state(SELECT_GROUP)
     elif add_question_btn.collidepoint(event.pos):
-        current_state = SELECT_QUESTION_TYPE
+        change_state(SELECT_QUESTION_TYPE)
     elif delete_question_group_btn.collidepoint(event.pos):
         db.delete_question_group(selected_question_group_id)
-        current_state = SELECT_GROUP
+        session_manager.questions.invalidate(selected_question_group_id)
+        change_state(SELECT_GROUP)
     else:
         for q_btn, del_btn, q_id in question_buttons:
             if q_btn.collidepoint(event.pos):
@@ -856,19 +1446,21 @@ def handle_view_question_group(event, buttons):
                         question_data["blank_text"] = existing_q.get(
                             "fill_in_blank_text", ""
                         )
-                    current_state = ADD_QUESTIONS
+                    change_state(ADD_QUESTIONS)
                 else:
                     print(f"Question ID {q_id} not found in DB.")
             elif del_btn.collidepoint(event.pos):
                 db.delete_question(q_id)
+                session_manager.questions.invalidate(selected_question_group_id)
                 print(f"Deleted Question ID {q_id}")
+                enter_view_group()
 
 
 def handle_select_question_type(event, buttons):
-    global current_state, selected_question_type, question_data
+    global selected_question_type, question_data
     back_btn, multiple_choice_btn, fill_in_blank_btn, open_ended_btn = buttons
     if back_btn.collidepoint(event.pos):
-        current_state = VIEW_GROUP
+        change_state(VIEW_GROUP)
     elif multiple_choice_btn.collidepoint(event.pos):
         selected_question_type = "multiple_choice"
         question_data = {
@@ -882,7 +1474,7 @@ def handle_select_question_type(event, buttons):
             "category": "",
             "is_edit": False,
         }
-        current_state = ADD_QUESTIONS
+        change_state(ADD_QUESTIONS)
     elif fill_in_blank_btn.collidepoint(event.pos):
         selected_question_type = "fill_in_blank"
         question_data = {
@@ -893,7 +1485,7 @@ def handle_select_question_type(event, buttons):
             "category": "",
             "is_edit": False,
         }
-        current_state = ADD_QUESTIONS
+        change_state(ADD_QUESTIONS)
     elif open_ended_btn.collidepoint(event.pos):
         selected_question_type = "open_ended"
         question_data = {
@@ -903,15 +1495,15 @@ def handle_select_question_type(event, buttons):
             "category": "",
             "is_edit": False,
         }
-        current_state = ADD_QUESTIONS
+        change_state(ADD_QUESTIONS)
 
 
 def handle_add_questions_click(event, buttons):
-    global current_state, question_data, focused_field
+    global question_data, focused_field
     back_btn, input_fields, add_choice_btn, save_btn = buttons
 
     if back_btn.collidepoint(event.pos):
-        current_state = SELECT_QUESTION_TYPE
+        change_state(SELECT_QUESTION_TYPE)
         return
 
     if add_choice_btn and add_choice_btn.collidepoint(event.pos):
@@ -964,9 +1556,10 @@ def handle_add_questions_click(event, buttons):
                     "options": question_data.get("options", []),
                 }
             )
+        session_manager.questions.invalidate(selected_question_group_id)
         print(f"Saved/Updated Question: {question_data}")
         question_data.clear()
-        current_state = VIEW_GROUP
+        change_state(VIEW_GROUP)
         return
 
     for name, rect in input_fields:
@@ -1035,15 +1628,41 @@ def handle_add_questions_toggle_correct(field_name):
 
 def handle_session_setup(event, buttons):
     """Handle session setup events."""
-    global current_state, session_setup_data, focused_field
-    back_btn, question_group_buttons, time_box, create_session_btn = buttons
+    global session_setup_data, focused_field, game_logic
+    from game_modes import MODES
+    (back_btn, question_group_buttons, time_box, mode_btn, events_btn, adaptive_btn,
+     category_btn, create_session_btn) = buttons
 
     if back_btn.collidepoint(event.pos):
-        current_state = MAIN_MENU
+        change_state(MAIN_MENU)
+        return
+
+    if mode_btn.collidepoint(event.pos):
+        names = list(MODES)
+        session_setup_data["game_mode"] = names[
+            (names.index(session_setup_data["game_mode"]) + 1) % len(names)
+        ]
+        return
+
+    if events_btn.collidepoint(event.pos):
+        session_setup_data["random_events"] = not session_setup_data["random_events"]
+        return
+
+    if adaptive_btn.collidepoint(event.pos):
+        session_setup_data["adaptive"] = not session_setup_data["adaptive"]
+        return
+
+    if category_btn.collidepoint(event.pos):
+        session_setup_data["category_mix"] = not session_setup_data["category_mix"]
         return
 
     for btn, gid in question_group_buttons:
         if btn.collidepoint(event.pos):
+            session_setup_data["use_pack"] = gid is None
+            if gid is None:
+                session_setup_data["question_group_id"] = None
+                print(f"[UI] Chose question pack {session_setup_data['question_pack']}")
+                continue
             # Store only the numeric ID
             session_setup_data["question_group_id"] = int(gid)
             print(f"[UI] Chose question group {gid}")
@@ -1053,7 +1672,7 @@ def handle_session_setup(event, buttons):
         return
 
     if create_session_btn.collidepoint(event.pos):
-        if not session_setup_data["question_group_id"]:
+        if not session_setup_data["question_group_id"] and not session_setup_data["use_pack"]:
             print("[UI] No question group selected!")
             return
         try:
@@ -1062,12 +1681,29 @@ def handle_session_setup(event, buttons):
             print("[UI] Invalid time-per-question input.")
             return
             
-        # Create session using the game_logic instance which has a db instance
-        sid = game_logic.create_new_session(tpq, int(session_setup_data["question_group_id"]))
-        print(f"[UI] Created session {sid}")
+        # Each new session is a room of its own; other rooms keep running
+        # Category mix takes precedence over adaptive selection when both are on
+        mode_options = {
+            "adaptive": session_setup_data["adaptive"],
+            "category_mix": session_setup_data["category_mix"],
+            "rounds": session_setup_data["rounds"] if session_setup_data["category_mix"] else None,
+            "random_events": session_setup_data["random_events"],
+        }
+        if session_setup_data["use_pack"]:
+            game_logic = session_manager.create_room(
+                tpq, None, session_setup_data["game_mode"], mode_options,
+                question_pack=session_setup_data["question_pack"]
+            )
+        else:
+            game_logic = session_manager.create_room(
+                tpq, int(session_setup_data["question_group_id"]),
+                session_setup_data["game_mode"], mode_options
+            )
+        sid = game_logic.current_session_id
+        print(f"[UI] Created session {sid} ({session_setup_data['game_mode']} mode)")
         global team_list
         team_list = []
-        current_state = TEAM_SETUP
+        change_state(TEAM_SETUP)
 
 
 def handle_session_setup_keydown(event):
@@ -1084,11 +1720,13 @@ def handle_session_setup_keydown(event):
 
 
 def handle_team_setup(event, buttons):
-    global current_state, team_input_text, team_list, focused_field, question_data
+    global team_input_text, team_list, focused_field, question_data, game_logic
     back_btn, team_box, add_team_btn, done_btn = buttons
 
     if back_btn.collidepoint(event.pos):
-        current_state = SESSION_SETUP
+        # Drop the session made for this setup rather than leave an empty room open
+        game_logic = session_manager.close_room(game_logic.current_session_id)
+        change_state(SESSION_SETUP)
         return
 
     if team_box.collidepoint(event.pos):
@@ -1110,13 +1748,15 @@ def handle_team_setup(event, buttons):
             
         # Set up teams
         game_logic.setup_teams(team_list)
+        if buzz_in_active():
+            buzzer.assign_keys([t["team_id"] for t in game_logic.teams])
         
         # Initialize question state
         question_data.clear()  # Clear any old state
         question_data["active_question"] = None
         
         print("[UI] Teams set up! Moving to gameplay.")
-        current_state = GAMEPLAY
+        change_state(GAMEPLAY)
 
 
 def handle_team_setup_keydown(event):
@@ -1130,19 +1770,21 @@ def handle_team_setup_keydown(event):
 
 
 def handle_gameplay(event, buttons):
-    global current_state, question_data, focused_field
+    global question_data, focused_field
     end_btn, _, clickable_buttons, _ = buttons
 
     if end_btn and end_btn.collidepoint(event.pos):
-        game_logic.end_session()
-        question_data["active_question"] = None
-        current_state = MAIN_MENU
+        end_room()
         return
 
     if clickable_buttons:
         for btn_type, idx, rect in clickable_buttons:
             if rect.collidepoint(event.pos):
-                if btn_type == "MC_OPTION":
+                if btn_type == "PICK":
+                    open_question(game_logic.choose_question(idx))
+                    return
+
+                elif btn_type == "MC_OPTION":
                     handle_multiple_choice_click(idx)
                     return
 
@@ -1162,6 +1804,20 @@ def handle_gameplay(event, buttons):
                     handle_open_ended_correct(False)
                     return
 
+                elif btn_type == "SCORE_ADJUST":
+                    team_id, delta = idx
+                    game_logic.adjust_score(team_id, delta)
+                    print(f"[UI] Adjusted {get_team_name(team_id)} by {delta:+d}")
+                    return
+
+                elif btn_type == "UNDO":
+                    game_logic.undo_last_score()
+                    return
+
+                elif btn_type == "REDO":
+                    game_logic.redo_last_score()
+                    return
+
 
 def handle_gameplay_keydown(event):
     global question_data, focused_field
@@ -1186,17 +1842,7 @@ def handle_multiple_choice_click(option_index):
     pts = aq.get("points", 0)
     print(f"[UI] User clicked option '{chosen['text']}', was_correct={was_correct}")
 
-    game_logic.mark_answer(aq["id"], was_correct, pts)
-
-    question_data["last_was_correct"] = was_correct
-    if was_correct:
-        question_data["last_points"] = pts
-    else:
-        question_data["last_points"] = 0
-
-    question_data["active_question"] = None
-    global current_state
-    current_state = FEEDBACK
+    return finish_answer(aq, was_correct, pts)
 
 
 def handle_fill_in_blank_submit():
@@ -1211,14 +1857,7 @@ def handle_fill_in_blank_submit():
         f"[UI] Fill in blank submitted='{typed_ans}', correct='{correct}', was_correct={was_correct}"
     )
 
-    game_logic.mark_answer(aq["id"], was_correct, pts)
-
-    question_data["active_question"] = None
-    question_data["user_answer"] = ""
-    question_data["last_was_correct"] = was_correct
-    question_data["last_points"] = pts if was_correct else 0
-    global current_state
-    current_state = FEEDBACK
+    return finish_answer(aq, was_correct, pts)
 
 
 def handle_open_ended_correct(is_correct):
@@ -1229,38 +1868,326 @@ def handle_open_ended_correct(is_correct):
     was_correct = bool(is_correct)
     print(f"[UI] Open ended judged correct={was_correct}")
 
-    game_logic.mark_answer(aq["id"], was_correct, pts)
+    return finish_answer(aq, was_correct, pts)
+
+
+def finish_answer(aq, was_correct, pts):
+    """
+    Score the open question and show the result: on the feedback screen,
+    or in rapid-fire modes as a line under the next question. Returns
+    was_correct (the answer handlers pass it on; None = not accepted).
+    """
+    delta = game_logic.mark_answer(aq["id"], was_correct, pts)
+    roll_random_event()
     question_data["active_question"] = None
     question_data["user_answer"] = ""
     question_data["last_was_correct"] = was_correct
-    question_data["last_points"] = pts if was_correct else 0
-    global current_state
-    current_state = FEEDBACK
+    question_data["last_points"] = delta
+    if game_logic.mode is not None and game_logic.mode.rapid_fire:
+        open_next_question()
+    else:
+        change_state(FEEDBACK)
+    return was_correct
 
 
 def handle_feedback(event, buttons):
-    global current_state, question_data
-    next_btn, end_btn = buttons
+    global question_data
+    next_btn, end_btn, undo_btn = buttons
+
+    if undo_btn and undo_btn.collidepoint(event.pos):
+        undone = game_logic.undo_last_score()
+        if undone:
+            team_id, delta = undone
+            print(f"[UI] Undid {delta:+d} for {get_team_name(team_id)}")
+            # A random event is always the newest scoring action, so it goes first
+            question_data.pop("random_event", None)
+        return
 
     if next_btn.collidepoint(event.pos):
         question_data["active_question"] = None
         question_data.pop("last_was_correct", None)
+        question_data.pop("random_event", None)
 
-        current_state = GAMEPLAY
+        change_state(GAMEPLAY)
         return
 
     if end_btn.collidepoint(event.pos):
-        game_logic.end_session()
-        question_data.clear()
-        current_state = MAIN_MENU
+        end_room()
         return
 
 
+# ---------------------------
+# Remote Play
+# ---------------------------
+def handle_remote_command(command):
+    """
+    Apply a command sent from a phone (see remote_server.py) and return the
+    reply for that client. Always called on the pygame thread.
+    """
+    aq = question_data.get("active_question")
+    if current_state != GAMEPLAY or not aq:
+        return {"ok": False, "message": "No question is open"}
+    if command.get("question_id") not in (None, aq["id"]):
+        return {"ok": False, "message": "That question is already closed"}
+
+    ctype = command.get("type")
+    if ctype == "mark":
+        if aq["question_type"] != "open_ended":
+            return {"ok": False, "message": "Only open-ended answers are marked"}
+        handle_open_ended_correct(bool(command.get("correct")))
+        return {"ok": True, "message": "Marked"}
+
+    if ctype != "answer":
+        return {"ok": False, "message": f"Unknown command '{ctype}'"}
+
+    if buzz_in_active() and question_data.get("buzz_winner") is None:
+        return {"ok": False, "message": "Buzz in first!"}
+    if command.get("team_id") != game_logic.get_current_team_id():
+        return {"ok": False, "message": "It's not your turn"}
+
+    qtype = aq["question_type"]
+    if qtype == "multiple_choice":
+        try:
+            was_correct = handle_multiple_choice_click(int(command.get("option_index", -1)))
+        except (TypeError, ValueError):
+            return {"ok": False, "message": "Invalid option"}
+    elif qtype == "fill_in_blank":
+        question_data["user_answer"] = str(command.get("text", ""))
+        was_correct = handle_fill_in_blank_submit()
+    else:
+        question_data["remote_answer"] = str(command.get("text", ""))[:200]
+        state_sync.set_extra("submitted", question_data["remote_answer"])
+        return {"ok": True, "message": "Sent to the host"}
+
+    # Not the screen afterwards: in rapid-fire modes the next question is already open
+    if was_correct is None:
+        return {"ok": False, "message": "Invalid answer"}
+    was_correct = bool(was_correct)
+    return {
+        "ok": True,
+        "was_correct": was_correct,
+        "message": "Correct!" if was_correct else "Incorrect!",
+    }
+
+
+# ---------------------------
+# Screen State Machine
+# ---------------------------
+def change_state(new_state):
+    """
+    Leave the screen on display (its on_exit hook) and enter new_state
+    (on_enter). Screens load what they show in on_enter, once, so their
+    draw functions only read screen_data and memory. Entering the same
+    state again (another room, a changed list) reloads it.
+    """
+    global current_state
+    on_exit = SCREENS[current_state].get("on_exit")
+    if on_exit:
+        on_exit()
+    screen_data.clear()
+    after_frame.clear()
+    current_state = new_state
+    on_enter = SCREENS[new_state].get("on_enter")
+    if on_enter:
+        on_enter()
+
+
+def enter_group_list():
+    screen_data["groups"] = db.get_question_groups()
+
+
+def enter_view_group():
+    """Also called after a question is deleted, to show the list without it."""
+    screen_data["questions"] = db.get_questions_for_question_group(selected_question_group_id)
+    screen_data["stats"] = db.get_question_stats_for_group(selected_question_group_id)
+
+
+def enter_session_setup():
+    enter_group_list()
+    if session_setup_data["question_pack"]:
+        screen_data["pack"] = session_manager.questions.get_pack(session_setup_data["question_pack"])
+
+
+def enter_gameplay():
+    if game_logic.current_session_info and game_logic.current_session_info["is_active"] \
+            and question_data.get("active_question") is None:
+        open_next_question()
+
+
+def enter_feedback():
+    # Draw the next question in the background while the result is up
+    global prefetch_job
+    prefetch_job = Warmup([("next question", game_logic.prefetch_question)], name="prefetch").start()
+    after_frame.append(layout_prefetched_question)
+
+
+def exit_feedback():
+    # Wait for a draw still running, so the game mode is never used from two threads
+    global prefetch_job
+    if prefetch_job is not None:
+        prefetch_job.wait()
+        prefetch_job = None
+
+
+def exit_text_entry():
+    # A field focused on one screen doesn't keep the keyboard on the next
+    global focused_field
+    focused_field = None
+
+
+def layout_prefetched_question(layout):
+    """
+    Once the worker has drawn the next question, lay out its text
+    (wrapping, fitted sizes) so "Next Question" only has to blit it.
+    Fonts are only used from the main thread, so this part runs here,
+    after a frame; until the draw is done it checks again after the next.
+    """
+    from game_logic import question_display_text
+    if prefetch_job is None:
+        return
+    if not prefetch_job.done:
+        after_frame.append(layout_prefetched_question)
+        return
+    q = game_logic.prefetched
+    if q is None:
+        return
+    layout.fit_text_block(layout.text_box(*QUESTION_BOX), question_display_text(q),
+                          size_multiplier=QUESTION_TEXT_SIZE)
+    if q["question_type"] == "multiple_choice" and not buzz_in_active():
+        for opt in q.get("options", []):
+            layout.fit_button_text(layout.centered_rect(0.2, *OPTION_BUTTON_SIZE), opt["text"])
+
+
+def handle_add_question_group_keydown(event):
+    global input_text
+    if event.key == pygame.K_BACKSPACE:
+        input_text = input_text[:-1]
+    else:
+        input_text += event.unicode
+
+
+def handle_add_questions_mouse(event, buttons):
+    handle_add_questions_click(event, buttons)
+    _, input_fields, _, _ = buttons
+    for field_name, rect in input_fields:
+        if rect.collidepoint(event.pos) and field_name.startswith("toggle_correct_"):
+            handle_add_questions_toggle_correct(field_name)
+            break
+
+
+def handle_gameplay_key(event):
+    # A buzz-in key press goes to the arbiter, not the answer field
+    if buzzer.armed and buzzer.submit(event):
+        return
+    handle_gameplay_keydown(event)
+
+
+# draw(layout) -> buttons; click(event, buttons); key(event); on_enter(); on_exit()
+SCREENS = {
+    MAIN_MENU: {"draw": draw_main_menu, "click": handle_main_menu},
+    MANAGE_GROUPS: {"draw": draw_manage_question_groups, "click": handle_manage_question_groups},
+    ADD_GROUP: {
+        "draw": lambda layout: draw_add_question_group(layout, input_text),
+        "click": handle_add_question_group,
+        "key": handle_add_question_group_keydown,
+    },
+    SELECT_GROUP: {
+        "draw": draw_select_question_group,
+        "click": handle_select_question_group,
+        "on_enter": enter_group_list,
+    },
+    VIEW_GROUP: {
+        "draw": lambda layout: draw_view_question_group(layout, selected_question_group_id),
+        "click": handle_view_question_group,
+        "on_enter": enter_view_group,
+    },
+    SELECT_QUESTION_TYPE: {"draw": draw_select_question_type, "click": handle_select_question_type},
+    ADD_QUESTIONS: {
+        "draw": draw_add_questions,
+        "click": handle_add_questions_mouse,
+        "key": handle_add_questions_keydown,
+        "on_exit": exit_text_entry,
+    },
+    SESSION_SETUP: {
+        "draw": draw_session_setup,
+        "click": handle_session_setup,
+        "key": handle_session_setup_keydown,
+        "on_enter": enter_session_setup,
+        "on_exit": exit_text_entry,
+    },
+    TEAM_SETUP: {
+        "draw": draw_team_setup,
+        "click": handle_team_setup,
+        "key": handle_team_setup_keydown,
+        "on_exit": exit_text_entry,
+    },
+    GAMEPLAY: {
+        "draw": draw_gameplay,
+        "click": handle_gameplay,
+        "key": handle_gameplay_key,
+        "on_enter": enter_gameplay,
+    },
+    FEEDBACK: {
+        "draw": draw_feedback,
+        "click": handle_feedback,
+        "on_enter": enter_feedback,
+        "on_exit": exit_feedback,
+    },
+}
+
+
+# ---------------------------
+# Startup
+# ---------------------------
+def load_game():
+    """Import the DB, game rules and rooms and set up the shared objects."""
+    global db, session_manager, game_logic, state_sync
+    from db_manager import DBManager
+    from session_manager import SessionManager, POOL_SIZE
+    from state_sync import StateSync
+
+    db = DBManager(pool_size=POOL_SIZE, check_schema=False)  # schema is checked by the next warm-up step
+    session_manager = SessionManager(db)
+    game_logic = session_manager.active
+    state_sync = StateSync()
+    session_manager.add_listener(state_sync.on_game_event)
+    session_manager.add_listener(invalidate_resume_cache)
+
+
+def check_schema():
+    from db_manager import SCHEMA_VERSION
+
+    if db.create_tables():
+        print(f"[DB] Database schema created/updated to version {SCHEMA_VERSION}")
+
+
+def warm_fonts(layout):
+    """Load the fonts the menus use so the first real frame doesn't."""
+    for size_multiplier in WARM_FONT_SIZES:
+        layout.get_font(size_multiplier)
+    layout.text_cache.font(24)  # debug line
+
+
+def draw_splash(layout):
+    layout.display_manager.screen.fill('white')
+    layout.draw_text_centered(0.4, "Clynboozle", size_multiplier=1.5)
+    layout.draw_text_centered(0.55, "Loading...", size_multiplier=0.8)
+
+
+def print_startup_report():
+    for line in startup_profile.report():
+        print(line)
+    first_frame = startup_profile.time_of("first frame (splash)")
+    verdict = "OK" if first_frame <= FIRST_FRAME_BUDGET_MS else "over budget"
+    print(f"[STARTUP] time to first frame {first_frame:.1f} ms "
+          f"(budget {FIRST_FRAME_BUDGET_MS} ms, {verdict}); interpreter start-up not included")
+
+
 # ---------------------------
 # Main Loop
 # ---------------------------
-def main():
-    global current_state, input_text, focused_field
+def main(remote_port=None, open_audience=False, profile_startup=False):
+    global input_text, focused_field, remote
     clock = pygame.time.Clock()
     running = True
     buttons = None
@@ -1268,59 +2195,96 @@ def main():
     # Create a single layout instance
     layout = ResponsiveLayout(display_manager)
 
+    # Show something right away; the DB and fonts warm up behind the splash
+    draw_splash(layout)
+    display_manager.present()
+    startup_profile.mark("first frame (splash)")
+    warmup = Warmup([
+        ("game modules", load_game),
+        ("schema check", check_schema),
+        ("resume lookup", check_resume_session),
+        ("fonts", lambda: warm_fonts(layout)),
+    ], startup_profile).start()
+    while not warmup.wait(1.0 / FPS):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.VIDEORESIZE:
+                display_manager.request_resize(event.w, event.h)
+        if display_manager.settle_resize():
+            layout.update_scale_factors()
+        draw_splash(layout)
+        display_manager.present()
+    report_startup = profile_startup
+
+    if open_audience:
+        toggle_audience(layout)
+
+    if remote_port is not None:
+        from remote_server import RemoteServer, host_url
+        remote = RemoteServer(port=remote_port).start()
+        remote.attach_sync(state_sync)
+        print(f"[REMOTE] Players: http://<this-machine>:{remote.port}/")
+        print(f"[REMOTE] Host:    {host_url(remote, '<this-machine>')} (lists each team's join link)")
+
+    last_frame_key = None
+    last_full_frame = 0.0
     while running:
+        frame_start = buzzer.clock()
+        frame_time = animator.update()
+        had_input = False
+
         # Process all events first
         for event in pygame.event.get():
+            had_input = True
+            if audience and audience.owns_event(event):
+                if not audience.handle_event(event):
+                    toggle_audience(layout)
+                elif event.type == pygame.WINDOWSIZECHANGED:
+                    audience_layout.update_scale_factors()
+                continue
+            # Clicks land where they were drawn, also at a fixed base resolution
+            event = display_manager.map_event(event)
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
+                toggle_audience(layout)
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and session_manager.rooms:
+                # Next room; the one on screen keeps running in the background
+                stash_room()
+                show_room(session_manager.next_room())
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                # Set up another room alongside the open ones
+                stash_room()
+                change_state(SESSION_SETUP)
+                continue
             if event.type == pygame.VIDEORESIZE:
-                display_manager.update_display_size(event.w, event.h)
-                layout.update_scale_factors()
+                # Applied once the window stops changing size (settle_resize below)
+                display_manager.request_resize(event.w, event.h)
             elif event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                if current_state == MAIN_MENU:
-                    handle_main_menu(event, buttons)
-                elif current_state == MANAGE_GROUPS:
-                    handle_manage_question_groups(event, buttons)
-                elif current_state == ADD_GROUP:
-                    handle_add_question_group(event, buttons)
-                elif current_state == SELECT_GROUP:
-                    handle_select_question_group(event, buttons)
-                elif current_state == VIEW_GROUP:
-                    handle_view_question_group(event, buttons)
-                elif current_state == SELECT_QUESTION_TYPE:
-                    handle_select_question_type(event, buttons)
-                elif current_state == ADD_QUESTIONS:
-                    handle_add_questions_click(event, buttons)
-                    _, input_fields, _, _ = buttons
-                    for field_name, rect in input_fields:
-                        if rect.collidepoint(event.pos) and field_name.startswith("toggle_correct_"):
-                            handle_add_questions_toggle_correct(field_name)
-                            break
-                elif current_state == SESSION_SETUP:
-                    handle_session_setup(event, buttons)
-                elif current_state == TEAM_SETUP:
-                    handle_team_setup(event, buttons)
-                elif current_state == GAMEPLAY:
-                    handle_gameplay(event, buttons)
-                elif current_state == FEEDBACK:
-                    handle_feedback(event, buttons)
+                handle_click = SCREENS[current_state].get("click")
+                if handle_click and buttons is not None:
+                    handle_click(event, buttons)
             elif event.type == pygame.KEYDOWN:
-                if current_state == ADD_GROUP:
-                    if event.key == pygame.K_BACKSPACE:
-                        input_text = input_text[:-1]
-                    else:
-                        input_text += event.unicode
-                elif current_state == ADD_QUESTIONS:
-                    handle_add_questions_keydown(event)
-                elif current_state == SESSION_SETUP:
-                    handle_session_setup_keydown(event)
-                elif current_state == TEAM_SETUP:
-                    handle_team_setup_keydown(event)
-                elif current_state == GAMEPLAY:
-                    handle_gameplay_keydown(event)
+                handle_key = SCREENS[current_state].get("key")
+                if handle_key:
+                    handle_key(event)
+
+        if current_state == GAMEPLAY and buzz_in_active():
+            process_buzzer()
+
+        # Apply commands from phones; state changes reach them via state_sync
+        if remote:
+            remote.process_commands(handle_remote_command)
+
+        # One display rebuild per drag, when the size has settled
+        if display_manager.settle_resize():
+            layout.update_scale_factors()
 
         # Update mouse state after processing events
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = display_manager.map_pos(pygame.mouse.get_pos())
         mouse_pressed = pygame.mouse.get_pressed()[0]  # Left mouse button
         layout.update_mouse_state(mouse_pos, mouse_pressed)
 
@@ -1328,39 +2292,85 @@ def main():
         layout.display_manager.screen.fill('white')  # white background
 
         # Draw current state
-        if current_state == MAIN_MENU:
-            buttons = draw_main_menu(layout)
-        elif current_state == MANAGE_GROUPS:
-            buttons = draw_manage_question_groups(layout)
-        elif current_state == ADD_GROUP:
-            buttons = draw_add_question_group(layout, input_text)
-        elif current_state == SELECT_GROUP:
-            buttons = draw_select_question_group(layout)
-        elif current_state == VIEW_GROUP:
-            buttons = draw_view_question_group(layout, selected_question_group_id)
-        elif current_state == SELECT_QUESTION_TYPE:
-            buttons = draw_select_question_type(layout)
-        elif current_state == ADD_QUESTIONS:
-            buttons = draw_add_questions(layout)
-        elif current_state == SESSION_SETUP:
-            buttons = draw_session_setup(layout)
-        elif current_state == TEAM_SETUP:
-            buttons = draw_team_setup(layout)
-        elif current_state == GAMEPLAY:
-            buttons = draw_gameplay(layout)
-        elif current_state == FEEDBACK:
-            buttons = draw_feedback(layout)
+        buttons = SCREENS[current_state]["draw"](layout)
 
         # Debug info (optional, remove in production)
-        font = pygame.font.Font(None, 24)
         debug_text = f"Mouse: {mouse_pos}, Pressed: {mouse_pressed}"
-        debug_surf = font.render(debug_text, True, (0, 0, 0))
+        debug_surf = layout.text_cache.render(debug_text, 24, (0, 0, 0))
         layout.display_manager.screen.blit(debug_surf, (10, 10))
 
-        pygame.display.flip()
-        clock.tick(60)  # 60 FPS for smooth animations
-
+        # Only animations moved: send just their areas to the display
+        frame_key = host_frame_key(mouse_pos, mouse_pressed)
+        changed = had_input or frame_key != last_frame_key
+        if changed or frame_time - last_full_frame >= FULL_REFRESH_S:
+            display_manager.present()
+            last_full_frame = frame_time
+        else:
+            display_manager.present(animator.dirty_rects())
+        last_frame_key = frame_key
+        # Prefetching for the next screen, now that this frame is shown
+        # (a task that isn't ready yet queues itself for the next frame)
+        queued, after_frame[:] = after_frame[:], []
+        for task in queued:
+            task(layout)
+        if report_startup:
+            report_startup = False
+            startup_profile.mark("first menu frame")
+            print_startup_report()
+
+        # The audience view only redraws when what it shows has changed
+        if audience and audience.needs_redraw(audience_content_key()):
+            draw_audience(audience_layout)
+            audience.present()
+
+        # While a buzz window is open, spend the rest of the frame polling
+        # the input queue so presses are stamped as they arrive
+        if current_state == GAMEPLAY and buzzer.armed:
+            buzzer.poll_until(frame_start + 1000.0 / FPS)
+            process_buzzer()
+        # 60 FPS while anything moves or reacts, otherwise idle
+        clock.tick(FPS if changed or animator.active or mouse_pressed or buzzer.armed else IDLE_FPS)
+
+    for logic in session_manager.rooms.values():
+        logic.flush_answers()
+    session_manager.questions.close_packs()
+    db.close()
+    if remote:
+        remote.stop()
+    if audience:
+        audience.close()
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Clynboozle")
+    parser.add_argument("--remote", action="store_true",
+                        help="serve a phone page so teams can answer from the local network")
+    parser.add_argument("--remote-port", type=int, default=None, help="default 8765")
+    parser.add_argument("--audience", action="store_true",
+                        help="open the audience (projector) window at startup; F2 toggles it")
+    parser.add_argument("--rounds", metavar="FILE",
+                        help='JSON round quotas, e.g. [{"name": "Round 1", "quota": {"History": 3}}]')
+    parser.add_argument("--pack", metavar="FILE",
+                        help="offer a compiled question pack (python question_pack.py compile ...) in session setup")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print how long each startup step took once the menu is up")
+    parser.add_argument("--base-resolution", metavar="WxH",
+                        help="draw every screen at this size and scale it to the window, e.g. 1280x720")
+    args = parser.parse_args()
+    if args.base_resolution:
+        width, height = (int(n) for n in args.base_resolution.lower().split("x"))
+        display_manager.set_base_resolution(width, height)
+    if args.rounds:
+        with open(args.rounds) as f:
+            session_setup_data["rounds"] = json.load(f)
+        session_setup_data["category_mix"] = True
+    if args.pack:
+        session_setup_data["question_pack"] = os.path.abspath(args.pack)
+    remote_port = None
+    if args.remote:
+        from remote_server import DEFAULT_PORT
+        remote_port = args.remote_port or DEFAULT_PORT
+    main(remote_port=remote_port, open_audience=args.audience, profile_startup=args.profile_startup)
\ No newline at end of file
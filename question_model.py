@@ -0,0 +1,99 @@
+import sys
+
+# Options of a question that isn't multiple choice (shared, never mutated)
+NO_OPTIONS = ()
+
+
+class Option:
+    """
+    One multiple-choice option, readable like the option dicts it
+    replaces (option["text"]) or as attributes (option.text).
+    """
+
+    __slots__ = ("id", "text", "is_correct")
+
+    def __init__(self, id, text, is_correct):
+        self.id = id
+        self.text = text
+        self.is_correct = bool(is_correct)
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __repr__(self):
+        return f"Option({self.id}, {self.text!r}, {self.is_correct})"
+
+
+class Question:
+    """
+    A preloaded question: fixed __slots__ instead of a per-instance dict,
+    options as a tuple, and category / question_type interned so a bank
+    holds one copy of each however many questions share them.
+
+    Reads the same way as the dicts from DBManager.get_question
+    (question["points"], question.get("options", [])), so game modes,
+    GameLogic and the UI accept either; attributes work too. Banks are
+    shared by every room (see QuestionCache), so treat it as read-only.
+    """
+
+    __slots__ = ("id", "question_group_id", "question", "fill_in_blank_text", "points",
+                 "category", "question_type", "options", "attempts", "correct")
+
+    def __init__(self, id, question_group_id, question, fill_in_blank_text, points,
+                 category, question_type, options=NO_OPTIONS, attempts=0, correct=0):
+        self.id = id
+        self.question_group_id = question_group_id
+        self.question = question
+        self.fill_in_blank_text = fill_in_blank_text
+        self.points = points
+        self.category = sys.intern(category) if category else category
+        self.question_type = sys.intern(question_type) if question_type else question_type
+        self.options = options
+        self.attempts = attempts
+        self.correct = correct
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def to_dict(self):
+        """The equivalent question dict (options as a list of dicts)."""
+        question = {key: getattr(self, key) for key in self.__slots__}
+        question["options"] = [option.to_dict() for option in self.options]
+        return question
+
+    def __repr__(self):
+        return f"Question({self.id}, {self.question!r})"
+
+
+def build_bank(question_rows, option_rows):
+    """
+    Questions from query rows:
+      question_rows: (id, question_group_id, question, fill_in_blank_text,
+                      points, category, question_type, attempts, correct)
+      option_rows:   (question_id, option_id, option_text, is_correct)
+    Only multiple_choice questions keep their options.
+    """
+    options = {}
+    for q_id, opt_id, text, is_correct in option_rows:
+        options.setdefault(q_id, []).append(Option(opt_id, text, is_correct))
+    return [
+        Question(
+            q_id, group_id, text, blank, points, category, question_type,
+            tuple(options.get(q_id, NO_OPTIONS)) if question_type == "multiple_choice" else NO_OPTIONS,
+            attempts, correct,
+        )
+        for q_id, group_id, text, blank, points, category, question_type, attempts, correct in question_rows
+    ]
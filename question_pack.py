@@ -0,0 +1,333 @@
+import argparse
+import mmap
+import os
+import struct
+import tempfile
+
+from question_model import Question, Option, NO_OPTIONS
+
+# File layout (little-endian):
+#   header
+#   question records, fixed size, sorted by question id (binary searchable)
+#   option records, fixed size, each question's options contiguous
+#   string table: UTF-8, every distinct string stored once
+# Strings are referenced as (offset into the string table, byte length).
+PACK_MAGIC = b"CLYNPACK"
+PACK_VERSION = 1
+PACK_SUFFIX = ".clynpack"
+
+# magic, version, flags, questions, options, total points,
+# questions offset, options offset, strings offset, name (offset, length)
+HEADER = struct.Struct("<8sHHIIqQQQII")
+# id, points, attempts, correct, question, fill_in_blank_text, category,
+# question_type (offset, length each), first option, option count, flags
+QUESTION_RECORD = struct.Struct("<qiII8IIHH")
+# id, text (offset, length), is_correct
+OPTION_RECORD = struct.Struct("<qIIB3x")
+QUESTION_ID = struct.Struct("<q")
+
+# Question record flags: which nullable columns are NULL
+NULL_POINTS = 1
+NULL_BLANK = 2
+NULL_CATEGORY = 4
+NULL_TYPE = 8
+
+
+class PackFormatError(ValueError):
+    pass
+
+
+# ---------------------------
+# Writing
+# ---------------------------
+def write_pack(path, questions, name=""):
+    """
+    Compile questions (dicts or Question objects, as from
+    DBManager.get_question_bank) into a pack file at `path`. Written to a
+    temporary file first, so a half-written pack never replaces a good one.
+    Returns the number of questions written.
+    """
+    strings = bytearray()
+    string_refs = {}
+
+    def ref(text):
+        if text is None:
+            return 0, 0
+        found = string_refs.get(text)
+        if found is None:
+            data = text.encode("utf-8")
+            found = string_refs[text] = (len(strings), len(data))
+            strings.extend(data)
+        return found
+
+    name_ref = ref(name)
+    questions = sorted(questions, key=lambda q: q["id"])
+    question_records = bytearray()
+    option_records = bytearray()
+    option_count = 0
+    total_points = 0
+    for q in questions:
+        options = q.get("options") or NO_OPTIONS
+        flags = ((NULL_POINTS if q["points"] is None else 0)
+                 | (NULL_BLANK if q.get("fill_in_blank_text") is None else 0)
+                 | (NULL_CATEGORY if q.get("category") is None else 0)
+                 | (NULL_TYPE if q.get("question_type") is None else 0))
+        question_records += QUESTION_RECORD.pack(
+            q["id"], q["points"] or 0, q.get("attempts", 0), q.get("correct", 0),
+            *ref(q["question"]), *ref(q.get("fill_in_blank_text")),
+            *ref(q.get("category")), *ref(q.get("question_type")),
+            option_count, len(options), flags,
+        )
+        for option in options:
+            option_records += OPTION_RECORD.pack(option["id"], *ref(option["text"]), bool(option["is_correct"]))
+        option_count += len(options)
+        total_points += q["points"] or 0
+
+    questions_offset = HEADER.size
+    options_offset = questions_offset + len(question_records)
+    strings_offset = options_offset + len(option_records)
+    header = HEADER.pack(
+        PACK_MAGIC, PACK_VERSION, 0, len(questions), option_count, total_points,
+        questions_offset, options_offset, strings_offset, *name_ref,
+    )
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(question_records)
+            f.write(option_records)
+            f.write(strings)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return len(questions)
+
+
+def compile_pack(db, question_group_id, path):
+    """Compile one DBManager question group (with its stats) into a pack."""
+    name = db.get_question_group_name(question_group_id)
+    if name is None:
+        raise ValueError(f"No question group {question_group_id}")
+    return write_pack(path, db.get_question_bank(question_group_id), name)
+
+
+# ---------------------------
+# Reading
+# ---------------------------
+class QuestionPack:
+    """
+    A read-only question pack, memory-mapped. Opening one reads only the
+    header, so it costs the same for ten questions or a million; records
+    and strings are decoded straight from the mapping when a question is
+    asked for. Question ids are looked up by binary search over the
+    id-sorted records.
+
+    Indexing (pack[i]) and iteration go in id order; get(question_id)
+    looks a question up by id.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            # mmap can't map an empty file (ValueError), so check the size first
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise PackFormatError(f"{path} is not a question pack")
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+        (magic, version, _, self.question_count, self.option_count, self.total_points,
+         self.questions_offset, self.options_offset, self.strings_offset,
+         name_offset, name_length) = HEADER.unpack_from(self.map, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise PackFormatError(f"{path} is not a version {PACK_VERSION} question pack")
+        if not (HEADER.size <= self.questions_offset
+                and self.questions_offset + self.question_count * QUESTION_RECORD.size <= self.options_offset
+                and self.options_offset + self.option_count * OPTION_RECORD.size <= self.strings_offset
+                and self.strings_offset + name_offset + name_length <= len(self.map)):
+            self.close()
+            raise PackFormatError(f"{path} is truncated or damaged")
+        self.name = self._string(name_offset, name_length)
+
+    def close(self):
+        self.view.release()
+        self.map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _string(self, offset, length):
+        start = self.strings_offset + offset
+        return str(self.view[start:start + length], "utf-8")
+
+    def __len__(self):
+        return self.question_count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.question_count:
+            raise IndexError(index)
+        return self._question(index)
+
+    def __iter__(self):
+        for index in range(self.question_count):
+            yield self._question(index)
+
+    def id_at(self, index):
+        return QUESTION_ID.unpack_from(self.map, self.questions_offset + index * QUESTION_RECORD.size)[0]
+
+    def index_of(self, question_id):
+        """Record index of `question_id`, or None."""
+        lo, hi = 0, self.question_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.id_at(mid) < question_id:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self.question_count and self.id_at(lo) == question_id else None
+
+    def get(self, question_id, default=None):
+        index = self.index_of(question_id)
+        return self._question(index) if index is not None else default
+
+    def points_of(self, question_id):
+        """A question's points without decoding its strings (0 if unknown)."""
+        index = self.index_of(question_id)
+        if index is None:
+            return 0
+        return struct.unpack_from("<i", self.map, self.questions_offset + index * QUESTION_RECORD.size + 8)[0]
+
+    def _question(self, index):
+        (q_id, points, attempts, correct,
+         text_off, text_len, blank_off, blank_len, cat_off, cat_len, type_off, type_len,
+         first_option, option_count, flags) = QUESTION_RECORD.unpack_from(
+            self.map, self.questions_offset + index * QUESTION_RECORD.size
+        )
+        options = NO_OPTIONS
+        if option_count:
+            options = []
+            for i in range(first_option, first_option + option_count):
+                opt_id, opt_off, opt_len, is_correct = OPTION_RECORD.unpack_from(
+                    self.map, self.options_offset + i * OPTION_RECORD.size
+                )
+                options.append(Option(opt_id, self._string(opt_off, opt_len), is_correct))
+            options = tuple(options)
+        return Question(
+            q_id, None, self._string(text_off, text_len),
+            None if flags & NULL_BLANK else self._string(blank_off, blank_len),
+            None if flags & NULL_POINTS else points,
+            None if flags & NULL_CATEGORY else self._string(cat_off, cat_len),
+            None if flags & NULL_TYPE else self._string(type_off, type_len),
+            options, attempts, correct,
+        )
+
+    def session_bank(self, answered_ids=()):
+        """The questions a session still has to play (see PackBank)."""
+        return PackBank(self, answered_ids)
+
+
+class PackBank:
+    """
+    The unanswered questions of a session playing from a pack. Game modes
+    use it in place of the preloaded { question_id: question } dict
+    (pop / get / in / len); shuffled() draws ids in random order without
+    building the whole order up front. Iterating yields every remaining
+    question, for modes that need to see them all (grid, adaptive,
+    category decks).
+    """
+
+    def __init__(self, pack, answered_ids=()):
+        self.pack = pack
+        self.gone = set(answered_ids)  # answered earlier or taken since
+        self.points_left = pack.total_points - sum(pack.points_of(q_id) for q_id in self.gone)
+
+    def __len__(self):
+        return len(self.pack) - len(self.gone)
+
+    def __contains__(self, question_id):
+        return question_id not in self.gone and self.pack.index_of(question_id) is not None
+
+    def __iter__(self):
+        for index in range(len(self.pack)):
+            if self.pack.id_at(index) not in self.gone:
+                yield self.pack[index]
+
+    def get(self, question_id, default=None):
+        return default if question_id in self.gone else self.pack.get(question_id, default)
+
+    def __getitem__(self, question_id):
+        question = self.get(question_id)
+        if question is None:
+            raise KeyError(question_id)
+        return question
+
+    def pop(self, question_id, default=None):
+        question = self.get(question_id)
+        if question is None:
+            return default
+        self.gone.add(question_id)
+        return question
+
+    def shuffled(self, rng):
+        return LazyShuffle(self.pack, rng)
+
+
+class LazyShuffle:
+    """
+    A random permutation of a pack's question ids, drawn one at a time
+    with pop() (a Fisher-Yates shuffle that only remembers the swapped
+    slots), so starting costs nothing however big the pack is. Ids that
+    are already answered still come up; the caller skips them.
+    """
+
+    def __init__(self, pack, rng):
+        self.pack = pack
+        self.rng = rng
+        self.left = len(pack)
+        self.swapped = {}  # { slot: record index moved there }
+
+    def __len__(self):
+        return self.left
+
+    def pop(self):
+        if not self.left:
+            raise IndexError("pop from empty shuffle")
+        slot = self.rng.randrange(self.left)
+        self.left -= 1
+        index = self.swapped.get(slot, slot)
+        self.swapped[slot] = self.swapped.pop(self.left, self.left)
+        return self.pack.id_at(index)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile and inspect question packs.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    compile_cmd = sub.add_parser("compile", help="compile a question group into a pack")
+    compile_cmd.add_argument("group", type=int, help="question group id")
+    compile_cmd.add_argument("output", help=f"pack file to write (e.g. quiz{PACK_SUFFIX})")
+    compile_cmd.add_argument("--db", default=None, help="database file (default clynboozle.db)")
+    info_cmd = sub.add_parser("info", help="show what a pack holds")
+    info_cmd.add_argument("pack")
+    args = parser.parse_args()
+
+    if args.command == "compile":
+        from db_manager import DBManager, DB_NAME
+
+        db = DBManager(args.db or DB_NAME)
+        count = compile_pack(db, args.group, args.output)
+        db.close()
+        print(f"[PACK] Wrote {count} questions to {args.output} ({os.path.getsize(args.output)} bytes)")
+    elif args.command == "info":
+        with QuestionPack(args.pack) as pack:
+            print(f"[PACK] {pack.name!r}: {len(pack)} questions, {pack.option_count} options, "
+                  f"{pack.total_points} points")
+            categories = {}
+            for question in pack:
+                categories[question["category"]] = categories.get(question["category"], 0) + 1
+            for category, count in sorted(categories.items(), key=lambda c: str(c[0])):
+                print(f"[PACK]   {category or 'General'}: {count}")
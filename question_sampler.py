@@ -0,0 +1,233 @@
+import random
+
+# Questions are bucketed by historical correct rate: tier 0 = hardest
+DIFFICULTY_TIERS = 5
+# Correct rate aimed at when the current team is level with the best other team
+BASE_TARGET_RATE = 0.55
+# How far the target moves for a team a whole stake behind (or ahead)
+ADAPT_STRENGTH = 0.35
+# Spread of the tier preference around the target rate
+TIER_WIDTH = 0.2
+
+
+class FenwickSampler:
+    """
+    Weighted sampling over a fixed list of slots with a Fenwick (binary
+    indexed) tree: update() and sample() are both O(log n), so removing
+    a drawn item never means rebuilding the weights.
+    """
+
+    def __init__(self, weights):
+        self.n = len(weights)
+        self.weights = [float(w) for w in weights]
+        self.tree = [0.0] + self.weights
+        for i in range(1, self.n + 1):
+            parent = i + (i & -i)
+            if parent <= self.n:
+                self.tree[parent] += self.tree[i]
+        self.total = sum(self.weights)
+        self._top_bit = 1 << (self.n.bit_length() - 1) if self.n else 0
+
+    def update(self, index, weight):
+        """Set the weight of slot `index` (0-based)."""
+        delta = float(weight) - self.weights[index]
+        if not delta:
+            return
+        self.weights[index] = float(weight)
+        self.total += delta
+        i = index + 1
+        while i <= self.n:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find(self, target):
+        """
+        Slot whose cumulative-weight range contains `target`
+        (0 <= target < total), by descending the tree one bit at a time.
+        """
+        pos = 0
+        step = self._top_bit
+        while step:
+            nxt = pos + step
+            if nxt <= self.n and self.tree[nxt] <= target:
+                pos = nxt
+                target -= self.tree[nxt]
+            step >>= 1
+        return min(pos, self.n - 1)
+
+    def sample(self, rng):
+        """Draw a slot with probability proportional to its weight, or None."""
+        if self.total <= 0:
+            return None
+        index = self.find(rng.random() * self.total)
+        # Guard against float drift landing on an emptied slot
+        while self.weights[index] <= 0 and index > 0:
+            index -= 1
+        return index if self.weights[index] > 0 else None
+
+
+def smoothed_correct_rate(attempts, correct):
+    """Correct rate with a one-right-one-wrong prior, so unplayed questions sit at 0.5."""
+    return (correct + 1) / (attempts + 2)
+
+
+def target_correct_rate(team_score, other_scores, remaining_points):
+    """
+    How easy the next question should be for the team about to answer.
+    Trailing teams get a higher target (easier questions), leaders a lower one.
+    """
+    best_other = max(other_scores) if other_scores else team_score
+    lead = (team_score - best_other) / max(remaining_points, 1)
+    lead = max(-1.0, min(1.0, lead))
+    return max(0.05, min(0.95, BASE_TARGET_RATE - ADAPT_STRENGTH * lead))
+
+
+class AdaptiveSelector:
+    """
+    Picks questions for one session, biased towards a target difficulty.
+
+    Questions are split into tiers by historical correct rate
+    (question_stats) and each tier has its own FenwickSampler. A draw
+    weighs the tiers by distance from the target rate (a handful of
+    numbers), then samples inside the chosen tier in O(log n). Drawn
+    questions are zeroed out of their tier, so nothing is ever rebuilt
+    per draw and selection stays fast on very large groups.
+    """
+
+    def __init__(self, questions, seed=None, tiers=DIFFICULTY_TIERS):
+        # questions: [(question_id, points, attempts, correct), ...]
+        self.rng = random.Random(seed)
+        self.tier_rates = [(t + 0.5) / tiers for t in range(tiers)]
+        tier_ids = [[] for _ in range(tiers)]
+        self.location = {}  # { question_id: (tier, slot) }
+        self.points = {}
+        for q_id, points, attempts, correct in questions:
+            rate = smoothed_correct_rate(attempts or 0, correct or 0)
+            tier = min(int(rate * tiers), tiers - 1)
+            self.location[q_id] = (tier, len(tier_ids[tier]))
+            self.points[q_id] = points or 0
+            tier_ids[tier].append(q_id)
+        self.tier_ids = tier_ids
+        self.samplers = [FenwickSampler([1.0] * len(ids)) for ids in tier_ids]
+        self.remaining_points = sum(self.points.values())
+
+    def __len__(self):
+        return len(self.location)
+
+    def consume(self, question_id):
+        """Take a question out of the pool (drawn, or answered elsewhere)."""
+        if question_id not in self.location:
+            return
+        tier, slot = self.location.pop(question_id)
+        self.samplers[tier].update(slot, 0.0)
+        self.remaining_points -= self.points.pop(question_id)
+
+    def tier_weights(self, target_rate):
+        return [
+            (2.0 ** (-((rate - target_rate) / TIER_WIDTH) ** 2)) if sampler.total > 0 else 0.0
+            for rate, sampler in zip(self.tier_rates, self.samplers)
+        ]
+
+    def draw(self, target_rate):
+        """Draw and consume a question near `target_rate`. Returns its id or None."""
+        weights = self.tier_weights(target_rate)
+        total = sum(weights)
+        if total <= 0:
+            return None
+        pick = self.rng.random() * total
+        tier = len(weights) - 1
+        for i, w in enumerate(weights):
+            if pick < w:
+                tier = i
+                break
+            pick -= w
+        slot = self.samplers[tier].sample(self.rng)
+        if slot is None:
+            return None
+        question_id = self.tier_ids[tier][slot]
+        self.consume(question_id)
+        return question_id
+
+
+# ---------------------------
+# Category decks and rounds
+# ---------------------------
+UNCATEGORIZED = "Uncategorized"
+
+
+def interleave(decks, rng):
+    """
+    Stratified merge of several decks: item j of a deck with n items is
+    placed at (j + offset) / n, with a random offset per deck, so every
+    category is spread evenly instead of bunching up.
+    """
+    keyed = []
+    for deck in decks:
+        offset = rng.random()
+        keyed.extend(((j + offset) / len(deck), rng.random(), q_id) for j, q_id in enumerate(deck))
+    keyed.sort()
+    return [q_id for _, _, q_id in keyed]
+
+
+class CategoryDecks:
+    """
+    Category-stratified draw order for one session, built once at session
+    start. Each category's questions are shuffled into a deck; rounds then
+    take their quota from each deck and interleave them.
+
+    rounds: [{ "name": "Round 1", "quota": { "History": 3, "Science": 2 } }, ...]
+    Without rounds, every question is played in one stratified mix. With
+    rounds, the game ends after the last round. A draw is a list pop.
+    """
+
+    def __init__(self, questions_by_category, rounds=None, seed=None):
+        self.rng = random.Random(seed)
+        decks = {}
+        for category, ids in questions_by_category.items():
+            deck = list(ids)
+            self.rng.shuffle(deck)
+            decks[category or UNCATEGORIZED] = deck
+
+        schedule = []  # [(question_id, round_index)] in play order
+        self.round_names = []
+        if rounds:
+            for r_idx, rnd in enumerate(rounds):
+                self.round_names.append(rnd.get("name") or f"Round {r_idx + 1}")
+                picked = []
+                for category, quota in rnd.get("quota", {}).items():
+                    deck = decks.get(category or UNCATEGORIZED, [])
+                    picked.append(deck[:quota])
+                    del deck[:quota]
+                schedule.extend((q_id, r_idx) for q_id in interleave([p for p in picked if p], self.rng))
+        else:
+            self.round_names.append(None)
+            schedule.extend((q_id, 0) for q_id in interleave([d for d in decks.values() if d], self.rng))
+
+        # Reversed, so the next draw is always a pop() from the end
+        self.order = schedule[::-1]
+        self.round_index = 0
+
+    def __len__(self):
+        return len(self.order)
+
+    def draw(self):
+        """Next question id, or None when the game's questions are used up."""
+        if not self.order:
+            return None
+        question_id, self.round_index = self.order.pop()
+        return question_id
+
+    def consume(self, question_ids):
+        """
+        Drop questions already answered. On resume the decks are rebuilt
+        from the whole group with the session's seed, which gives the same
+        schedule, and consuming the answered ids then leaves the draw in
+        the round it had reached.
+        """
+        question_ids = set(question_ids)
+        self.order = [entry for entry in self.order if entry[0] not in question_ids]
+        if self.order:
+            self.round_index = self.order[-1][1]
+
+    def current_round_name(self):
+        return self.round_names[self.round_index] if self.round_names else None
@@ -0,0 +1,113 @@
+import numpy as np
+
+# Chance per turn that some team gets an event
+DEFAULT_EVENT_RATE = 0.2
+# Event size as a share of the points still in play
+BASE_PCT = 0.05
+GAP_PCT = 0.25     # extra share for a team that is a whole stake away from the pack
+MAX_PCT = 0.3
+# How strongly leaderboard position decides good vs bad (0 = coin flip)
+BALANCE = 0.8
+
+
+class RandomEventEngine:
+    """
+    Leaderboard-aware random events (clyn-requests.md item 8).
+
+    After each turn every team gets a chance at an event. Sizes are a
+    percentage of the points still in play, never a fixed number:
+      - teams far from the pack (the median score) are more likely to be
+        picked and get bigger events, more so as turns run out
+      - the leader mostly gets bad events, the last place mostly good ones
+      - a bad event never takes a score below zero
+
+    Every method works on arrays shaped (..., teams), so one call covers a
+    single game or a whole batch of simulated games. Draws come from a
+    seeded generator, so a session seeded with the same value replays the
+    same events.
+    """
+
+    def __init__(self, seed=None, event_rate=DEFAULT_EVENT_RATE, base_pct=BASE_PCT,
+                 gap_pct=GAP_PCT, max_pct=MAX_PCT, balance=BALANCE):
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.event_rate = event_rate
+        self.base_pct = base_pct
+        self.gap_pct = gap_pct
+        self.max_pct = max_pct
+        self.balance = balance
+
+    # ----------------------------------------------------------------
+    #                          MODEL
+    # ----------------------------------------------------------------
+    def probabilities(self, scores, remaining_points, turns_left):
+        """
+        One vectorized pass over all teams.
+
+        scores: (..., teams); remaining_points and turns_left: (...).
+        Returns (p_event, p_positive, magnitude), each (..., teams):
+          p_event     chance this team gets the event this turn
+          p_positive  chance that event is a bonus rather than a penalty
+          magnitude   points the event is worth
+        """
+        scores = np.asarray(scores, dtype=float)
+        teams = scores.shape[-1]
+        stake = np.maximum(np.asarray(remaining_points, dtype=float), 1.0)[..., None]
+        turns = np.maximum(np.asarray(turns_left, dtype=float), 1.0)[..., None]
+
+        # 0 for the leader(s) .. 1 for last place; tied teams share a rank
+        higher = (scores[..., None, :] > scores[..., :, None]).sum(axis=-1)
+        rank = higher / max(teams - 1, 1)
+
+        # Distance from the pack, measured in points still available
+        gap = np.abs(scores - np.median(scores, axis=-1, keepdims=True)) / stake
+        gap = np.minimum(gap, 1.0)
+
+        # Fewer turns left -> less time to close a gap -> events matter more
+        pressure = np.minimum(teams / turns, 1.0)
+        weight = 1.0 + gap * (1.0 + pressure)
+        p_event = self.event_rate * weight / weight.sum(axis=-1, keepdims=True)
+
+        p_positive = 0.5 + 0.5 * self.balance * (2.0 * rank - 1.0)
+
+        pct = np.minimum(self.base_pct + self.gap_pct * gap, self.max_pct)
+        magnitude = np.ceil(pct * stake)
+        return p_event, p_positive, magnitude
+
+    def roll(self, scores, remaining_points, turns_left):
+        """
+        Draw at most one event per game.
+
+        Returns (team_index, delta): team_index is -1 where nothing happened,
+        delta is the signed score change (0 where nothing happened).
+        """
+        scores = np.asarray(scores, dtype=float)
+        p_event, p_positive, magnitude = self.probabilities(scores, remaining_points, turns_left)
+        batch = scores.shape[:-1]
+
+        # Pick a team by inverse CDF; the leftover mass is "no event"
+        cdf = np.cumsum(p_event, axis=-1)
+        u = self.rng.random(batch)[..., None]
+        team_index = np.where(u[..., 0] < cdf[..., -1], (u >= cdf).sum(axis=-1), -1)
+
+        picked = np.maximum(team_index, 0)[..., None]
+        positive = self.rng.random(batch) < np.take_along_axis(p_positive, picked, -1)[..., 0]
+        size = np.take_along_axis(magnitude, picked, -1)[..., 0]
+        current = np.take_along_axis(scores, picked, -1)[..., 0]
+
+        delta = np.where(positive, size, -np.minimum(size, np.maximum(current, 0.0)))
+        delta = np.where(team_index >= 0, delta, 0.0).astype(int)
+        team_index = np.where(delta != 0, team_index, -1)
+        return team_index, delta
+
+    def roll_one(self, scores, remaining_points, turns_left):
+        """
+        Single-game roll. Returns (team_index, delta, pct) or None.
+        """
+        if not scores:
+            return None
+        team_index, delta = self.roll(np.array([scores]), [remaining_points], [turns_left])
+        if team_index[0] < 0:
+            return None
+        pct = abs(int(delta[0])) / max(remaining_points, 1)
+        return int(team_index[0]), int(delta[0]), round(pct, 3)
@@ -0,0 +1,499 @@
+import asyncio
+import base64
+import hashlib
+import json
+import queue
+import secrets
+import struct
+import threading
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_HOST = "0.0.0.0"
+DEFAULT_PORT = 8765
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+MAX_MESSAGE_SIZE = 64 * 1024
+MAX_HEADER_SIZE = 16 * 1024
+
+# WebSocket opcodes
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+
+# ---------------------------
+# WebSocket framing
+# ---------------------------
+def apply_mask(data, mask):
+    """XOR `data` with the 4-byte WebSocket `mask`."""
+    n = len(data)
+    if n == 0:
+        return data
+    key = (mask * (n // 4 + 1))[:n]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(key, "big")).to_bytes(n, "big")
+
+
+def encode_frame(payload, opcode=OP_TEXT, mask=False):
+    """
+    Build a single, unfragmented WebSocket frame.
+    Clients must mask their frames; servers must not.
+    """
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    length = len(payload)
+    header = bytearray([0x80 | opcode])
+    mask_bit = 0x80 if mask else 0
+    if length < 126:
+        header.append(mask_bit | length)
+    elif length < 1 << 16:
+        header.append(mask_bit | 126)
+        header += struct.pack("!H", length)
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack("!Q", length)
+    if mask:
+        key = secrets.token_bytes(4)
+        return bytes(header) + key + apply_mask(payload, key)
+    return bytes(header) + payload
+
+
+async def read_message(reader):
+    """
+    Read one complete WebSocket message (joining continuation frames).
+    Returns (opcode, payload bytes).
+    """
+    message = b""
+    message_opcode = None
+    while True:
+        head = await reader.readexactly(2)
+        fin = head[0] & 0x80
+        opcode = head[0] & 0x0F
+        masked = head[1] & 0x80
+        length = head[1] & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", await reader.readexactly(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", await reader.readexactly(8))[0]
+        if length > MAX_MESSAGE_SIZE:
+            raise ConnectionError("WebSocket message too large")
+        key = await reader.readexactly(4) if masked else None
+        data = await reader.readexactly(length)
+        if key:
+            data = apply_mask(data, key)
+
+        # Control frames may arrive between fragments of a data message
+        if opcode >= OP_CLOSE:
+            return opcode, data
+
+        if opcode != OP_CONTINUATION:
+            message_opcode = opcode
+        message += data
+        if len(message) > MAX_MESSAGE_SIZE:
+            raise ConnectionError("WebSocket message too large")
+        if fin:
+            return message_opcode, message
+
+
+def websocket_accept_key(key):
+    digest = hashlib.sha1((key + WS_GUID).encode("ascii")).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+# ---------------------------
+# Remote Server
+# ---------------------------
+class RemoteServer:
+    """
+    Optional HTTP + WebSocket server that lets phones on the local network
+    play along. It runs its own asyncio loop in a background thread.
+
+    Nothing in here touches GameLogic directly. Incoming commands are put on
+    a thread-safe queue; the pygame loop drains it once per frame with
+    process_commands(), applies each command and the reply is sent back to
+    the client from the server thread.
+
+    Game state reaches the phones through a StateSync (see state_sync.py):
+    the server subscribes to it like any other transport, so each change is
+    broadcast as one small delta and new clients start from a snapshot.
+
+    A phone plays for the team whose join code it joined with (the host
+    page lists a code per team); answers are always sent for that team,
+    whatever team_id the phone puts in them.
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, host_token=None):
+        self.host = host
+        self.port = port
+        self.host_token = host_token if host_token else secrets.token_urlsafe(6)
+        self.commands = queue.Queue()
+        self.clients = set()
+        self.join_tokens = {}  # { team_id: join code }, made when the host page asks
+        self.client_teams = {}  # { writer: team_id } for phones that joined a team
+        self._tokens_lock = threading.Lock()
+        self.sync = None
+        self.loop = None
+        self.thread = None
+        self._server = None
+        self._started = threading.Event()
+
+    # ----------------------------------------------------------------
+    #                          LIFECYCLE
+    # ----------------------------------------------------------------
+    def start(self):
+        """Start serving in a daemon thread. Returns once the socket is bound."""
+        self.thread = threading.Thread(target=self._run, name="remote-server", daemon=True)
+        self.thread.start()
+        self._started.wait()
+        return self
+
+    def stop(self):
+        if self.loop and self._server:
+            self.loop.call_soon_threadsafe(self._server.close)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        if self.thread:
+            self.thread.join(timeout=2)
+
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self._server = self.loop.run_until_complete(
+            asyncio.start_server(self._handle_connection, self.host, self.port, backlog=512)
+        )
+        # Pick up the real port if 0 was requested
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started.set()
+        try:
+            self.loop.run_forever()
+        finally:
+            self.loop.close()
+
+    # ----------------------------------------------------------------
+    #                     MAIN-THREAD INTERFACE
+    # ----------------------------------------------------------------
+    def process_commands(self, handler, max_commands=500):
+        """
+        Apply queued client commands on the calling (pygame) thread.
+
+        `handler(command)` must return a JSON-serialisable reply dict.
+        Returns the number of commands processed.
+        """
+        processed = 0
+        while processed < max_commands:
+            try:
+                command, client = self.commands.get_nowait()
+            except queue.Empty:
+                break
+            if command.get("type") == "ping":
+                reply = {"type": "pong", "id": command.get("id")}
+            else:
+                try:
+                    reply = handler(command)
+                except Exception as exc:  # never let a bad command kill the game loop
+                    reply = {"ok": False, "error": str(exc)}
+                reply.setdefault("type", "result")
+                reply["id"] = command.get("id")
+            self._send_threadsafe(client, reply)
+            processed += 1
+        return processed
+
+    def attach_sync(self, sync):
+        """Mirror a StateSync to every connected client."""
+        self.sync = sync
+        sync.subscribe(self)
+
+    def send(self, data):
+        """StateSync transport hook: broadcast an encoded delta (any thread)."""
+        if self.loop:
+            self.loop.call_soon_threadsafe(self._broadcast, data)
+
+    def join_token(self, team_id):
+        """The code a team's phones join with (made on first use)."""
+        with self._tokens_lock:
+            token = self.join_tokens.get(team_id)
+            if token is None:
+                token = self.join_tokens[team_id] = secrets.token_urlsafe(6)
+            return token
+
+    def team_for_token(self, token):
+        with self._tokens_lock:
+            for team_id, team_token in self.join_tokens.items():
+                if team_token == token:
+                    return team_id
+        return None
+
+    # ----------------------------------------------------------------
+    #                        SERVER THREAD
+    # ----------------------------------------------------------------
+    def _send_threadsafe(self, client, message):
+        if self.loop:
+            payload = json.dumps(message, separators=(",", ":"))
+            self.loop.call_soon_threadsafe(self._send, client, payload)
+
+    def _send(self, writer, payload):
+        if writer in self.clients and not writer.is_closing():
+            writer.write(encode_frame(payload))
+
+    def _broadcast(self, payload):
+        frame = encode_frame(payload)
+        for writer in list(self.clients):
+            if not writer.is_closing():
+                writer.write(frame)
+
+    async def _handle_connection(self, reader, writer):
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        if len(request) > MAX_HEADER_SIZE:
+            writer.close()
+            return
+
+        lines = request.decode("latin-1").split("\r\n")
+        try:
+            method, target, _ = lines[0].split(" ", 2)
+        except ValueError:
+            writer.close()
+            return
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        path = urlsplit(target).path
+        try:
+            if path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                await self._serve_websocket(reader, writer, headers)
+            elif method == "GET" and path in ("/", "/host"):
+                self._write_http(writer, "200 OK", "text/html; charset=utf-8",
+                                 PLAYER_PAGE.encode("utf-8"))
+            else:
+                self._write_http(writer, "404 Not Found", "text/plain", b"Not found")
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.clients.discard(writer)
+            self.client_teams.pop(writer, None)
+            writer.close()
+
+    def _write_http(self, writer, status, content_type, body):
+        writer.write(
+            f"HTTP/1.1 {status}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n".encode("latin-1") + body
+        )
+
+    async def _serve_websocket(self, reader, writer, headers):
+        key = headers.get("sec-websocket-key")
+        if not key:
+            self._write_http(writer, "400 Bad Request", "text/plain", b"Missing key")
+            return
+        writer.write(
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {websocket_accept_key(key)}\r\n\r\n".encode("latin-1")
+        )
+        self.clients.add(writer)
+        if self.sync:
+            writer.write(encode_frame(self.sync.snapshot_message()))
+        await writer.drain()
+
+        while True:
+            opcode, data = await read_message(reader)
+            if opcode == OP_CLOSE:
+                writer.write(encode_frame(data[:2], OP_CLOSE))
+                return
+            if opcode == OP_PING:
+                writer.write(encode_frame(data, OP_PONG))
+                continue
+            if opcode != OP_TEXT:
+                continue
+            try:
+                command = json.loads(data.decode("utf-8"))
+            except (ValueError, UnicodeDecodeError):
+                continue
+            if not isinstance(command, dict):
+                continue
+            # Catch-up requests are served straight from the sync log
+            if command.get("type") == "sync" and self.sync:
+                missed = self.sync.deltas_since(command.get("since", -1))
+                if missed is None:
+                    missed = [self.sync.snapshot_message()]
+                for data in missed:
+                    writer.write(encode_frame(data))
+                continue
+            ctype = command.get("type")
+            # Host-only commands are checked here so forged ones never reach the game
+            if ctype in ("mark", "join_codes") and command.get("token") != self.host_token:
+                self._reply(writer, command, ok=False, error="not host")
+                continue
+            if ctype == "join_codes":
+                teams = self.sync.state["teams"] if self.sync else []
+                self._reply(writer, command, type="join_codes",
+                            codes={str(team_id): self.join_token(team_id) for team_id, _ in teams})
+                continue
+            if ctype == "join":
+                team_id = self.team_for_token(command.get("code"))
+                if team_id is None:
+                    self._reply(writer, command, ok=False, message="Unknown join code")
+                    continue
+                self.client_teams[writer] = team_id
+                self._reply(writer, command, type="joined", team_id=team_id)
+                continue
+            if ctype == "answer":
+                # Answers count for the team this phone joined, never a team_id it claims
+                if writer not in self.client_teams:
+                    self._reply(writer, command, ok=False, message="Join a team first")
+                    continue
+                command["team_id"] = self.client_teams[writer]
+            command["received_at"] = time.perf_counter()
+            self.commands.put((command, writer))
+
+    def _reply(self, writer, command, **reply):
+        reply.setdefault("type", "result")
+        reply["id"] = command.get("id")
+        writer.write(encode_frame(json.dumps(reply, separators=(",", ":"))))
+
+
+def host_url(server, address="localhost"):
+    """The URL the host opens on their phone to mark open-ended answers."""
+    return f"http://{address}:{server.port}/host?token={server.host_token}"
+
+
+# ---------------------------
+# Phone Page
+# ---------------------------
+PLAYER_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8">
+<meta name="viewport" content="width=device-width,initial-scale=1">
+<title>Clynboozle</title>
+<style>
+body{font-family:sans-serif;margin:0;padding:1em;background:#fff}
+button{display:block;width:100%;margin:.4em 0;padding:.8em;font-size:1.1em;
+border:0;border-radius:8px;background:#0000ff;color:#fff}
+input{width:100%;padding:.6em;font-size:1.1em;box-sizing:border-box}
+.ok{background:#00c800}.bad{background:#c80000}#status{color:#888}
+</style></head><body>
+<h2>Clynboozle</h2>
+<div id="join"></div>
+<div id="game" hidden>
+  <p id="team"></p>
+  <div id="codes" hidden></div>
+  <h3 id="question">Waiting for the next question...</h3>
+  <div id="answers"></div>
+  <div id="host" hidden>
+    <p id="submitted"></p>
+    <button class="ok" onclick="mark(true)">Mark Correct</button>
+    <button class="bad" onclick="mark(false)">Mark Wrong</button>
+  </div>
+  <p id="scores"></p>
+</div>
+<p id="status">Connecting...</p>
+<script>
+const params = new URLSearchParams(location.search);
+const token = params.get("token");
+const isHost = location.pathname === "/host" && token;
+let joinCode = params.get("join");
+let ws, teamId = null, state = null, version = null, nextId = 1, codes = {}, codesAsked = null;
+const $ = (id) => document.getElementById(id);
+function send(msg){ msg.id = nextId++; ws.send(JSON.stringify(msg)); }
+function mark(correct){ send({type: "mark", token: token, correct: correct}); }
+function join(code){ joinCode = code; send({type: "join", code: code}); }
+// The server answers for the team this phone joined
+function answer(extra){
+  if (!state || !state.question) return;
+  send(Object.assign({type: "answer", question_id: state.question.id}, extra));
+}
+// Mirrors apply_delta() in state_sync.py
+function applyDelta(d){
+  const op = d[0];
+  if (op === "x") state = {session_id: d[1], teams: [], scores: {}, turn: null,
+                           question: null, answered: {}, extra: {}};
+  else if (op === "r") state.teams = d[1];
+  else if (op === "S") state.scores = d[1];
+  else if (op === "s") state.scores[String(d[1])] = d[2];
+  else if (op === "t") state.turn = d[1];
+  else if (op === "q") state.question = d[1];
+  else if (op === "a") state.answered[String(d[1])] = d[2];
+  else if (op === "k") state.extra[d[1]] = d[2];
+}
+function render(){
+  $("status").textContent = "";
+  if (!isHost && teamId === null){
+    if ($("join").innerHTML) return;
+    $("join").innerHTML = "<p>Enter your team's join code (the host has it):</p>";
+    const inp = document.createElement("input");
+    const b = document.createElement("button");
+    b.textContent = "Join"; b.onclick = () => join(inp.value.trim());
+    $("join").appendChild(inp); $("join").appendChild(b);
+    return;
+  }
+  $("join").hidden = true; $("game").hidden = false;
+  if (isHost){
+    const ids = state.teams.map((t) => t[0]).join(",");
+    if (codesAsked !== ids){ codesAsked = ids; send({type: "join_codes", token: token}); }
+    $("codes").hidden = false;
+    $("codes").innerHTML = "<p>Join links:</p>";
+    state.teams.forEach((t) => {
+      const code = codes[String(t[0])];
+      const p = document.createElement("p");
+      p.textContent = t[1] + ": " + (code ? location.origin + "/?join=" + code : "...");
+      $("codes").appendChild(p);
+    });
+  }
+  const team = state.teams.find((t) => t[0] === teamId);
+  $("team").textContent = isHost ? "Host controls" : "Team: " + (team ? team[1] : "?");
+  const q = state.question;
+  const myTurn = isHost || state.turn === teamId;
+  $("question").textContent = q ? q.text : "Waiting for the next question...";
+  const box = $("answers"); box.innerHTML = "";
+  if (q && !isHost && myTurn){
+    if (q.type === "multiple_choice"){
+      q.options.forEach((opt, i) => {
+        const b = document.createElement("button");
+        b.textContent = opt; b.onclick = () => answer({option_index: i});
+        box.appendChild(b);
+      });
+    } else {
+      const inp = document.createElement("input");
+      const b = document.createElement("button");
+      b.textContent = "Submit"; b.onclick = () => answer({text: inp.value});
+      box.appendChild(inp); box.appendChild(b);
+    }
+  } else if (q && !isHost){
+    box.textContent = "Waiting for your turn...";
+  }
+  $("host").hidden = !(isHost && q && q.type === "open_ended");
+  $("submitted").textContent = state.extra.submitted ? "Answer: " + state.extra.submitted : "";
+  $("scores").textContent = state.teams.map((t) =>
+    t[1] + ": " + (state.scores[String(t[0])] || 0)).join("  |  ");
+}
+function connect(){
+  ws = new WebSocket((location.protocol === "https:" ? "wss://" : "ws://") + location.host + "/ws");
+  ws.onmessage = (ev) => {
+    const msg = JSON.parse(ev.data);
+    if (Array.isArray(msg)){
+      if (version === null || msg[0] <= version) return;
+      if (msg[0] !== version + 1){ send({type: "sync", since: version}); return; }
+      applyDelta(msg.slice(1)); version = msg[0]; render();
+    }
+    else if (msg.state){ state = msg.state; version = msg.v; render(); }
+    else if (msg.type === "joined"){ teamId = msg.team_id; if (state) render(); }
+    else if (msg.type === "join_codes"){ codes = msg.codes; if (state) render(); }
+    else if (msg.type === "result" && msg.message){ $("status").textContent = msg.message; }
+  };
+  // Join again after a reconnect
+  ws.onopen = () => { if (!isHost && joinCode) join(joinCode); };
+  ws.onclose = () => { $("status").textContent = "Disconnected, retrying..."; setTimeout(connect, 1000); };
+}
+connect();
+</script></body></html>
+"""
@@ -1,9 +1,250 @@
 import pygame
+from collections import OrderedDict
 from typing import Tuple, Optional
 
+# Smallest font size (px) fit() shrinks text to before cutting it off
+MIN_FIT_SIZE = 10
+# Space kept between a button's edge and its text
+BUTTON_TEXT_PADDING = 8
+ELLIPSIS = "..."
+# Button look: drop shadow / press travel (px) and corner radius
+SHADOW_OFFSET = 4
+PRESS_OFFSET = 4
+BUTTON_RADIUS = 8
+
+
+def _split_long_word(font: pygame.font.Font, word: str, width: int) -> list:
+    """Break a word wider than `width` into pieces that fit (at least one character each)."""
+    pieces = []
+    piece = ""
+    for char in word:
+        if piece and font.size(piece + char)[0] > width:
+            pieces.append(piece)
+            piece = char
+        else:
+            piece += char
+    pieces.append(piece)
+    return pieces
+
+
+def _break_greedy(widths, space: int, width: int) -> list:
+    """Line start indexes: fill each line with as many words as fit."""
+    starts = [0]
+    line_width = widths[0]
+    for i in range(1, len(widths)):
+        if line_width + space + widths[i] > width:
+            starts.append(i)
+            line_width = widths[i]
+        else:
+            line_width += space + widths[i]
+    return starts
+
+
+def _break_balanced(widths, space: int, width: int) -> list:
+    """
+    Line start indexes minimising the sum of squared leftover space on
+    every line but the last (no orphaned last words, even right edges).
+    """
+    n = len(widths)
+    best = [0.0] * (n + 1)  # best[i]: cost of laying out words i..n-1
+    next_start = [n] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        best[i] = float("inf")
+        line_width = -space
+        for j in range(i, n):
+            line_width += space + widths[j]
+            if line_width > width and j > i:
+                break
+            cost = (0 if j == n - 1 else (width - line_width) ** 2) + best[j + 1]
+            if cost < best[i]:
+                best[i] = cost
+                next_start[i] = j + 1
+    starts = []
+    i = 0
+    while i < n:
+        starts.append(i)
+        i = next_start[i]
+    return starts
+
+
+def wrap_text(font: pygame.font.Font, text: str, width: int, balanced: bool = False) -> Tuple[str, ...]:
+    """
+    Break text into lines no wider than `width` px in `font`, at spaces
+    (newlines always break). Greedy by default; balanced evens out the
+    line lengths. Words wider than a line are split between characters.
+    """
+    lines = []
+    space = font.size(" ")[0]
+    for paragraph in text.split("\n"):
+        words = []
+        for word in paragraph.split():
+            if font.size(word)[0] > width:
+                words.extend(_split_long_word(font, word, width))
+            else:
+                words.append(word)
+        if not words:
+            lines.append("")
+            continue
+        widths = [font.size(word)[0] for word in words]
+        starts = (_break_balanced if balanced else _break_greedy)(widths, space, width)
+        for start, end in zip(starts, starts[1:] + [len(words)]):
+            lines.append(" ".join(words[start:end]))
+    return tuple(lines)
+
+
+class TextCache:
+    """
+    Fonts, rendered text surfaces and text layouts (line breaks, fitted
+    sizes), shared by every layout (host and audience windows) so the
+    same string is only rasterised, and only wrapped, once.
+    """
+
+    def __init__(self, max_surfaces: int = 2048, max_layouts: int = 1024):
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.max_surfaces = max_surfaces
+        self.layouts = OrderedDict()  # { (kind, text, size / box, ...): result } for wrap() and fit()
+        self.max_layouts = max_layouts
+
+    def font(self, size: int) -> pygame.font.Font:
+        font = self.fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self.fonts[size] = font
+        return font
+
+    def render(self, text: str, size: int, color) -> pygame.Surface:
+        key = (text, size, color if isinstance(color, str) else tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            return surface
+        surface = self.font(size).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def _memo(self, key, compute):
+        result = self.layouts.get(key)
+        if result is not None:
+            self.layouts.move_to_end(key)
+            return result
+        result = self.layouts[key] = compute()
+        if len(self.layouts) > self.max_layouts:
+            self.layouts.popitem(last=False)
+        return result
+
+    def wrap(self, text: str, size: int, width: int, balanced: bool = False) -> Tuple[str, ...]:
+        """Lines of `text` at font `size`, each at most `width` px wide (memoized)."""
+        return self._memo(("wrap", text, size, width, balanced),
+                          lambda: wrap_text(self.font(size), text, width, balanced))
+
+    def fit(self, text: str, max_size: int, width: int, height: int,
+            min_size: int = MIN_FIT_SIZE, balanced: bool = False) -> Tuple[int, Tuple[str, ...]]:
+        """
+        (size, lines): the largest font size up to max_size at which `text`,
+        wrapped to `width`, fits in `height` (binary search, memoized).
+        If it doesn't fit even at min_size, the lines that fit are kept
+        and the last one ends in "...".
+        """
+        return self._memo(("fit", text, max_size, width, height, min_size, balanced),
+                          lambda: self._fit(text, max_size, width, height, min_size, balanced))
+
+    def _fit(self, text, max_size, width, height, min_size, balanced):
+        def layout(size):
+            lines = wrap_text(self.font(size), text, width, balanced)
+            return lines, len(lines) * self.font(size).get_linesize() <= height
+
+        lines, fits = layout(max_size)
+        if fits or max_size <= min_size:
+            return max_size, lines if fits else self._truncate(lines, max_size, width, height)
+        low, high = min_size, max_size - 1
+        while low < high:
+            mid = (low + high + 1) // 2
+            if layout(mid)[1]:
+                low = mid
+            else:
+                high = mid - 1
+        lines, fits = layout(low)
+        return low, lines if fits else self._truncate(lines, low, width, height)
+
+    def _truncate(self, lines, size, width, height):
+        font = self.font(size)
+        keep = max(1, height // font.get_linesize())
+        if len(lines) <= keep:
+            return lines
+        last = lines[keep - 1]
+        while last and font.size(last + ELLIPSIS)[0] > width:
+            last = last[:-1]
+        return lines[:keep - 1] + (last.rstrip() + ELLIPSIS,)
+
+
+class ButtonSkins:
+    """
+    Button backgrounds (shadow, body, top highlight) rendered once per
+    (size, color, state) into a surface and blitted from then on, so a
+    screen full of buttons is one blit each instead of three rounded
+    rect draws. A skin is SHADOW_OFFSET px taller than its button and is
+    blitted at the button's top-left in every state. clear() drops them
+    all; the layout calls it when the window is resized.
+    """
+
+    def __init__(self, max_skins: int = 512):
+        self.skins = OrderedDict()  # { (width, height, color, state): surface }
+        self.max_skins = max_skins
+
+    def clear(self):
+        self.skins.clear()
+
+    def get(self, width: int, height: int, color, state: str) -> pygame.Surface:
+        key = (width, height, tuple(color), state)
+        skin = self.skins.get(key)
+        if skin is not None:
+            self.skins.move_to_end(key)
+            return skin
+        skin = self.skins[key] = self.render(width, height, tuple(color), state)
+        if len(self.skins) > self.max_skins:
+            self.skins.popitem(last=False)
+        return skin
+
+    @staticmethod
+    def render(width: int, height: int, color, state: str) -> pygame.Surface:
+        pressed = state == "pressed"
+        body_color = adjust_color(color, -50 if pressed else 40 if state == "hover" else 0)
+        highlight_color = adjust_color(body_color, 50)
+        # Only the rounded corners are see-through: a colorkey (RLE encoded)
+        # blits faster than per-pixel alpha, which is slower than the rects
+        key = next(c for c in ((255, 0, 255), (0, 255, 0), (1, 2, 3))
+                   if c not in ((0, 0, 0), body_color, highlight_color))
+        skin = pygame.Surface((width, height + SHADOW_OFFSET))
+        skin.fill(key)
+        body = pygame.Rect(0, 0, width, height)
+        if pressed:
+            # Moved down and darkened, no shadow or highlight
+            pygame.draw.rect(skin, body_color, body.move(0, PRESS_OFFSET), border_radius=BUTTON_RADIUS)
+        else:
+            pygame.draw.rect(skin, (0, 0, 0), body.move(0, SHADOW_OFFSET), border_radius=BUTTON_RADIUS)
+            pygame.draw.rect(skin, body_color, body, border_radius=BUTTON_RADIUS)
+            highlight = pygame.Rect(0, 0, width, 2)
+            pygame.draw.rect(skin, highlight_color, highlight, border_radius=BUTTON_RADIUS)
+        skin.set_colorkey(key, pygame.RLEACCEL)
+        if pygame.display.get_surface() is not None:
+            skin = skin.convert()
+        return skin
+
+
+def adjust_color(color: Tuple[int, int, int], amount: int) -> Tuple[int, int, int]:
+    """Lighten or darken a color by the given amount"""
+    return tuple(min(255, max(0, c + amount)) for c in color)
+
+
 class ResponsiveLayout:
-    def __init__(self, display_manager):
+    def __init__(self, display_manager, text_cache: Optional[TextCache] = None):
         self.display_manager = display_manager
+        self.text_cache = text_cache if text_cache else TextCache()
+        self.button_skins = ButtonSkins()
+        self.screen_width = self.screen_height = None
         self.update_scale_factors()
         # Track mouse state
         self.mouse_pos = (0, 0)
@@ -11,6 +252,10 @@ class ResponsiveLayout:
     
     def update_scale_factors(self):
         """Update scale factors based on current screen dimensions"""
+        if (self.screen_width, self.screen_height) != (self.display_manager.current_width,
+                                                       self.display_manager.current_height):
+            # Button sizes follow the window, so the old skins won't be drawn again
+            self.button_skins.clear()
         self.screen_width = self.display_manager.current_width
         self.screen_height = self.display_manager.current_height
         
@@ -20,7 +265,11 @@ class ResponsiveLayout:
     
     def get_font(self, size_multiplier: float = 1.0) -> pygame.font.Font:
         """Get a scaled font based on screen size"""
-        return pygame.font.Font(None, int(self.base_font_size * size_multiplier))
+        return self.text_cache.font(int(self.base_font_size * size_multiplier))
+    
+    def render_text(self, text: str, color, size_multiplier: float = 1.0) -> pygame.Surface:
+        """Render text at a scaled size, reusing cached surfaces"""
+        return self.text_cache.render(text, int(self.base_font_size * size_multiplier), color)
     
     def update_mouse_state(self, pos, pressed):
         """Update current mouse position and state"""
@@ -42,64 +291,39 @@ class ResponsiveLayout:
     
     def adjust_color(self, color: Tuple[int, int, int], amount: int) -> Tuple[int, int, int]:
         """Lighten or darken a color by the given amount"""
-        return tuple(min(255, max(0, c + amount)) for c in color)
+        return adjust_color(color, amount)
     
     def draw_button(self, rect: pygame.Rect, color: Tuple[int, int, int], 
                     text: str, text_color: Tuple[int, int, int],
                     pressed: bool = False, hovered: bool = False):
         """Draw a button with enhanced visual feedback"""
-        # Constants for visual effects
-        SHADOW_OFFSET = 4
-        PRESS_OFFSET = 4
-        
-        # Draw order: shadow -> button -> highlight -> text
+        # Background from the skin cache: shadow -> button -> highlight
+        state = "pressed" if pressed else "hover" if hovered else "normal"
+        skin = self.button_skins.get(rect.width, rect.height, color, state)
+        self.display_manager.screen.blit(skin, rect.topleft)
+        button_rect = rect.move(0, PRESS_OFFSET) if pressed else rect.copy()
         
-        # Base shadow (when not pressed)
-        if not pressed:
-            shadow_rect = rect.copy()
-            shadow_rect.y += SHADOW_OFFSET
-            pygame.draw.rect(self.display_manager.screen, (0, 0, 0, 100), 
-                            shadow_rect, border_radius=8)
-        
-        # Button background
-        button_rect = rect.copy()
-        if pressed:
-            # Move button down and darken when pressed
-            button_rect.y += PRESS_OFFSET
-            button_color = self.adjust_color(color, -50)
-        elif hovered:
-            # Lighten when hovered
-            button_color = self.adjust_color(color, 40)
-        else:
-            button_color = color
-        
-        # Main button body
-        pygame.draw.rect(self.display_manager.screen, button_color, button_rect, border_radius=8)
-        
-        # Top highlight for 3D effect
-        if not pressed:
-            highlight_rect = button_rect.copy()
-            highlight_rect.height = 2
-            pygame.draw.rect(self.display_manager.screen,
-                            self.adjust_color(button_color, 50),
-                            highlight_rect, border_radius=8)
-        
-        # Text
-        font = self.get_font()
+        # Text, wrapped and shrunk to fit the button if it is long
         # Darken text slightly when pressed
         final_text_color = self.adjust_color(text_color, -30) if pressed else text_color
-        text_surface = font.render(text, True, final_text_color)
-        
-        # Center text in button, adjust for pressed state
-        text_rect = text_surface.get_rect()
-        text_rect.center = button_rect.center
-        if pressed:
-            text_rect.y += PRESS_OFFSET
-        
-        self.display_manager.screen.blit(text_surface, text_rect)
+        text_box = button_rect.inflate(-2 * BUTTON_TEXT_PADDING, -BUTTON_TEXT_PADDING)
+        size, lines = self.fit_button_text(button_rect, text)
+        self.draw_lines(lines, size, final_text_color, text_box)
         
         return button_rect
     
+    def fit_button_text(self, rect: pygame.Rect, text: str):
+        """(size, lines) of a button label, as draw_button lays it out (memoized)."""
+        return self.text_cache.fit(text, self.base_font_size,
+                                   rect.width - 2 * BUTTON_TEXT_PADDING, rect.height - BUTTON_TEXT_PADDING,
+                                   min_size=min(MIN_FIT_SIZE, self.base_font_size))
+    
+    def centered_rect(self, y_percent: float, width_percent: float, height_percent: float) -> pygame.Rect:
+        """The rect create_centered_button uses for these percentages."""
+        width = int(self.screen_width * width_percent)
+        height = int(self.screen_height * height_percent)
+        return pygame.Rect(int((self.screen_width - width) / 2), int(self.screen_height * y_percent), width, height)
+    
     def create_centered_button(self, 
                             y_percent: float, 
                             width_percent: float, 
@@ -108,12 +332,7 @@ class ResponsiveLayout:
                             text: str, 
                             text_color: Tuple[int, int, int] = (255, 255, 255)) -> pygame.Rect:
         """Create a button centered horizontally at given vertical position"""
-        width = int(self.screen_width * width_percent)
-        height = int(self.screen_height * height_percent)
-        y = int(self.screen_height * y_percent)
-        x = int((self.screen_width - width) / 2)
-        
-        button_rect = pygame.Rect(x, y, width, height)
+        button_rect = self.centered_rect(y_percent, width_percent, height_percent)
         
         # Check if mouse is over button using screen coordinates
         hovered = self.check_hover(button_rect)
@@ -143,14 +362,66 @@ class ResponsiveLayout:
         
         return self.draw_button(button_rect, color, text, text_color, pressed, hovered)
     
+    def draw_lines(self, lines, size: int, color, rect: pygame.Rect, align: str = "center") -> pygame.Rect:
+        """
+        Blit lines (from TextCache.wrap / fit) at font `size`, centered
+        vertically in rect and aligned "left", "center" or "right".
+        Returns the area drawn on.
+        """
+        line_height = self.text_cache.font(size).get_linesize()
+        y = rect.centery - len(lines) * line_height // 2
+        drawn = None
+        for line in lines:
+            surface = self.text_cache.render(line, size, color)
+            if align == "left":
+                x = rect.x
+            elif align == "right":
+                x = rect.right - surface.get_width()
+            else:
+                x = rect.centerx - surface.get_width() // 2
+            self.display_manager.screen.blit(surface, (x, y))
+            line_rect = pygame.Rect(x, y, surface.get_width(), line_height)
+            drawn = drawn.union(line_rect) if drawn else line_rect
+            y += line_height
+        return drawn or pygame.Rect(rect.center, (0, 0))
+
+    def draw_text_block(self,
+                        rect: pygame.Rect,
+                        text: str,
+                        color: Tuple[int, int, int] = (0, 0, 0),
+                        size_multiplier: float = 1.0,
+                        min_multiplier: float = 0.5,
+                        align: str = "center",
+                        balanced: bool = True) -> pygame.Rect:
+        """
+        Draw text word-wrapped inside rect, shrinking the font (down to
+        min_multiplier) until it fits. Line breaks and the size are
+        memoized, so long text costs only its blits after the first frame.
+        """
+        size, lines = self.fit_text_block(rect, text, size_multiplier, min_multiplier, balanced)
+        return self.draw_lines(lines, size, color, rect, align)
+
+    def fit_text_block(self, rect: pygame.Rect, text: str, size_multiplier: float = 1.0,
+                       min_multiplier: float = 0.5, balanced: bool = True):
+        """(size, lines) as draw_text_block lays them out; call ahead of time to warm the memo."""
+        return self.text_cache.fit(
+            text, int(self.base_font_size * size_multiplier), rect.width, rect.height,
+            min_size=int(self.base_font_size * min_multiplier), balanced=balanced
+        )
+
+    def text_box(self, y_percent: float, height_percent: float,
+                 x_percent: float = 0.05, width_percent: float = 0.9) -> pygame.Rect:
+        """Screen rect from percentages, for draw_text_block."""
+        return pygame.Rect(int(self.screen_width * x_percent), int(self.screen_height * y_percent),
+                           int(self.screen_width * width_percent), int(self.screen_height * height_percent))
+
     def draw_text_centered(self, 
                           y_percent: float, 
                           text: str, 
                           color: Tuple[int, int, int] = (0, 0, 0),
                           size_multiplier: float = 1.0):
         """Draw centered text at given vertical position"""
-        font = self.get_font(size_multiplier)
-        text_surface = font.render(text, True, color)
+        text_surface = self.render_text(text, color, size_multiplier)
         x = (self.screen_width - text_surface.get_width()) / 2
         y = self.screen_height * y_percent
         self.display_manager.screen.blit(text_surface, (x, y))
@@ -171,14 +442,12 @@ class ResponsiveLayout:
         pygame.draw.rect(self.display_manager.screen, (128, 128, 128), input_rect)
         
         if label:
-            font = self.get_font(0.75)
-            label_surface = font.render(label, True, (0, 0, 0))
+            label_surface = self.render_text(label, (0, 0, 0), 0.75)
             label_y = y - label_surface.get_height() - 5
             self.display_manager.screen.blit(label_surface, (x, label_y))
         
         if text:
-            font = self.get_font()
-            text_surface = font.render(text, True, (0, 0, 0))
+            text_surface = self.render_text(text, (0, 0, 0))
             text_rect = text_surface.get_rect(center=input_rect.center)
             self.display_manager.screen.blit(text_surface, text_rect)
         
@@ -214,4 +483,4 @@ class ResponsiveLayout:
             
             current_x_percent += button_width_percent + spacing_percent
         
-        return buttons
\ No newline at end of file
+        return buttons
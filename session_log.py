@@ -0,0 +1,155 @@
+# Write a snapshot after this many events so a resume replays at most this many
+SNAPSHOT_INTERVAL = 100
+# How many scoring actions can be undone / redone
+UNDO_DEPTH = 50
+
+# Event types
+SESSION_START = "session_start"   # {time_per_question, question_group_id}
+TEAMS = "teams"                   # {teams: [[team_id, team_name], ...]}
+ANSWER = "answer"                 # {question_id, team_id, was_correct, points, [penalty]}
+SCORE_ADJUST = "score_adjust"     # {team_id, delta, reason}
+RANDOM_EVENT = "random_event"     # {team_id, delta, ...}
+TURN = "turn"                     # {team_id}
+UNDO = "undo"                     # {undone_seq, team_id, delta}
+REDO = "redo"                     # {redone_seq, team_id, delta}
+
+# Events that change a score and can therefore be undone
+SCORING_EVENTS = (ANSWER, SCORE_ADJUST, RANDOM_EVENT)
+
+
+def empty_state():
+    return {
+        "teams": [],
+        "scores": {},       # { str(team_id): score }
+        "turn": None,
+        "answered": {},     # { str(question_id): 0|1 }
+        "undo_stack": [],   # [[seq, team_id, delta], ...] most recent last
+        "redo_stack": [],   # [[undone_seq, team_id, delta], ...] most recent last
+    }
+
+
+def scoring_delta(event_type, payload):
+    """How many points an event moves, or 0."""
+    if event_type == ANSWER:
+        return payload["points"] if payload["was_correct"] else -payload.get("penalty", 0)
+    if event_type in (SCORE_ADJUST, RANDOM_EVENT, UNDO, REDO):
+        return payload["delta"]
+    return 0
+
+
+def apply_event(state, seq, event_type, payload):
+    """
+    Fold one event into a session state dict (in place). This is the only
+    place that knows how events change state; replay and live play share it.
+    """
+    if event_type == TEAMS:
+        state["teams"] = [list(t) for t in payload["teams"]]
+        for team_id, _ in state["teams"]:
+            state["scores"].setdefault(str(team_id), 0)
+    elif event_type == TURN:
+        state["turn"] = payload["team_id"]
+    elif event_type == ANSWER:
+        state["answered"][str(payload["question_id"])] = 1 if payload["was_correct"] else 0
+
+    delta = scoring_delta(event_type, payload)
+    if delta:
+        key = str(payload["team_id"])
+        state["scores"][key] = state["scores"].get(key, 0) + delta
+        if event_type in SCORING_EVENTS:
+            # A fresh scoring action invalidates anything that could be redone
+            state["undo_stack"].append([seq, payload["team_id"], delta])
+            del state["undo_stack"][:-UNDO_DEPTH]
+            state["redo_stack"] = []
+
+    if event_type == UNDO:
+        state["undo_stack"] = [e for e in state["undo_stack"] if e[0] != payload["undone_seq"]]
+        state["redo_stack"].append([payload["undone_seq"], payload["team_id"], -payload["delta"]])
+        del state["redo_stack"][:-UNDO_DEPTH]
+    elif event_type == REDO:
+        state["redo_stack"] = [e for e in state["redo_stack"] if e[0] != payload["redone_seq"]]
+        state["undo_stack"].append([seq, payload["team_id"], payload["delta"]])
+        del state["undo_stack"][:-UNDO_DEPTH]
+    return state
+
+
+class SessionLog:
+    """
+    Append-only event log for one session, backed by the session_events
+    table, with periodic snapshots in session_snapshots.
+
+    The in-memory `state` is always the fold of every event so far; a
+    resume loads the newest snapshot and replays only the events after it.
+
+    While holding (hold()), appended events stay in memory until the
+    caller takes them with take_held() and writes them in its own batch.
+    """
+
+    def __init__(self, db, session_id, snapshot_interval=SNAPSHOT_INTERVAL):
+        self.db = db
+        self.session_id = session_id
+        self.snapshot_interval = snapshot_interval
+        self.seq = 0
+        self.snapshot_seq = 0
+        self.state = empty_state()
+        self.held = None  # [(seq, event_type, payload)] not yet written, while holding
+
+    @classmethod
+    def rebuild(cls, db, session_id, snapshot_interval=SNAPSHOT_INTERVAL):
+        """Restore a log from its latest snapshot plus the tail of events."""
+        log = cls(db, session_id, snapshot_interval)
+        snapshot = db.get_latest_session_snapshot(session_id)
+        if snapshot:
+            log.snapshot_seq, log.state = snapshot
+            log.seq = log.snapshot_seq
+        for seq, event_type, payload in db.get_session_events(session_id, after_seq=log.seq):
+            apply_event(log.state, seq, event_type, payload)
+            log.seq = seq
+        return log
+
+    def append(self, event_type, payload):
+        """Persist an event, fold it into the state and snapshot if due."""
+        seq = self.seq + 1
+        if self.held is not None:
+            self.held.append((seq, event_type, payload))
+        else:
+            self.db.append_session_event(self.session_id, seq, event_type, payload)
+        apply_event(self.state, seq, event_type, payload)
+        self.seq = seq
+        if self.held is None:
+            self.snapshot_if_due()
+        return seq
+
+    @property
+    def holding(self):
+        return self.held is not None
+
+    def hold(self):
+        """Keep new events in memory instead of writing each one."""
+        if self.held is None:
+            self.held = []
+
+    def take_held(self):
+        """Stop holding and return the held events, oldest first."""
+        held, self.held = self.held or [], None
+        return held
+
+    def snapshot_if_due(self):
+        if self.seq - self.snapshot_seq >= self.snapshot_interval:
+            self.snapshot()
+
+    def snapshot(self):
+        self.db.save_session_snapshot(self.session_id, self.seq, self.state)
+        self.snapshot_seq = self.seq
+
+    def last_scoring_action(self):
+        """[seq, team_id, delta] of the newest undoable action, or None."""
+        stack = self.state["undo_stack"]
+        return stack[-1] if stack else None
+
+    def last_undone_action(self):
+        """[undone_seq, team_id, delta] of the newest redoable action, or None."""
+        stack = self.state["redo_stack"]
+        return stack[-1] if stack else None
+
+    def scores(self):
+        return {int(k): v for k, v in self.state["scores"].items()}
@@ -0,0 +1,192 @@
+import threading
+
+from db_manager import DBManager
+from game_logic import GameLogic
+from question_pack import QuestionPack
+
+# Idle connections kept by the shared pool
+POOL_SIZE = 8
+
+
+class QuestionCache:
+    """
+    Question content per group, loaded once and shared by every room.
+
+    Rooms on the same group preload from the same question dicts; only
+    the per-session "already answered" ids are read from the DB. Stats
+    (attempts / correct) are as of the first load, which is fine for
+    adaptive selection. Call invalidate() after editing a group.
+
+    Question packs are opened (memory-mapped) once per file, too, and
+    stay open until close_packs() (SessionManager.close_all does it).
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.banks = {}  # { question_group_id: [question, ...] }
+        self.packs = {}  # { path: QuestionPack }
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_question_bank(self, question_group_id):
+        with self.lock:
+            bank = self.banks.get(question_group_id)
+            if bank is not None:
+                self.hits += 1
+                return bank
+            self.misses += 1
+        bank = self.db.get_question_bank(question_group_id)
+        with self.lock:
+            return self.banks.setdefault(question_group_id, bank)
+
+    def get_session_question_bank(self, session_id, question_group_id):
+        """Same result as DBManager.get_session_question_bank, from the cache."""
+        answered = self.db.get_answered_question_ids(session_id)
+        return [q for q in self.get_question_bank(question_group_id) if q["id"] not in answered]
+
+    def get_pack(self, path):
+        with self.lock:
+            pack = self.packs.get(path)
+            if pack is None:
+                pack = self.packs[path] = QuestionPack(path)
+            return pack
+
+    def close_packs(self):
+        """Unmap every cached pack (once no room plays from them)."""
+        with self.lock:
+            packs, self.packs = self.packs, {}
+        for pack in packs.values():
+            pack.close()
+
+    def invalidate(self, question_group_id=None):
+        with self.lock:
+            if question_group_id is None:
+                self.banks.clear()
+            else:
+                self.banks.pop(question_group_id, None)
+
+
+class SessionManager:
+    """
+    Runs several games (rooms) in one process: one GameLogic per session,
+    all sharing one pooled DBManager and one QuestionCache.
+
+    One room is active at a time for the UI. Listeners added here see the
+    active room's events only, and switching rooms replays the new room's
+    state to them, so a StateSync attached here always mirrors the room on
+    screen. Every room keeps its own scores, turn and question clock.
+    """
+
+    def __init__(self, db=None, pool_size=POOL_SIZE):
+        self.db = db if db else DBManager(pool_size=pool_size)
+        self.questions = QuestionCache(self.db)
+        self.rooms = {}  # { session_id: GameLogic }
+        self.ui_state = {}  # { session_id: {...} } screen state the UI stashes per room
+        self.active_id = None
+        self.listeners = []
+        self.idle = self._new_logic()  # stands in while no room is open
+
+    def _new_logic(self):
+        logic = GameLogic(self.db, question_cache=self.questions)
+        logic.add_listener(lambda event, *args: self._forward(logic, event, *args))
+        return logic
+
+    # ----------------------------------------------------------------
+    #                          LISTENERS
+    # ----------------------------------------------------------------
+    def add_listener(self, callback):
+        self.listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self.listeners:
+            self.listeners.remove(callback)
+
+    def _emit(self, event, *args):
+        for callback in self.listeners:
+            callback(event, *args)
+
+    def _forward(self, logic, event, *args):
+        if logic is self.active:
+            self._emit(event, *args)
+
+    def _replay(self, logic):
+        """Tell listeners everything about the newly active room."""
+        self._emit("session", logic.current_session_id)
+        if not logic.current_session_id:
+            return
+        self._emit("teams", logic.teams)
+        self._emit("scores", logic.get_scores())
+        self._emit("turn", logic.get_current_team_id())
+        if logic.log:
+            for q_id, was_correct in logic.log.state["answered"].items():
+                self._emit("answered", int(q_id), bool(was_correct))
+        self._emit("question", logic.current_question)
+
+    # ----------------------------------------------------------------
+    #                          ROOMS
+    # ----------------------------------------------------------------
+    @property
+    def active(self):
+        """The room on screen, or an idle GameLogic when none is open."""
+        return self.rooms.get(self.active_id, self.idle)
+
+    def create_room(self, time_per_question, question_group_id, game_mode="random", mode_options=None,
+                    question_pack=None):
+        """Start a new session in its own GameLogic and make it active."""
+        logic = self._new_logic()
+        session_id = logic.create_new_session(
+            time_per_question, question_group_id, game_mode, mode_options, question_pack
+        )
+        self.rooms[session_id] = logic
+        self.switch_to(session_id)
+        return logic
+
+    def load_room(self, session_id):
+        """Resume a session as a room (or switch to it if already open). None if unknown."""
+        if session_id not in self.rooms:
+            logic = self._new_logic()
+            if not logic.load_session(session_id):
+                return None
+            self.rooms[session_id] = logic
+        self.switch_to(session_id)
+        return self.rooms[session_id]
+
+    def switch_to(self, session_id):
+        self.active_id = session_id if session_id in self.rooms else None
+        self._replay(self.active)
+        return self.active
+
+    def next_room(self):
+        """Make the next room (by session id) active and return it."""
+        if not self.rooms:
+            return self.active
+        ids = sorted(self.rooms)
+        pos = ids.index(self.active_id) + 1 if self.active_id in ids else 0
+        return self.switch_to(ids[pos % len(ids)])
+
+    def close_room(self, session_id=None):
+        """End a room's session. If it was active, the next open room takes over."""
+        if session_id is None:
+            session_id = self.active_id
+        logic = self.rooms.pop(session_id, None)
+        if logic is None:
+            return self.active
+        self.ui_state.pop(session_id, None)
+        logic.end_session()
+        if session_id == self.active_id:
+            self.active_id = None
+            if self.rooms:
+                return self.next_room()
+            self._replay(self.idle)
+        return self.active
+
+    def room_position(self):
+        """(1-based position of the active room, number of rooms)."""
+        ids = sorted(self.rooms)
+        return (ids.index(self.active_id) + 1 if self.active_id in ids else 0), len(ids)
+
+    def close_all(self):
+        for session_id in list(self.rooms):
+            self.close_room(session_id)
+        self.questions.close_packs()
@@ -0,0 +1,384 @@
+import argparse
+import contextlib
+import io
+import multiprocessing
+import random
+import time
+import numpy as np
+
+from game_logic import GameLogic
+from game_modes import BUZZER_PENALTY, lightning_order
+from question_model import Question
+from random_events import RandomEventEngine, DEFAULT_EVENT_RATE
+
+# How sharply skill vs difficulty turns into a chance of answering correctly
+SKILL_SLOPE = 6.0
+# Games per vectorized batch (bounds memory: games x questions ints)
+CHUNK_SIZE = 50_000
+MEMORY_GROUP_ID = 1
+
+# Game modes the simulator can play (grid needs a tile-picking policy, so it is left out)
+MODES = ("random", "buzzer", "lightning")
+
+
+def answer_probability(skill, difficulty):
+    """
+    Chance a team of `skill` answers a question of `difficulty` (both 0..1).
+    Equal skill and difficulty is a coin flip. Works on scalars and arrays.
+    """
+    return 1.0 / (1.0 + np.exp(-SKILL_SLOPE * (np.asarray(skill) - np.asarray(difficulty))))
+
+
+# ---------------------------
+# In-memory DB
+# ---------------------------
+class MemoryDB:
+    """
+    Stands in for DBManager so GameLogic can play whole games without
+    SQLite. Covers only what GameLogic calls during a game, for a single
+    question bank (group MEMORY_GROUP_ID). Session log writes are dropped.
+    Session ids start after `seed`: game modes are seeded with the session
+    id, so this keeps every simulated game's draw order different.
+    """
+
+    def __init__(self, questions, seed=None):
+        # questions: [{ id, points, difficulty }, ...]
+        self.questions = {q["id"]: q for q in questions}
+        self.session_id_base = seed or 0
+        self.sessions = {}
+        self.teams = {}          # { team_id: (session_id, team_name) }
+        self.scores = {}         # { (session_id, team_id): score }
+        self.answered = {}       # { (session_id, question_id): was_correct }
+
+    def create_new_session(self, time_per_question, question_group_id, game_mode="random", mode_options=None,
+                           question_pack=None):
+        session_id = self.session_id_base + len(self.sessions) + 1
+        self.sessions[session_id] = {
+            "id": session_id,
+            "created_at": None,
+            "is_active": True,
+            "time_per_question": time_per_question,
+            "current_turn_team_id": None,
+            "question_group_id": question_group_id,
+            "game_mode": game_mode,
+            "mode_options": dict(mode_options or {}),
+        }
+        return session_id
+
+    def get_session(self, session_id):
+        s_data = self.sessions.get(session_id)
+        return dict(s_data) if s_data else None
+
+    def update_session_status(self, session_id, is_active):
+        self.sessions[session_id]["is_active"] = bool(is_active)
+
+    def add_team(self, session_id, team_name):
+        team_id = len(self.teams) + 1
+        self.teams[team_id] = (session_id, team_name)
+        return team_id
+
+    def add_teams(self, session_id, team_names, rosters=None):
+        new_ids = [self.add_team(session_id, name) for name in team_names]
+        self.init_session_state(session_id, new_ids)
+        return [{"team_id": t_id, "team_name": self.teams[t_id][1], "players": []} for t_id in new_ids]
+
+    def get_teams_for_session(self, session_id):
+        return [
+            {"team_id": t_id, "team_name": name, "players": []}
+            for t_id, (s_id, name) in self.teams.items() if s_id == session_id
+        ]
+
+    def init_session_state(self, session_id, team_ids):
+        for t_id in team_ids:
+            self.scores[(session_id, t_id)] = 0
+
+    def get_session_state(self, session_id):
+        return {
+            "current_turn_team_id": self.sessions[session_id]["current_turn_team_id"],
+            "scores": {t_id: sc for (s_id, t_id), sc in self.scores.items() if s_id == session_id},
+        }
+
+    def adjust_score(self, session_id, team_id, delta):
+        self.scores[(session_id, team_id)] = self.scores.get((session_id, team_id), 0) + delta
+        return self.scores[(session_id, team_id)]
+
+    def update_current_turn(self, session_id, next_team_id):
+        self.sessions[session_id]["current_turn_team_id"] = next_team_id
+
+    def get_session_question_bank(self, session_id, question_group_id):
+        return [
+            Question(q["id"], question_group_id, f"Question {q['id']}", None, q["points"], None, "open_ended")
+            for q_id, q in self.questions.items() if (session_id, q_id) not in self.answered
+        ]
+
+    def mark_question_answered(self, session_id, question_id, was_correct, answer_seconds=None):
+        self.answered[(session_id, question_id)] = was_correct
+
+    def record_answer_batch(self, session_id, events, answers, scores, current_turn_team_id):
+        for question_id, was_correct, answer_seconds in answers:
+            self.mark_question_answered(session_id, question_id, was_correct, answer_seconds)
+        for t_id, score in scores.items():
+            self.scores[(session_id, t_id)] = score
+        self.update_current_turn(session_id, current_turn_team_id)
+
+    def append_session_event(self, session_id, seq, event_type, payload):
+        pass
+
+    def save_session_snapshot(self, session_id, seq, state):
+        pass
+
+
+def play_reference_game(config, seed=None):
+    """
+    Play one game through the real GameLogic rules on a MemoryDB.
+    Returns the final scores in roster order.
+    """
+    rng = random.Random(seed)
+    skills = config["skills"]
+    questions = [
+        {"id": i + 1, "points": int(p), "difficulty": float(d)}
+        for i, (p, d) in enumerate(zip(config["points"], config["difficulty"]))
+    ]
+    logic = GameLogic(MemoryDB(questions, seed))
+
+    # GameLogic prints [DEBUG] lines for every question
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Events are seeded with the session id, which MemoryDB derives from `seed`
+        logic.create_new_session(30, MEMORY_GROUP_ID, config["mode"], {
+            "random_events": config["events"], "event_rate": config["event_rate"],
+        })
+        logic.setup_teams([f"Team {i + 1}" for i in range(len(skills))])
+        team_ids = [t["team_id"] for t in logic.teams]
+
+        while True:
+            question = logic.begin_game_loop()
+            if question is None:
+                break
+            if config["mode"] == "buzzer":
+                logic.set_current_team(rng.choices(team_ids, weights=skills)[0])
+            skill = skills[team_ids.index(logic.get_current_team_id())]
+            difficulty = questions[question["id"] - 1]["difficulty"]
+            was_correct = rng.random() < answer_probability(skill, difficulty)
+            logic.mark_answer(question["id"], was_correct, question["points"])
+            logic.roll_random_event()
+
+    return [logic.scores[t_id] for t_id in team_ids]
+
+
+# ---------------------------
+# Vectorized fast path
+# ---------------------------
+def simulate_chunk(config, games, seed):
+    """
+    Play `games` games at once with NumPy, following the same rules as
+    play_reference_game(): questions drawn without replacement, turns
+    rotating after every answer (after every streak in lightning, which
+    leaves over what can't be shared out evenly, to the fastest buzzer in
+    buzzer mode, where a wrong answer also costs points),
+    points on a correct answer and an optional random event roll after
+    each turn.
+    """
+    rng = np.random.default_rng(seed)
+    points = np.asarray(config["points"], dtype=float)
+    difficulty = np.asarray(config["difficulty"], dtype=float)
+    skills = np.asarray(config["skills"], dtype=float)
+    questions, teams = len(points), len(skills)
+    engine = None
+    if config["events"]:
+        engine = RandomEventEngine(seed=rng.integers(1 << 63), event_rate=config["event_rate"])
+
+    rows = np.arange(games)
+    order = rng.permuted(np.tile(np.arange(questions), (games, 1)), axis=1)
+    scores = np.zeros((games, teams))
+    remaining = np.full(games, points.sum())
+    team = np.zeros(games, dtype=int)
+    halfway = scores.copy()
+    played = questions
+    if config["mode"] == "lightning":
+        turn_order = lightning_order(questions, teams)
+        played = len(turn_order)
+
+    for turn in range(played):
+        q = order[:, turn]
+        if config["mode"] == "buzzer":
+            team = rng.choice(teams, size=games, p=skills / skills.sum())
+        elif config["mode"] == "lightning":
+            team = np.full(games, turn_order[turn])
+        correct = rng.random(games) < answer_probability(skills[team], difficulty[q])
+        penalty = np.round(points[q] * BUZZER_PENALTY) if config["mode"] == "buzzer" else 0.0
+        scores[rows, team] += np.where(correct, points[q], -penalty)
+        remaining -= points[q]
+
+        if engine is not None:
+            team_index, delta = engine.roll(scores, remaining, played - turn - 1)
+            hit = team_index >= 0
+            scores[hit, team_index[hit]] += delta[hit]
+
+        team = (team + 1) % teams
+        if turn + 1 == played // 2:
+            halfway = scores.copy()
+
+    # Random jitter settles ties without favouring roster order
+    winners = np.argmax(scores + rng.random(scores.shape) * 1e-3, axis=1)
+    ranked = np.sort(scores, axis=1)
+    return {
+        "games": games,
+        "wins": np.bincount(winners, minlength=teams),
+        "margins": (ranked[:, -1] - ranked[:, -2]).astype(np.int32),
+        "comebacks": int((halfway[rows, winners] < halfway.max(axis=1)).sum()),
+    }
+
+
+def _simulate_task(task):
+    return simulate_chunk(*task)
+
+
+def run_simulation(config, games=1_000_000, workers=None, seed=0, chunk_size=CHUNK_SIZE):
+    """
+    Split `games` into chunks with independent seeds and play them across
+    `workers` processes (default: every core). Returns the merged results.
+    """
+    workers = workers if workers else multiprocessing.cpu_count()
+    sizes = [chunk_size] * (games // chunk_size)
+    if games % chunk_size:
+        sizes.append(games % chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(config, size, child) for size, child in zip(sizes, seeds)]
+
+    if workers > 1 and len(tasks) > 1:
+        with multiprocessing.Pool(workers) as pool:
+            chunks = pool.map(_simulate_task, tasks)
+    else:
+        chunks = [_simulate_task(task) for task in tasks]
+
+    return {
+        "games": games,
+        "wins": sum(c["wins"] for c in chunks),
+        "margins": np.concatenate([c["margins"] for c in chunks]),
+        "comebacks": sum(c["comebacks"] for c in chunks),
+    }
+
+
+def summarize(results):
+    """
+    Win rates, final-margin distribution and comeback probability (the
+    eventual winner was behind the leader at half time).
+    """
+    margins = results["margins"]
+    p10, p50, p90 = np.percentile(margins, [10, 50, 90])
+    return {
+        "games": results["games"],
+        "win_rates": results["wins"] / results["games"],
+        "margin_mean": float(margins.mean()),
+        "margin_p10": float(p10),
+        "margin_p50": float(p50),
+        "margin_p90": float(p90),
+        "tie_rate": float((margins == 0).mean()),
+        "comeback_probability": results["comebacks"] / results["games"],
+    }
+
+
+def margin_histogram(margins, bins=10, width=40):
+    """Text histogram of final margins, one line per bin."""
+    counts, edges = np.histogram(margins, bins=bins)
+    peak = max(counts.max(), 1)
+    return [
+        f"{edges[i]:7.0f}-{edges[i + 1]:<7.0f} {'#' * int(width * c / peak)} {c / len(margins):.1%}"
+        for i, c in enumerate(counts)
+    ]
+
+
+# ---------------------------
+# Setup
+# ---------------------------
+def load_question_points(db, question_group_id):
+    """Point values of every question in a group."""
+    return [q["points"] or 0 for q in db.get_questions_for_question_group(question_group_id)]
+
+
+def make_config(points, skills, mode="random", difficulty=0.5, spread=0.2,
+                events=False, event_rate=DEFAULT_EVENT_RATE, seed=0):
+    """
+    Build a picklable simulation config. Question difficulty is drawn
+    once per bank, uniformly in difficulty +/- spread.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode '{mode}', expected one of {MODES}")
+    rng = np.random.default_rng(seed)
+    difficulties = np.clip(rng.uniform(difficulty - spread, difficulty + spread, len(points)), 0, 1)
+    return {
+        "points": [int(p) for p in points],
+        "difficulty": difficulties.tolist(),
+        "skills": [float(s) for s in skills],
+        "mode": mode,
+        "events": events,
+        "event_rate": event_rate,
+    }
+
+
+def check_against_game_logic(config, games=500, seed=0):
+    """
+    Win rates from the GameLogic reference path vs the vectorized path,
+    to catch the fast path drifting from the real rules.
+    """
+    rng = np.random.default_rng(seed)
+    wins = np.zeros(len(config["skills"]))
+    for i in range(games):
+        final = np.array(play_reference_game(config, seed=seed + i), dtype=float)
+        wins[int(np.argmax(final + rng.random(final.shape) * 1e-3))] += 1
+    fast = simulate_chunk(config, games * 20, seed)
+    return wins / games, fast["wins"] / fast["games"]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Monte Carlo game simulator for balancing a question bank.")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--skills", type=float, nargs="+", default=[0.6, 0.5, 0.5, 0.4],
+                        help="team skill profiles, 0..1")
+    parser.add_argument("--group", type=int, help="question group to take point values from")
+    parser.add_argument("--db", default=None, help="database file (default: the game's)")
+    parser.add_argument("--points", type=int, nargs="+", default=[10, 20, 30, 40, 50] * 6,
+                        help="point values when no --group is given")
+    parser.add_argument("--mode", choices=MODES, default="random")
+    parser.add_argument("--difficulty", type=float, default=0.5, help="mean question difficulty, 0..1")
+    parser.add_argument("--spread", type=float, default=0.2)
+    parser.add_argument("--events", action="store_true", help="enable random events")
+    parser.add_argument("--event-rate", type=float, default=DEFAULT_EVENT_RATE)
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--check", type=int, default=0,
+                        help="also play this many games through GameLogic and compare win rates")
+    args = parser.parse_args()
+
+    points = args.points
+    if args.group is not None:
+        from db_manager import DBManager
+        db = DBManager(args.db) if args.db else DBManager()
+        points = load_question_points(db, args.group)
+        if not points:
+            parser.error(f"Question group {args.group} has no questions")
+
+    config = make_config(points, args.skills, args.mode, args.difficulty, args.spread,
+                         args.events, args.event_rate, args.seed)
+
+    if args.check:
+        reference, fast = check_against_game_logic(config, args.check, args.seed)
+        print(f"[SIM] GameLogic win rates:  {' '.join(f'{r:6.1%}' for r in reference)}")
+        print(f"[SIM] Vectorized win rates: {' '.join(f'{r:6.1%}' for r in fast)}")
+
+    start = time.perf_counter()
+    results = run_simulation(config, args.games, args.workers, args.seed)
+    elapsed = time.perf_counter() - start
+    summary = summarize(results)
+
+    print(f"[SIM] {summary['games']:,} games, {len(points)} questions, mode={args.mode}, "
+          f"events={'on' if args.events else 'off'} ({elapsed:.1f}s, "
+          f"{summary['games'] / elapsed:,.0f} games/s)")
+    print(f"[SIM] Win rates: {' '.join(f'{r:6.1%}' for r in summary['win_rates'])}")
+    print(f"[SIM] Final margin: mean {summary['margin_mean']:.1f}, p10 {summary['margin_p10']:.0f}, "
+          f"median {summary['margin_p50']:.0f}, p90 {summary['margin_p90']:.0f}, "
+          f"ties {summary['tie_rate']:.1%}")
+    print(f"[SIM] Comeback probability (winner trailed at half time): "
+          f"{summary['comeback_probability']:.1%}")
+    for line in margin_histogram(results["margins"]):
+        print(f"[SIM] {line}")
@@ -0,0 +1,85 @@
+import threading
+import time
+
+# Import this module first: time-to-first-frame is measured from here
+PROCESS_START = time.perf_counter()
+
+# Target for the first frame on screen (python pygame_main.py --profile-startup)
+FIRST_FRAME_BUDGET_MS = 300
+
+
+class StartupProfile:
+    """
+    Named checkpoints since PROCESS_START. mark() records how long the
+    step since the previous mark took; report() lists them all.
+    """
+
+    def __init__(self, start=PROCESS_START):
+        self.start = start
+        self.marks = []  # [(label, ms since start)]
+        self.lock = threading.Lock()
+
+    def elapsed_ms(self):
+        return (time.perf_counter() - self.start) * 1000
+
+    def mark(self, label):
+        with self.lock:
+            self.marks.append((label, self.elapsed_ms()))
+
+    def time_of(self, label):
+        """ms since start when `label` was marked, or None."""
+        for name, at in self.marks:
+            if name == label:
+                return at
+        return None
+
+    def report(self):
+        lines = []
+        previous = 0.0
+        for label, at in self.marks:
+            lines.append(f"[STARTUP] {label:<24} +{at - previous:7.1f} ms  at {at:7.1f} ms")
+            previous = at
+        return lines
+
+
+class Warmup:
+    """
+    Runs work the frame on screen doesn't need on a background thread:
+    at startup the schema check, resume lookup and fonts while the splash
+    frame is up, later e.g. drawing the next question while the feedback
+    screen is. Tasks run in order; each one is marked on the profile.
+    If a task raises, the rest are skipped and the error is kept in
+    `error` for the main thread to re-raise.
+    """
+
+    def __init__(self, tasks, profile=None, name="startup-warmup"):
+        self.tasks = tasks  # [(label, fn), ...]
+        self.profile = profile
+        self.error = None
+        self.finished = threading.Event()
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    @property
+    def done(self):
+        return self.finished.is_set()
+
+    def wait(self, timeout=None):
+        self.finished.wait(timeout)
+        if self.error is not None:
+            raise self.error
+        return self.done
+
+    def _run(self):
+        try:
+            for label, task in self.tasks:
+                task()
+                if self.profile:
+                    self.profile.mark(label)
+        except Exception as e:
+            self.error = e
+        finally:
+            self.finished.set()
@@ -0,0 +1,313 @@
+import copy
+import json
+import queue
+import socket
+import threading
+from collections import deque
+
+from game_logic import question_display_text
+
+# Keep this many deltas so late subscribers can catch up without a snapshot
+DELTA_LOG_SIZE = 1024
+# Store a full checkpoint every N versions for snapshot_at()
+CHECKPOINT_INTERVAL = 64
+# A socket subscriber this many messages behind is dropped as too slow
+SOCKET_QUEUE_SIZE = 256
+
+# Delta opcodes (first element after the version)
+OP_SESSION = "x"    # ["x", session_id]           resets everything
+OP_TEAMS = "r"      # ["r", [[team_id, name], ...]]
+OP_SCORES = "S"     # ["S", {team_id: score, ...}]
+OP_SCORE = "s"      # ["s", team_id, score]
+OP_TURN = "t"       # ["t", team_id]
+OP_QUESTION = "q"   # ["q", {id, text, type, options} | None]
+OP_ANSWERED = "a"   # ["a", question_id, 0|1]
+OP_EXTRA = "k"      # ["k", key, value]               UI extras (e.g. submitted answer)
+
+
+def _encode(message):
+    return json.dumps(message, separators=(",", ":")).encode("utf-8")
+
+
+def empty_state():
+    return {
+        "session_id": None,
+        "teams": [],
+        "scores": {},      # keys are str(team_id) so JSON round-trips cleanly
+        "turn": None,
+        "question": None,
+        "answered": {},    # { str(question_id): 0|1 }
+        "extra": {},
+    }
+
+
+def public_question(question):
+    """
+    The parts of a question spectators may see: no correct flags, and the
+    fill-in answer blanked out of the text.
+    """
+    if question is None:
+        return None
+    return {
+        "id": question["id"],
+        "text": question_display_text(question),
+        "type": question["question_type"],
+        "options": [o["text"] for o in question.get("options", [])],
+    }
+
+
+def apply_delta(state, delta):
+    """
+    Apply one delta (without its version) to a state dict in place.
+    Used by StateSync itself and by any client mirroring it.
+    """
+    op = delta[0]
+    if op == OP_SESSION:
+        state.clear()
+        state.update(empty_state())
+        state["session_id"] = delta[1]
+    elif op == OP_TEAMS:
+        state["teams"] = [list(t) for t in delta[1]]
+    elif op == OP_SCORES:
+        state["scores"] = {str(k): v for k, v in delta[1].items()}
+    elif op == OP_SCORE:
+        state["scores"][str(delta[1])] = delta[2]
+    elif op == OP_TURN:
+        state["turn"] = delta[1]
+    elif op == OP_QUESTION:
+        state["question"] = delta[1]
+    elif op == OP_ANSWERED:
+        state["answered"][str(delta[1])] = delta[2]
+    elif op == OP_EXTRA:
+        state["extra"][delta[1]] = delta[2]
+    return state
+
+
+# ---------------------------
+# Transports
+# ---------------------------
+class QueueTransport:
+    """In-process subscriber: encoded messages land on a queue.Queue."""
+
+    def __init__(self):
+        self.queue = queue.Queue()
+
+    def send(self, data):
+        self.queue.put(data)
+
+
+class SocketTransport:
+    """
+    Subscriber on a stream socket: newline-delimited JSON messages.
+
+    send() runs on the game thread under StateSync.lock, so it only queues
+    the message; this subscriber's own writer thread does the blocking
+    sendall. A client that falls max_queued messages behind (or whose
+    socket fails) is closed, and send() raises OSError so StateSync drops it.
+    """
+
+    def __init__(self, sock, max_queued=SOCKET_QUEUE_SIZE):
+        self.sock = sock
+        self.queue = queue.Queue(max_queued)
+        self.closed = False
+        self.thread = threading.Thread(target=self._write_loop, name="sync-socket", daemon=True)
+        self.thread.start()
+
+    def send(self, data):
+        if self.closed:
+            raise OSError("subscriber disconnected")
+        try:
+            self.queue.put_nowait(data + b"\n")
+        except queue.Full:
+            self.close()
+            raise OSError("subscriber fell behind") from None
+
+    def close(self, flush=False, timeout=5.0):
+        """
+        Stop sending and end the stream. With flush, messages already queued
+        go out first (waiting up to `timeout` seconds); otherwise they are
+        dropped and the socket is shut down at once.
+        """
+        if not flush:
+            while True:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    break
+        self.closed = True
+        try:
+            self.queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        if flush:
+            self.thread.join(timeout)
+        try:
+            self.sock.shutdown(socket.SHUT_WR if flush else socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def _write_loop(self):
+        while True:
+            data = self.queue.get()
+            if data is None:
+                break
+            try:
+                self.sock.sendall(data)
+            except OSError:
+                break
+        self.closed = True
+
+
+# ---------------------------
+# Publisher
+# ---------------------------
+class StateSync:
+    """
+    Versioned, delta-based mirror of a GameLogic's public state.
+
+    Attach it with GameLogic.add_listener(sync.on_game_event). Every change
+    becomes one small delta message [version, op, ...] which is encoded
+    once and handed to every subscribed transport. New subscribers get a
+    full snapshot first; clients that miss deltas can call deltas_since()
+    or fall back to snapshot().
+    """
+
+    def __init__(self, log_size=DELTA_LOG_SIZE, checkpoint_interval=CHECKPOINT_INTERVAL):
+        self.version = 0
+        self.state = empty_state()
+        self.log = deque(maxlen=log_size)          # (version, delta)
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoints = deque(maxlen=max(1, log_size // checkpoint_interval) + 1)
+        self.checkpoints.append((0, copy.deepcopy(self.state)))
+        self.subscribers = []
+        self.lock = threading.RLock()
+
+    # ----------------------------------------------------------------
+    #                          SUBSCRIBERS
+    # ----------------------------------------------------------------
+    def subscribe(self, transport):
+        with self.lock:
+            transport.send(self.snapshot_message())
+            self.subscribers.append(transport)
+        return transport
+
+    def unsubscribe(self, transport):
+        with self.lock:
+            if transport in self.subscribers:
+                self.subscribers.remove(transport)
+
+    # ----------------------------------------------------------------
+    #                          PUBLISHING
+    # ----------------------------------------------------------------
+    def publish(self, *delta):
+        """Apply a delta locally, log it and fan it out to all subscribers."""
+        with self.lock:
+            self.version += 1
+            apply_delta(self.state, delta)
+            self.log.append((self.version, delta))
+            if self.version % self.checkpoint_interval == 0:
+                self.checkpoints.append((self.version, copy.deepcopy(self.state)))
+
+            data = _encode([self.version, *delta])
+            for transport in list(self.subscribers):
+                try:
+                    transport.send(data)
+                except OSError:
+                    self.subscribers.remove(transport)
+        return self.version
+
+    def set_extra(self, key, value):
+        if self.state["extra"].get(key) != value:
+            self.publish(OP_EXTRA, key, value)
+
+    def on_game_event(self, event, *args):
+        """GameLogic listener: translate game events into deltas."""
+        if event == "session":
+            self.publish(OP_SESSION, args[0])
+        elif event == "teams":
+            self.publish(OP_TEAMS, [[t["team_id"], t["team_name"]] for t in args[0]])
+        elif event == "scores":
+            self.publish(OP_SCORES, {str(k): v for k, v in args[0].items()})
+        elif event == "score":
+            self.publish(OP_SCORE, args[0], args[1])
+        elif event == "turn":
+            if self.state["turn"] != args[0]:
+                self.publish(OP_TURN, args[0])
+        elif event == "question":
+            self.publish(OP_QUESTION, public_question(args[0]))
+        elif event == "answered":
+            self.publish(OP_ANSWERED, args[0], 1 if args[1] else 0)
+
+    # ----------------------------------------------------------------
+    #                          CATCH-UP
+    # ----------------------------------------------------------------
+    def snapshot_message(self):
+        with self.lock:
+            return _encode({"v": self.version, "state": self.state})
+
+    def deltas_since(self, version):
+        """
+        Encoded deltas after `version`, or None if they have fallen out of
+        the log (the client then needs a snapshot).
+        """
+        with self.lock:
+            if version == self.version:
+                return []
+            if not self.log or version < self.log[0][0] - 1 or version > self.version:
+                return None
+            return [_encode([v, *d]) for v, d in self.log if v > version]
+
+    def snapshot_at(self, version):
+        """
+        Rebuild the state as it was at `version` from the nearest checkpoint
+        and the delta log. Returns None if that version is no longer covered.
+        """
+        with self.lock:
+            base = None
+            for cp_version, cp_state in reversed(self.checkpoints):
+                if cp_version <= version:
+                    base = (cp_version, cp_state)
+                    break
+            if base is None or version > self.version:
+                return None
+            cp_version, cp_state = base
+            if cp_version < version and (not self.log or self.log[0][0] > cp_version + 1):
+                return None
+            state = copy.deepcopy(cp_state)
+            for v, delta in self.log:
+                if cp_version < v <= version:
+                    apply_delta(state, delta)
+            return {"v": version, "state": state}
+
+
+# ---------------------------
+# Client Mirror
+# ---------------------------
+class StateMirror:
+    """
+    Client-side copy of a StateSync state, fed with the encoded messages
+    a transport delivers.
+    """
+
+    def __init__(self):
+        self.version = None
+        self.state = None
+
+    def receive(self, data):
+        """
+        Apply one message. Returns False when a gap is detected; the caller
+        should then resync with deltas_since(self.version) or a snapshot.
+        """
+        message = json.loads(data) if isinstance(data, (bytes, str)) else data
+        if isinstance(message, dict):
+            self.version = message["v"]
+            self.state = message["state"]
+            return True
+        version = message[0]
+        if self.version is None or version <= self.version:
+            return self.version is not None
+        if version != self.version + 1:
+            return False
+        apply_delta(self.state, message[1:])
+        self.version = version
+        return True
@@ -0,0 +1,28 @@
+import os
+import sys
+
+import pytest
+
+# The game's modules live at the repository root; nothing draws on screen
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+@pytest.fixture
+def seeded_db(tmp_path):
+    """
+    seeded_db(questions, categories=4) -> (db, group_id): a fresh database
+    with one group of open-ended questions ("Category 0", "Category 1", ...).
+    """
+    from benchmarks.common import seed_benchmark_db
+
+    opened = []
+
+    def seed(questions=40, categories=4):
+        db, group_id = seed_benchmark_db(str(tmp_path / f"test{len(opened)}.db"), questions, categories)
+        opened.append(db)
+        return db, group_id
+
+    yield seed
+    for db in opened:
+        db.close()
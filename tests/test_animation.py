@@ -0,0 +1,59 @@
+import pytest
+
+from animation import Animator, Tween, ease_out_back, ease_out_cubic, linear, pulse
+
+
+@pytest.mark.parametrize("easing", [linear, ease_out_cubic, ease_out_back, pulse])
+def test_easings_run_from_zero(easing):
+    assert easing(0) == pytest.approx(0)
+    if easing is not pulse:
+        assert easing(1) == pytest.approx(1)
+
+
+def test_a_tween_ends_on_its_end_value():
+    tween = Tween(10, 50, 2.0, linear, started_at=5.0)
+    assert tween.value(4.0) == 10
+    assert tween.value(6.0) == pytest.approx(30)
+    assert not tween.finished(6.9)
+    assert tween.finished(7.0) and tween.value(7.0) == 50
+    assert tween.value(100.0) == 50
+
+
+def test_tweens_follow_the_clock_not_frames():
+    now = [0.0]
+    animator = Animator(clock=lambda: now[0])
+    animator.animate("score", 0, 100, 1.0, easing=linear)
+    assert animator.active
+    for t in (0.25, 0.5):
+        now[0] = t
+        animator.update()
+        assert animator.value("score", rect="r") == pytest.approx(t * 100)
+
+    now[0] = 1.0
+    animator.update()
+    # Finished: gone, but its rect is repainted once more at the end value
+    assert not animator.active and animator.value("score", 100) == 100
+    assert animator.dirty_rects() == ["r"]
+    animator.update()
+    assert animator.dirty_rects() == []
+
+
+def test_keep_does_not_restart_a_running_tween():
+    animator = Animator(clock=lambda: 0.0)
+    animator.keep("pulse", 0, 1, 1.0)
+    animator.update(0.5)
+    animator.keep("pulse", 0, 1, 1.0)
+    assert animator.tweens["pulse"].started_at == 0.0
+
+
+def test_a_repeating_tween_ends_when_it_is_no_longer_drawn():
+    animator = Animator(clock=lambda: 0.0)
+    animator.animate("clock", 0, 1, 0.5, easing=pulse, repeat=True)
+    for frame in range(1, 10):
+        animator.update(frame * 0.1)
+        animator.value("clock", rect="c")
+    assert animator.active
+    animator.update(1.0)  # drawn last frame
+    animator.update(1.1)  # not drawn since: the screen went away
+    assert not animator.active
+    assert animator.dirty_rects() == ["c"]
@@ -0,0 +1,22 @@
+import pygame
+import pytest
+
+from benchmarks.buzzer_fairness import run_fairness_harness
+
+
+@pytest.fixture
+def event_queue():
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.quit()
+
+
+@pytest.mark.parametrize("timestamps", [True, False], ids=["sdl-timestamps", "capture-time"])
+def test_earliest_press_wins(event_queue, timestamps):
+    results = run_fairness_harness(trials=200, timestamps=timestamps)
+    assert results["wrong_winners"] == 0
+    # Exact ties rotate to the team with the fewest wins
+    assert results["tie_winners"] == [1, 2, 3, 4, 1, 2, 3, 4]
+    # Keys pressed while disarmed are left for the main loop
+    assert results["swallowed_while_disarmed"] == 0
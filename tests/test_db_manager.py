@@ -0,0 +1,71 @@
+import sqlite3
+
+import pytest
+
+from benchmarks.db_torture import run_torture_test
+from benchmarks.team_setup import _fetch_teams_per_team
+from db_manager import with_retries
+from game_logic import GameLogic
+
+
+def test_no_write_is_lost_under_concurrent_writers():
+    result = run_torture_test(threads=6, ops_per_thread=60)
+    assert result["errors"] == []
+    assert result["writes"] > 0
+
+
+def test_busy_errors_are_retried_and_others_raised():
+    calls = []
+
+    def locked_twice():
+        calls.append(1)
+        if len(calls) < 3:
+            raise sqlite3.OperationalError("database is locked")
+        return "done"
+
+    assert with_retries(locked_twice, delay=0.001) == "done"
+    assert len(calls) == 3
+
+    def broken():
+        calls.append(1)
+        raise sqlite3.OperationalError("no such table: nope")
+
+    def always_locked():
+        calls.append(1)
+        raise sqlite3.OperationalError("database is locked")
+
+    for fn, retries, attempts in ((broken, 5, 1), (always_locked, 2, 3)):
+        calls.clear()
+        with pytest.raises(sqlite3.OperationalError):
+            with_retries(fn, retries=retries, delay=0.001)
+        assert len(calls) == attempts
+
+
+def test_teams_are_added_with_their_rosters_and_zero_scores(seeded_db):
+    db, group_id = seeded_db(4)
+    session_id = db.create_new_session(30, group_id)
+    added = db.add_teams(session_id, ["Red", "Blue", "Green"], [["Ann", "Bo"], [], ["Cy"]])
+
+    assert [(t["team_name"], [p["player_name"] for p in t["players"]]) for t in added] == \
+        [("Red", ["Ann", "Bo"]), ("Blue", []), ("Green", ["Cy"])]
+    # The one-query read gives what one players query per team did
+    assert db.get_teams_for_session(session_id) == added == _fetch_teams_per_team(db, session_id)
+    assert db.get_session_state(session_id)["scores"] == {t["team_id"]: 0 for t in added}
+    assert db.add_teams(session_id, []) == []
+
+
+def test_setting_up_teams_again_adds_only_the_new_ones(seeded_db):
+    db, group_id = seeded_db(4)
+    logic = GameLogic(db)
+    session_id = logic.create_new_session(30, group_id)
+    logic.setup_teams(["Red", "Blue"], [["Ann"], ["Bo"]])
+    logic.setup_teams(["Green"])
+
+    assert [t["team_name"] for t in logic.teams] == ["Red", "Blue", "Green"]
+    assert logic.team_name(logic.teams[2]["team_id"]) == "Green"
+    assert logic.get_current_team_id() == logic.teams[0]["team_id"]
+    conn = db.create_connection()
+    rows = conn.execute("SELECT team_id, score FROM session_state WHERE session_id = ?;", (session_id,)).fetchall()
+    conn.close()
+    # One score row per team, not a second one for the teams already there
+    assert sorted(rows) == sorted((t["team_id"], 0) for t in logic.teams)
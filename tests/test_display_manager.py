@@ -0,0 +1,76 @@
+import pygame
+import pytest
+
+from display_manager import RESIZE_SETTLE_MS, DisplayManager
+
+
+@pytest.fixture
+def display():
+    pygame.display.init()
+    yield DisplayManager
+    pygame.display.quit()
+
+
+def test_fixed_resolution_scales_the_frame_into_the_window(display):
+    manager = display()
+    manager.update_display_size(1280, 720)
+    screen = manager.set_base_resolution(640, 360)
+    assert screen.get_size() == (640, 360)
+    assert (manager.current_width, manager.current_height) == (640, 360)
+    assert manager.frame_scale == 2 and manager.integer_scale
+    assert manager.frame_rect == pygame.Rect(0, 0, 1280, 720)
+    assert manager.map_pos((640, 360)) == (320, 180)
+
+    # A window of another shape is letterboxed, the frame centred
+    manager.update_display_size(1000, 720)
+    assert manager.frame_rect == pygame.Rect(0, 79, 1000, 562)
+    assert not manager.integer_scale
+    assert manager.map_pos((500, 79)) == (320, 0)
+    assert manager.screen.get_size() == (640, 360)
+
+
+def test_an_unchanged_frame_is_not_scaled_again(display, monkeypatch):
+    manager = display()
+    manager.update_display_size(1280, 720)
+    manager.set_base_resolution(640, 360)
+    scaled = []
+    monkeypatch.setattr(manager, "_scale_frame", lambda: scaled.append(1))
+
+    manager.screen.fill((0, 0, 255))
+    manager.present()
+    manager.present()
+    assert len(scaled) == 1
+    manager.screen.fill((255, 0, 0), pygame.Rect(10, 10, 5, 5))
+    manager.present()
+    assert len(scaled) == 2
+
+
+def test_the_window_shows_the_scaled_frame(display):
+    manager = display()
+    manager.update_display_size(1280, 720)
+    manager.set_base_resolution(640, 360)
+    manager.screen.fill((0, 0, 255))
+    manager.screen.fill((255, 0, 0), pygame.Rect(0, 0, 320, 180))
+    manager.present()
+    assert manager.window.get_at((639, 359))[:3] == (255, 0, 0)
+    assert manager.window.get_at((640, 360))[:3] == (0, 0, 255)
+
+
+def test_a_window_drag_creates_the_display_once(display):
+    manager = display()
+    manager.update_display_size(800, 600)
+    manager.set_mode_calls = 0
+    now = 0.0
+    for step in range(1, 31):
+        manager.request_resize(800 + step * 10, 600 + step * 5, now=now)
+        # Screens keep drawing at the old size while the drag goes on
+        assert manager.scaling and manager.screen.get_size() == (800, 600)
+        now += 0.016
+        assert not manager.settle_resize(now=now)
+    assert manager.set_mode_calls == 0
+
+    assert manager.settle_resize(now=now + RESIZE_SETTLE_MS / 1000)
+    assert manager.set_mode_calls == 1
+    assert (manager.current_width, manager.current_height) == (1100, 750)
+    assert not manager.scaling and manager.screen is manager.window
+    assert not manager.settle_resize(now=now + 1)
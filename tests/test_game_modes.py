@@ -0,0 +1,36 @@
+from collections import Counter
+
+import pytest
+
+from benchmarks.common import next_question
+from game_logic import GameLogic
+from game_modes import lightning_order
+from session_log import ANSWER
+
+
+@pytest.mark.parametrize("questions, teams", [(40, 4), (23, 4), (7, 3), (30, 7), (3, 4), (0, 2), (5, 0)])
+def test_lightning_order_gives_every_team_the_same_number_of_questions(questions, teams):
+    order = lightning_order(questions, teams, streak=5)
+    counts = Counter(order)
+    assert len(set(counts.values())) <= 1
+    assert len(order) <= questions
+    # Only fewer than one question per team is ever left over
+    assert questions - len(order) < max(teams, 1)
+    # Teams take whole streaks in roster order
+    runs = [team for i, team in enumerate(order) if i == 0 or order[i - 1] != team]
+    assert runs == [i % max(teams, 1) for i in range(len(runs))]
+
+
+def test_a_lightning_game_plays_the_same_streaks_for_every_team(seeded_db):
+    db, group_id = seeded_db(23)
+    logic = GameLogic(db)
+    session_id = logic.create_new_session(30, group_id, "lightning")
+    logic.setup_teams(["A", "B", "C", "D"])
+    while (question := next_question(logic)) is not None:
+        logic.mark_answer(question["id"], True, question["points"])
+    logic.flush_answers()
+
+    answers = [payload["team_id"] for _, event_type, payload in db.get_session_events(session_id)
+               if event_type == ANSWER]
+    assert sorted(Counter(answers).values()) == [5, 5, 5, 5]
+    assert all(len(set(answers[i:i + 5])) == 1 for i in range(0, 20, 5))
@@ -0,0 +1,58 @@
+import pytest
+
+from game_logic import GameLogic
+
+
+def _play(db, group_id, mode, options=None, prefetch=False):
+    """Play a whole game, prefetching while each answer's feedback would show. Returns the ids in play order."""
+    logic = GameLogic(db)
+    logic.create_new_session(30, group_id, mode, options)
+    logic.setup_teams(["Red", "Blue"])
+    played = []
+    while logic.questions_left():
+        question = logic.begin_game_loop()
+        if question is None:
+            break
+        played.append(question["id"])
+        logic.mark_answer(question["id"], True, question["points"])
+        if prefetch:
+            logic.prefetch_question()
+    logic.flush_answers()
+    return logic, played
+
+
+@pytest.mark.parametrize("mode, options", [("random", None), ("lightning", None), ("random", {"category_mix": True})])
+def test_prefetching_plays_every_question_once(seeded_db, mode, options):
+    db, group_id = seeded_db(24)
+    _, expected = _play(db, group_id, mode, options)
+    logic, played = _play(db, group_id, mode, options, prefetch=True)
+    # Sessions are seeded by their id, so the order differs; every question is played once either way
+    assert sorted(played) == sorted(expected)
+    assert len(set(played)) == len(played)
+    assert logic.prefetched is None and not logic.questions_left()
+
+
+def test_the_last_prefetched_question_still_counts_as_left(seeded_db):
+    db, group_id = seeded_db(3)
+    logic = GameLogic(db)
+    logic.create_new_session(30, group_id, "random")
+    logic.setup_teams(["Red"])
+    for _ in range(2):
+        question = logic.begin_game_loop()
+        logic.mark_answer(question["id"], True, question["points"])
+    last = logic.prefetch_question()
+    assert last is not None and not logic.mode.questions_left()
+    assert logic.questions_left()
+    assert logic.prefetch_question() is last
+    assert logic.begin_game_loop()["id"] == last["id"]
+    assert logic.prefetch_question() is None
+
+
+@pytest.mark.parametrize("mode, options", [("grid", None), ("random", {"adaptive": True})])
+def test_modes_that_draw_on_demand_are_not_prefetched(seeded_db, mode, options):
+    db, group_id = seeded_db(12)
+    logic = GameLogic(db)
+    logic.create_new_session(30, group_id, mode, options)
+    logic.setup_teams(["Red", "Blue"])
+    assert logic.prefetch_question() is None
+    assert logic.prefetched is None
@@ -0,0 +1,35 @@
+import sqlite3
+
+import pytest
+
+from benchmarks.question_memory import _build_dict_bank, _seed_rows
+from question_model import build_bank
+
+
+@pytest.fixture
+def rows():
+    conn = sqlite3.connect(":memory:")
+    _seed_rows(conn, 300, seed=0)
+    question_rows = conn.execute("SELECT * FROM questions ORDER BY category, id").fetchall()
+    option_rows = conn.execute("SELECT question_id, id, option_text, is_correct FROM question_options "
+                               "ORDER BY id").fetchall()
+    conn.close()
+    return question_rows, option_rows
+
+
+def test_question_objects_hold_what_the_dicts_did(rows):
+    compact = build_bank(*rows)
+    dicts = _build_dict_bank(*rows)
+    assert [q.to_dict() for q in compact] == dicts
+
+
+def test_questions_read_like_dicts(rows):
+    question = next(q for q in build_bank(*rows) if q.question_type == "multiple_choice")
+    assert question["points"] == question.points
+    assert question.get("options", [])[0]["text"] == question.options[0].text
+    assert question.get("missing", "default") == "default"
+    with pytest.raises(KeyError):
+        question["missing"]
+    # Shared strings are interned, so a bank keeps one copy of each
+    other = next(q for q in build_bank(*rows) if q.category == question.category and q.id != question.id)
+    assert other.category is question.category
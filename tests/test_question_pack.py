@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from benchmarks.packs import _synthetic_questions
+from question_pack import HEADER, PackFormatError, QuestionPack, compile_pack, write_pack
+
+ODD_QUESTIONS = [
+    {"id": 500, "question": "Ünïcode — ça va? 🎲", "fill_in_blank_text": "ça", "points": None,
+     "category": None, "question_type": "fill_in_blank", "options": [], "attempts": 3, "correct": 1},
+    {"id": -2, "question": "", "fill_in_blank_text": None, "points": 0,
+     "category": "Misc", "question_type": None, "options": [], "attempts": 0, "correct": 0},
+]
+
+
+def _expected(question):
+    """A written question as the pack reads it back (packs have no group id)."""
+    expected = dict(question, question_group_id=None)
+    expected["options"] = [dict(o, is_correct=bool(o["is_correct"])) for o in question["options"]]
+    return expected
+
+
+def test_questions_survive_a_round_trip(tmp_path):
+    questions = list(_synthetic_questions(200)) + ODD_QUESTIONS
+    path = tmp_path / "quiz.clynpack"
+    assert write_pack(path, random.Random(0).sample(questions, len(questions)), name="Quiz") == 202
+
+    with QuestionPack(path) as pack:
+        assert pack.name == "Quiz"
+        assert len(pack) == 202
+        assert pack.total_points == sum(q["points"] or 0 for q in questions)
+        assert pack.option_count == sum(len(q["options"]) for q in questions)
+        by_id = sorted(questions, key=lambda q: q["id"])
+        assert [q.to_dict() for q in pack] == [_expected(q) for q in by_id]
+        for question in questions:
+            assert pack.get(question["id"]).to_dict() == _expected(question)
+        assert pack.get(1000) is None
+
+
+def test_a_compiled_group_matches_the_database(seeded_db, tmp_path):
+    db, group_id = seeded_db(30)
+    path = tmp_path / "group.clynpack"
+    assert compile_pack(db, group_id, path) == 30
+    with QuestionPack(path) as pack:
+        assert pack.name == "Benchmark"
+        assert [q.to_dict() for q in pack] == [dict(q.to_dict(), question_group_id=None)
+                                               for q in sorted(db.get_question_bank(group_id), key=lambda q: q.id)]
+
+
+def test_session_bank_leaves_out_answered_questions(tmp_path):
+    path = tmp_path / "quiz.clynpack"
+    write_pack(path, _synthetic_questions(50))
+    with QuestionPack(path) as pack:
+        bank = pack.session_bank(answered_ids={1, 2, 3})
+        assert len(bank) == 47
+        assert 2 not in bank and 4 in bank
+        assert bank.points_left == pack.total_points - sum(pack.points_of(q_id) for q_id in (1, 2, 3))
+        assert [q.id for q in bank] == list(range(4, 51))
+        assert bank.pop(4).id == 4
+        assert 4 not in bank and bank.get(4) is None
+
+        order = bank.shuffled(random.Random(0))
+        drawn = [order.pop() for _ in range(len(order))]
+        # Every id once, answered ones included (callers skip those)
+        assert sorted(drawn) == list(range(1, 51))
+        assert drawn != sorted(drawn)
+
+
+@pytest.mark.parametrize("damage", ["empty", "header only", "cut short", "not a pack"])
+def test_damaged_files_are_rejected(tmp_path, damage):
+    path = tmp_path / "quiz.clynpack"
+    write_pack(path, _synthetic_questions(20), name="Quiz")
+    data = path.read_bytes()
+    path.write_bytes({
+        "empty": b"",
+        "header only": data[:HEADER.size],
+        "cut short": data[:len(data) // 2],
+        "not a pack": b"SQLite format 3\0" + data[16:],
+    }[damage])
+    with pytest.raises(PackFormatError):
+        QuestionPack(path)
@@ -0,0 +1,108 @@
+import itertools
+import random
+
+from question_sampler import AdaptiveSelector, CategoryDecks, FenwickSampler
+
+
+def _linear_find(weights, target):
+    for index, upto in enumerate(itertools.accumulate(weights)):
+        if target < upto:
+            return index
+    return len(weights) - 1
+
+
+def test_find_matches_a_linear_scan_of_cumulative_weights():
+    rng = random.Random(0)
+    for n in (1, 2, 7, 64, 100):
+        weights = [rng.choice((0.0, 0.5, 1.0, 3.0)) for _ in range(n)]
+        sampler = FenwickSampler(weights)
+        for _ in range(5):
+            index = rng.randrange(n)
+            weights[index] = rng.choice((0.0, 2.0))
+            sampler.update(index, weights[index])
+        assert abs(sampler.total - sum(weights)) < 1e-9
+        for _ in range(200):
+            target = rng.random() * sampler.total
+            assert sampler.find(target) == _linear_find(weights, target)
+
+
+def test_samples_follow_the_weights_and_skip_emptied_slots():
+    rng = random.Random(1)
+    sampler = FenwickSampler([1.0, 2.0, 3.0, 4.0, 5.0])
+    sampler.update(4, 0.0)
+    counts = [0] * 5
+    for _ in range(40_000):
+        counts[sampler.sample(rng)] += 1
+    assert counts[4] == 0
+    for count, weight in zip(counts, (1, 2, 3, 4)):
+        assert abs(count / 40_000 - weight / 10) < 0.01
+
+    for index in range(4):
+        sampler.update(index, 0.0)
+    assert sampler.sample(rng) is None
+
+
+def _bank(questions=500, seed=0):
+    rng = random.Random(seed)
+    bank = []
+    for q_id in range(questions):
+        attempts = rng.randint(0, 20)
+        bank.append((q_id, 10, attempts, rng.randint(0, attempts)))
+    return bank
+
+
+def test_selector_draws_every_question_once():
+    selector = AdaptiveSelector(_bank(), seed=0)
+    drawn = [selector.draw(0.2 + 0.6 * (i % 2)) for i in range(500)]
+    assert sorted(drawn) == list(range(500))
+    assert selector.draw(0.5) is None
+    assert selector.remaining_points == 0
+
+
+def test_selector_leans_towards_the_target_rate():
+    bank = _bank()
+    rates = {q_id: (correct + 1) / (attempts + 2) for q_id, _, attempts, correct in bank}
+
+    def mean_rate(target):
+        selector = AdaptiveSelector(bank, seed=0)
+        return sum(rates[selector.draw(target)] for _ in range(50)) / 50
+
+    assert mean_rate(0.1) < 0.4 < 0.6 < mean_rate(0.9)
+
+
+def _categories():
+    return {f"Category {c}": [c * 100 + i for i in range(12)] for c in range(3)}
+
+
+def test_rounds_take_their_quota_from_each_category():
+    rounds = [{"name": "One", "quota": {"Category 0": 2, "Category 1": 3}},
+              {"name": "Two", "quota": {"Category 2": 4, "Missing": 5}}]
+    decks = CategoryDecks(_categories(), rounds, seed=3)
+    played = {}
+    while (q_id := decks.draw()) is not None:
+        played.setdefault(decks.current_round_name(), []).append(q_id // 100)
+    assert sorted(played["One"]) == [0, 0, 1, 1, 1]
+    assert played["Two"] == [2, 2, 2, 2]
+
+
+def test_a_mix_spreads_every_category_evenly():
+    decks = CategoryDecks(_categories(), seed=5)
+    order = []
+    while (q_id := decks.draw()) is not None:
+        order.append(q_id // 100)
+    assert len(order) == 36
+    # Stratified: each third of the game holds four questions of every category
+    for start in range(0, 36, 12):
+        assert sorted(order[start:start + 12]) == [0] * 4 + [1] * 4 + [2] * 4
+
+
+def test_consuming_answered_questions_resumes_the_same_schedule():
+    rounds = [{"name": "One", "quota": {"Category 0": 3, "Category 1": 3}},
+              {"name": "Two", "quota": {"Category 2": 3}}]
+    played = CategoryDecks(_categories(), rounds, seed=7)
+    answered = [played.draw() for _ in range(7)]
+
+    resumed = CategoryDecks(_categories(), rounds, seed=7)
+    resumed.consume(answered)
+    assert resumed.current_round_name() == played.current_round_name() == "Two"
+    assert resumed.order == played.order
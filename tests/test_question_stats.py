@@ -0,0 +1,33 @@
+from game_logic import GameLogic
+from session_log import ANSWER
+
+
+def _stats(db):
+    conn = db.create_connection()
+    rows = conn.execute("SELECT question_id, attempts, correct FROM question_stats ORDER BY question_id;").fetchall()
+    conn.close()
+    return rows
+
+
+def test_incremental_stats_match_a_rebuild_after_a_crash_and_resume(seeded_db):
+    db, group_id = seeded_db(20)
+    for game in range(2):
+        logic = GameLogic(db)
+        session_id = logic.create_new_session(30, group_id, "random")
+        logic.setup_teams(["Red", "Blue"])
+        for i in range(6):
+            question = logic.begin_game_loop()
+            logic.mark_answer(question["id"], (i + game) % 3 != 0, question["points"])
+
+        # The crash: the answer reached the log but not session_questions
+        lost = logic.begin_game_loop()
+        db.append_session_event(session_id, logic.log.seq + 1, ANSWER, {
+            "question_id": lost["id"], "team_id": logic.get_current_team_id(),
+            "was_correct": True, "points": lost["points"],
+        })
+        GameLogic(db).load_session(session_id)
+
+    counted = _stats(db)
+    assert sum(attempts for _, attempts, _ in counted) == 14
+    db.rebuild_question_stats()
+    assert _stats(db) == counted
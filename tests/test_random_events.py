@@ -0,0 +1,47 @@
+import numpy as np
+
+from game_logic import GameLogic
+from random_events import RandomEventEngine
+
+
+def test_events_never_take_a_score_below_zero():
+    engine = RandomEventEngine(seed=1, event_rate=1.0)
+    rng = np.random.default_rng(1)
+    scores = rng.integers(0, 40, size=(20_000, 4))
+    team_index, delta = engine.roll(scores, rng.integers(10, 200, size=20_000), 3)
+
+    hit = team_index >= 0
+    assert hit.mean() > 0.5
+    assert (delta[~hit] == 0).all()
+    assert (scores[hit, team_index[hit]] + delta[hit] >= 0).all()
+
+
+def test_the_leader_mostly_gets_bad_luck():
+    engine = RandomEventEngine(seed=0)
+    _, p_positive, _ = engine.probabilities([[50, 30, 20, 10]], [100], [8])
+    assert p_positive[0, 0] < 0.5 < p_positive[0, -1]
+    assert list(p_positive[0]) == sorted(p_positive[0])
+
+
+def test_a_resumed_session_keeps_its_random_events(seeded_db):
+    db, group_id = seeded_db(20)
+    logic = GameLogic(db)
+    session_id = logic.create_new_session(30, group_id, "random", {"random_events": True, "event_rate": 1.0})
+    logic.setup_teams(["Red", "Blue"])
+    for _ in range(3):
+        question = logic.begin_game_loop()
+        logic.mark_answer(question["id"], True, question["points"])
+    assert logic.random_events is not None
+
+    resumed = GameLogic(db)
+    resumed.load_session(session_id)
+    assert resumed.random_events is not None
+    assert resumed.random_events.event_rate == 1.0
+
+    before = resumed.get_scores()
+    event = resumed.roll_random_event()
+    assert event is not None
+    assert resumed.get_scores()[event["team_id"]] == before[event["team_id"]] + event["delta"]
+    # Events are undone like any other score change
+    resumed.undo_last_score()
+    assert resumed.get_scores() == before
@@ -0,0 +1,85 @@
+import asyncio
+import base64
+import json
+import secrets
+
+import pytest
+
+from remote_server import RemoteServer, OP_TEXT, encode_frame, read_message
+
+
+@pytest.fixture
+def server():
+    server = RemoteServer(host="127.0.0.1", port=0).start()
+    yield server
+    server.stop()
+
+
+async def _connect(port):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    key = base64.b64encode(secrets.token_bytes(16)).decode("ascii")
+    writer.write(
+        "GET /ws HTTP/1.1\r\n"
+        f"Host: 127.0.0.1:{port}\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Key: {key}\r\n"
+        "Sec-WebSocket-Version: 13\r\n\r\n".encode("latin-1")
+    )
+    await writer.drain()
+    await reader.readuntil(b"\r\n\r\n")
+    return reader, writer
+
+
+async def _ask(reader, writer, command, server=None, handler=None):
+    """Send one command and return its reply, applying queued commands like the game loop."""
+    writer.write(encode_frame(json.dumps(command), mask=True))
+    await writer.drain()
+    while True:
+        if server is not None:
+            server.process_commands(handler)
+        try:
+            opcode, data = await asyncio.wait_for(read_message(reader), 0.05)
+        except asyncio.TimeoutError:
+            continue
+        if opcode == OP_TEXT:
+            message = json.loads(data)
+            if message.get("id") == command["id"]:
+                return message
+
+
+def test_phone_answers_only_for_the_team_it_joined(server):
+    received = []
+
+    def handler(command):
+        received.append(command)
+        return {"ok": True}
+
+    async def play():
+        reader, writer = await _connect(server.port)
+        before_join = await _ask(reader, writer, {"type": "answer", "id": 1, "team_id": 2, "answer": "A"})
+        bad_code = await _ask(reader, writer, {"type": "join", "id": 2, "code": "nope"})
+        joined = await _ask(reader, writer, {"type": "join", "id": 3, "code": server.join_token(1)})
+        # A joined phone claiming another team still answers for its own
+        answered = await _ask(reader, writer, {"type": "answer", "id": 4, "team_id": 2, "answer": "A"},
+                              server, handler)
+        writer.close()
+        return before_join, bad_code, joined, answered
+
+    before_join, bad_code, joined, answered = asyncio.run(play())
+    assert before_join["ok"] is False
+    assert bad_code["ok"] is False
+    assert joined == {"type": "joined", "team_id": 1, "id": 3}
+    assert answered["ok"] is True
+    assert [c["team_id"] for c in received] == [1]
+
+
+def test_host_commands_need_the_host_token(server):
+    async def send_forged_mark():
+        reader, writer = await _connect(server.port)
+        forged = await _ask(reader, writer, {"type": "mark", "id": 1, "token": "guess", "correct": True})
+        writer.close()
+        return forged
+
+    assert asyncio.run(send_forged_mark()) == {"type": "result", "ok": False, "error": "not host", "id": 1}
+    assert server.commands.empty()
@@ -0,0 +1,80 @@
+import pygame
+import pytest
+
+from responsive_layout import ELLIPSIS, SHADOW_OFFSET, ButtonSkins, TextCache, adjust_color, wrap_text
+
+TEXT = ("Which planet in our solar system has the most moons, counting only the ones "
+        "confirmed by the International Astronomical Union as of this year?")
+
+
+@pytest.fixture(scope="module")
+def cache():
+    pygame.font.init()
+    yield TextCache()
+    pygame.font.quit()
+
+
+@pytest.mark.parametrize("balanced", [False, True], ids=["greedy", "balanced"])
+@pytest.mark.parametrize("width", [60, 150, 400])
+def test_wrapped_lines_fit_and_keep_every_word(cache, width, balanced):
+    font = cache.font(24)
+    lines = wrap_text(font, TEXT, width, balanced)
+    # Words are measured one by one, so a whole line can render a pixel wider (rounding)
+    assert all(font.size(line)[0] <= width + 1 for line in lines)
+    # Words too long for a line are split, never dropped
+    assert "".join(lines).replace(" ", "") == TEXT.replace(" ", "")
+
+
+def test_balanced_lines_are_evener_than_greedy(cache):
+    font = cache.font(24)
+    greedy = wrap_text(font, TEXT, 260)
+    balanced = wrap_text(font, TEXT, 260, balanced=True)
+    assert len(balanced) == len(greedy)
+
+    def ragged(lines):
+        return max(font.size(line)[0] for line in lines[:-1]) - min(font.size(line)[0] for line in lines[:-1])
+    assert ragged(balanced) <= ragged(greedy)
+
+
+def test_newlines_and_long_words(cache):
+    font = cache.font(24)
+    assert wrap_text(font, "one\n\ntwo", 500) == ("one", "", "two")
+    pieces = wrap_text(font, "Pneumonoultramicroscopicsilicovolcanoconiosis", 80)
+    assert len(pieces) > 1 and "".join(pieces) == "Pneumonoultramicroscopicsilicovolcanoconiosis"
+    assert all(font.size(piece)[0] <= 80 for piece in pieces)
+
+
+def test_fit_picks_the_largest_size_that_fits(cache):
+    width, height = 300, 90
+    size, lines = cache.fit(TEXT, 48, width, height)
+    assert len(lines) * cache.font(size).get_linesize() <= height
+    bigger = wrap_text(cache.font(size + 1), TEXT, width)
+    assert len(bigger) * cache.font(size + 1).get_linesize() > height
+    # Memoized: the same layout comes back without being worked out again
+    assert cache.fit(TEXT, 48, width, height) is cache.layouts[("fit", TEXT, 48, width, height, 10, False)]
+
+
+def test_text_that_never_fits_is_cut_with_an_ellipsis(cache):
+    size, lines = cache.fit(TEXT, 24, 120, 30, min_size=20)
+    assert size == 20
+    assert len(lines) * cache.font(size).get_linesize() <= 30
+    assert lines[-1].endswith(ELLIPSIS)
+    assert cache.font(size).size(lines[-1])[0] <= 120
+
+
+def test_button_skins_are_drawn_once_per_size_color_and_state():
+    skins = ButtonSkins(max_skins=3)
+    normal = skins.get(120, 40, (0, 0, 255), "normal")
+    assert skins.get(120, 40, [0, 0, 255], "normal") is normal
+    assert normal.get_size() == (120, 40 + SHADOW_OFFSET)
+    # Body in the middle, see-through rounded corners
+    assert normal.get_at((60, 20))[:3] == (0, 0, 255)
+    assert normal.get_at((0, 40 + SHADOW_OFFSET - 1))[:3] == normal.get_colorkey()[:3]
+
+    pressed = skins.get(120, 40, (0, 0, 255), "pressed")
+    assert pressed is not normal
+    assert pressed.get_at((60, 20))[:3] == adjust_color((0, 0, 255), -50)
+    skins.get(120, 40, (0, 0, 255), "hover")
+    skins.get(80, 40, (0, 0, 255), "normal")
+    assert len(skins.skins) == 3
+    assert skins.get(120, 40, (0, 0, 255), "normal") is not normal  # the oldest was dropped
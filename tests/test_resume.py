@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from benchmarks.common import next_question
+from game_logic import GameLogic
+from game_modes import MODES
+from session_log import ANSWER
+
+# seeded_db names its categories "Category 0".."Category 3"
+ROUNDS = [
+    {"name": "One", "quota": {"Category 0": 2, "Category 1": 2}},
+    {"name": "Two", "quota": {"Category 2": 3, "Category 3": 3}},
+]
+
+VARIANTS = [(name, {}) for name in MODES] + [
+    ("random", {"rounds": ROUNDS}),
+    ("lightning", {"category_mix": True}),
+    ("random", {"random_events": True}),
+]
+
+
+def _crash_after_answer(db, group_id, mode, options, teams=2, seed=0):
+    """
+    Answer a few questions, then "crash" right after an ANSWER event
+    reached the log but before its session_questions row was marked.
+    Returns the game as it was and the lost question.
+    """
+    rng = random.Random(seed)
+    logic = GameLogic(db)
+    session_id = logic.create_new_session(30, group_id, mode, options)
+    logic.setup_teams([f"Team {i + 1}" for i in range(teams)])
+    for _ in range(3):
+        question = next_question(logic)
+        logic.mark_answer(question["id"], rng.random() < 0.5, question["points"])
+    logic.flush_answers()
+
+    lost = next_question(logic)
+    db.append_session_event(session_id, logic.log.seq + 1, ANSWER, {
+        "question_id": lost["id"], "team_id": logic.get_current_team_id(),
+        "was_correct": True, "points": lost["points"],
+    })
+    return logic, lost
+
+
+def _play_out(logic):
+    """Answer everything left; returns [(question_id, round name)] in draw order."""
+    drawn = []
+    while (question := next_question(logic)) is not None:
+        drawn.append((question["id"], logic.current_round_name()))
+        logic.mark_answer(question["id"], True, question["points"])
+    return drawn
+
+
+@pytest.mark.parametrize("mode, options", VARIANTS,
+                         ids=[name + "".join(f"+{o}" for o in options) for name, options in VARIANTS])
+def test_resume_after_a_crash_continues_the_same_game(seeded_db, mode, options):
+    # 40 questions: more than fit on a grid board
+    db, group_id = seeded_db(40)
+    logic, lost = _crash_after_answer(db, group_id, mode, options)
+    team_id = logic.get_current_team_id()
+    expected_score = logic.scores[team_id] + lost["points"]
+    expected_left = logic.mode.remaining_points()[0]
+    board = logic.mode.tiles() if logic.mode.picks_questions else None
+    decks = getattr(logic.mode, "decks", None)
+    expected_order = [(q_id, decks.round_names[r_idx]) for q_id, r_idx in reversed(decks.order)] \
+        if decks else None
+
+    resumed = GameLogic(db)
+    resumed.load_session(logic.current_session_id)
+    assert resumed.scores[team_id] == expected_score
+    assert (resumed.random_events is not None) == bool(options.get("random_events"))
+    if board is not None:
+        # The same board, with the tile answered just before the crash closed
+        assert resumed.mode.tiles() == board
+
+    drawn = _play_out(resumed)
+    assert lost["id"] not in [q_id for q_id, _ in drawn]
+    assert len(drawn) == expected_left
+    if expected_order is not None:
+        # Category decks draw, round by round, what the uninterrupted game would have
+        assert drawn == expected_order
@@ -0,0 +1,58 @@
+import random
+
+from session_log import (ANSWER, REDO, SCORE_ADJUST, TEAMS, TURN, UNDO, SessionLog, apply_event,
+                         empty_state)
+
+
+def _play(log, events=60, seed=0):
+    """Append a mix of answers, adjustments, turns and undo/redo to a log."""
+    rng = random.Random(seed)
+    log.append(TEAMS, {"teams": [[1, "Red"], [2, "Blue"]]})
+    for i in range(events):
+        team_id = 1 + i % 2
+        roll = rng.random()
+        if roll < 0.5:
+            log.append(ANSWER, {"question_id": i, "team_id": team_id, "was_correct": roll < 0.3,
+                                "points": 10, "penalty": 5})
+            log.append(TURN, {"team_id": 3 - team_id})
+        elif roll < 0.7:
+            log.append(SCORE_ADJUST, {"team_id": team_id, "delta": rng.randint(-5, 5) or 1, "reason": "manual"})
+        elif roll < 0.85 and log.last_scoring_action():
+            seq, t_id, delta = log.last_scoring_action()
+            log.append(UNDO, {"undone_seq": seq, "team_id": t_id, "delta": -delta})
+        elif log.last_undone_action():
+            undone_seq, t_id, delta = log.last_undone_action()
+            log.append(REDO, {"redone_seq": undone_seq, "team_id": t_id, "delta": delta})
+
+
+def test_rebuild_from_snapshot_matches_the_live_state(seeded_db):
+    db, group_id = seeded_db(10)
+    session_id = db.create_session(30, group_id)
+    log = SessionLog(db, session_id, snapshot_interval=7)
+    _play(log)
+    assert log.snapshot_seq > 0
+
+    rebuilt = SessionLog.rebuild(db, session_id, snapshot_interval=7)
+    assert rebuilt.seq == log.seq
+    assert rebuilt.state == log.state
+
+    # The snapshot is only a shortcut: folding every event gives the same state
+    replayed = empty_state()
+    for seq, event_type, payload in db.get_session_events(session_id):
+        apply_event(replayed, seq, event_type, payload)
+    assert replayed == log.state
+
+
+def test_held_events_reach_the_db_only_when_taken(seeded_db):
+    db, group_id = seeded_db(10)
+    session_id = db.create_session(30, group_id)
+    log = SessionLog(db, session_id)
+    log.append(TEAMS, {"teams": [[1, "Red"]]})
+    log.hold()
+    log.append(ANSWER, {"question_id": 1, "team_id": 1, "was_correct": True, "points": 10})
+    assert log.state["scores"] == {"1": 10}
+    assert len(db.get_session_events(session_id)) == 1
+
+    held = log.take_held()
+    assert [seq for seq, _, _ in held] == [2]
+    assert not log.holding
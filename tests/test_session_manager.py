@@ -0,0 +1,45 @@
+import pytest
+
+from benchmarks.common import next_question
+from benchmarks.rooms import run_stress_test
+from session_manager import SessionManager
+from state_sync import StateSync
+
+
+def test_rooms_keep_their_own_state_and_the_sync_follows_the_active_one(seeded_db):
+    db, group_id = seeded_db(20)
+    manager = SessionManager(db)
+    sync = StateSync()
+    manager.add_listener(sync.on_game_event)
+
+    first = manager.create_room(30, group_id)
+    first.setup_teams(["Red", "Blue"])
+    second = manager.create_room(30, group_id)
+    second.setup_teams(["Green", "Gold"])
+    question = next_question(second)
+    second.mark_answer(question["id"], True, question["points"])
+
+    manager.switch_to(first.current_session_id)
+    assert set(first.get_scores().values()) == {0}
+    assert sync.state["session_id"] == first.current_session_id
+    assert sync.state["scores"] == {str(t_id): 0 for t_id in first.get_scores()}
+    # Answering in a room that is off screen does not reach the sync
+    question = next_question(second)
+    second.mark_answer(question["id"], True, question["points"])
+    assert str(question["id"]) not in sync.state["answered"]
+
+    manager.next_room()
+    assert sync.state["session_id"] == second.current_session_id
+    assert sync.state["scores"] == {str(t_id): score for t_id, score in second.get_scores().items()}
+    assert len(sync.state["answered"]) == 2
+    # Both rooms preloaded from one cached copy of the group
+    assert manager.questions.misses == 1
+    manager.close_all()
+    assert not manager.rooms
+
+
+@pytest.mark.parametrize("mode", ["random", "grid", "lightning"])
+def test_concurrent_rooms_record_every_answer(mode):
+    result = run_stress_test(sessions=8, questions=20, mode=mode)
+    assert result["answers"] == 8 * 20
+    assert result["lock_errors"] == 0
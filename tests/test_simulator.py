@@ -0,0 +1,13 @@
+import numpy as np
+import pytest
+
+from simulator import MODES, check_against_game_logic, make_config
+
+
+@pytest.mark.parametrize("events", [False, True], ids=["plain", "events"])
+@pytest.mark.parametrize("mode", MODES)
+def test_vectorized_win_rates_follow_the_game_rules(mode, events):
+    config = make_config([10, 20, 30, 40, 50] * 4, [0.7, 0.5, 0.5, 0.3], mode, events=events)
+    reference, fast = check_against_game_logic(config, games=400)
+    # 400 reference games: a standard error of about 2.5 points per rate
+    assert np.abs(reference - fast).max() < 0.08
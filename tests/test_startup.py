@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from startup import StartupProfile, Warmup
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_warmup_runs_tasks_in_order_and_marks_each():
+    ran = []
+    profile = StartupProfile()
+    job = Warmup([("one", lambda: ran.append(1)), ("two", lambda: ran.append(2))], profile).start()
+    assert job.wait(5)
+    assert ran == [1, 2]
+    assert [label for label, _ in profile.marks] == ["one", "two"]
+
+
+def test_warmup_hands_a_failure_to_the_waiting_thread():
+    ran = []
+
+    def fail():
+        raise ValueError("no database")
+
+    job = Warmup([("fails", fail), ("skipped", lambda: ran.append(1))], name="test-warmup").start()
+    with pytest.raises(ValueError, match="no database"):
+        job.wait(5)
+    assert job.done
+    assert ran == []
+
+
+def test_the_splash_frame_does_not_wait_for_game_modules():
+    # Importing the UI module must leave the DB, game rules and rooms to the warmup thread
+    heavy = ("db_manager", "game_logic", "game_modes", "session_manager", "state_sync", "question_pack")
+    code = f"import sys, pygame_main; print(','.join(m for m in {heavy!r} if m in sys.modules))"
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True,
+                         timeout=60)
+    assert out.returncode == 0, out.stderr
+    assert out.stdout.strip() == ""
@@ -0,0 +1,83 @@
+import copy
+import json
+
+from benchmarks.sync_broadcast import _synthetic_game
+from state_sync import QueueTransport, StateMirror, StateSync
+
+
+class _Recorder:
+    """Transport that remembers the publisher's state after every version."""
+
+    def __init__(self, sync):
+        self.sync = sync
+        self.states = {}
+
+    def send(self, data):
+        self.states[self.sync.version] = copy.deepcopy(self.sync.state)
+
+
+def _drain(transport, mirror):
+    while not transport.queue.empty():
+        assert mirror.receive(transport.queue.get_nowait())
+
+
+def test_mirror_rebuilds_the_publisher_state_from_deltas():
+    sync = StateSync()
+    late_sync = StateSync()
+    early = sync.subscribe(QueueTransport())
+    _synthetic_game(sync, questions=20)
+    late = sync.subscribe(QueueTransport())  # starts from a snapshot
+    _synthetic_game(late_sync, questions=20)
+
+    for transport in (early, late):
+        mirror = StateMirror()
+        _drain(transport, mirror)
+        assert mirror.version == sync.version
+        assert mirror.state == sync.state
+    # Same game, same state: deltas carry everything a snapshot does
+    assert late_sync.state == sync.state
+
+
+def test_mirror_detects_a_gap_and_catches_up():
+    sync = StateSync()
+    transport = sync.subscribe(QueueTransport())
+    _synthetic_game(sync, questions=10)
+
+    mirror = StateMirror()
+    messages = []
+    while not transport.queue.empty():
+        messages.append(transport.queue.get_nowait())
+    for data in messages[:30]:
+        assert mirror.receive(data)
+    assert not mirror.receive(messages[35])  # 31..34 were lost
+    assert mirror.receive(messages[29])  # an old delta is ignored
+
+    for data in sync.deltas_since(mirror.version):
+        assert mirror.receive(data)
+    assert mirror.version == sync.version
+    assert mirror.state == sync.state
+
+
+def test_deltas_past_the_log_need_a_snapshot():
+    sync = StateSync(log_size=16, checkpoint_interval=4)
+    _synthetic_game(sync, questions=10)
+    assert sync.deltas_since(0) is None
+    assert sync.deltas_since(sync.version - 5) is not None
+    assert sync.deltas_since(sync.version) == []
+
+    mirror = StateMirror()
+    assert mirror.receive(sync.snapshot_message())
+    assert mirror.state == json.loads(json.dumps(sync.state))
+
+
+def test_snapshot_at_matches_the_state_at_that_version():
+    sync = StateSync(log_size=64, checkpoint_interval=8)
+    recorder = sync.subscribe(_Recorder(sync))
+    _synthetic_game(sync, questions=30)
+
+    # Covered from the first checkpoint the delta log still reaches back to
+    first = min(v for v, _ in sync.checkpoints if v >= sync.log[0][0] - 1)
+    for version in range(first, sync.version + 1):
+        snapshot = sync.snapshot_at(version)
+        assert snapshot == {"v": version, "state": recorder.states[version]}
+    assert sync.snapshot_at(1) is None
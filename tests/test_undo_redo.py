@@ -0,0 +1,61 @@
+from game_logic import GameLogic
+
+
+def _game(db, group_id):
+    logic = GameLogic(db)
+    logic.create_new_session(30, group_id, "random")
+    logic.setup_teams(["Red", "Blue"])
+    return logic
+
+
+def _db_scores(logic):
+    return logic.db.get_session_state(logic.current_session_id)["scores"]
+
+
+def test_undo_and_redo_walk_back_and_forth_through_score_changes(seeded_db):
+    db, group_id = seeded_db(10)
+    logic = _game(db, group_id)
+    red, blue = (t["team_id"] for t in logic.teams)
+
+    question = logic.begin_game_loop()
+    logic.mark_answer(question["id"], True, question["points"])
+    logic.adjust_score(blue, 7)
+    logic.adjust_score(red, -3)
+    after = logic.get_scores()
+
+    assert logic.undo_last_score() == (red, 3)
+    assert logic.undo_last_score() == (blue, -7)
+    assert logic.get_scores() == {red: question["points"], blue: 0}
+    assert logic.redo_last_score() == (blue, 7)
+    assert logic.redo_last_score() == (red, -3)
+    assert not logic.can_redo()
+    assert logic.get_scores() == after
+    assert _db_scores(logic) == after
+
+    # A fresh scoring action drops whatever could still be redone
+    logic.undo_last_score()
+    logic.adjust_score(blue, 1)
+    assert not logic.can_redo()
+
+    while logic.can_undo():
+        logic.undo_last_score()
+    assert logic.get_scores() == {red: 0, blue: 0}
+    assert _db_scores(logic) == {red: 0, blue: 0}
+
+
+def test_undo_history_survives_a_resume(seeded_db):
+    db, group_id = seeded_db(10)
+    logic = _game(db, group_id)
+    red, blue = (t["team_id"] for t in logic.teams)
+    logic.adjust_score(red, 5)
+    logic.adjust_score(blue, 2)
+    logic.undo_last_score()
+
+    resumed = GameLogic(db)
+    resumed.load_session(logic.current_session_id)
+    assert resumed.get_scores() == {red: 5, blue: 0}
+    assert resumed.redo_last_score() == (blue, 2)
+    assert resumed.undo_last_score() == (blue, -2)
+    assert resumed.undo_last_score() == (red, -5)
+    assert not resumed.can_undo()
+    assert _db_scores(resumed) == {red: 0, blue: 0}